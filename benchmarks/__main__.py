@@ -0,0 +1,97 @@
+"""
+Run the benchmark suite and compare the results against the stored baseline.
+
+Usage:
+    python -m benchmarks                      run all benchmarks and compare them against benchmarks/baseline.json
+    python -m benchmarks --only world.update  only run the benchmarks whose name starts with world.update
+    python -m benchmarks --save-baseline      store the results as the new baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+from . import runner, suite
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(DIRECTORY, "baseline.json")
+RESULTS_PATH = os.path.join(DIRECTORY, "results.json")
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time the simulation hot paths and compare them against a baseline."
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        help="Only run benchmarks whose name starts with this prefix, can be given multiple times.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=None,
+        help="Override the number of repeats of every benchmark.",
+    )
+    parser.add_argument(
+        "--output", default=RESULTS_PATH, help="Where to write the results."
+    )
+    parser.add_argument(
+        "--baseline", default=BASELINE_PATH, help="The results to compare against."
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Also store the results as the new baseline.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Relative change of the median that is still considered unchanged.",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if any benchmark got slower than the tolerance allows.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+
+    benchmarks = [
+        benchmark
+        for benchmark in suite.benchmarks()
+        if not args.only or benchmark.name.startswith(tuple(args.only))
+    ]
+    results = runner.run_benchmarks(benchmarks, repeat=args.repeat)
+    runner.save(results, args.output)
+    print(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        runner.save(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --save-baseline to create one.")
+        return 0
+
+    comparison = runner.compare(results, runner.load(args.baseline), args.tolerance)
+    print()
+    print(runner.format_comparison(comparison))
+
+    regressions = [name for name, entry in comparison.items() if entry["status"] == "slower"]
+    if regressions and args.fail_on_regression:
+        print(f"\n{len(regressions)} benchmark(s) got slower: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+from typing import Callable
+
+import numpy as np
+import pygame
+
+
+class Benchmark:
+    """
+    Class representing a single timed operation of the simulation.
+
+    The setup is run before every repeat and is not timed. It prepares the state the operation needs and returns the
+    operation itself, which is then called `number` times in a row. Running the setup per repeat lets operations that
+    change the state (e.g. World.update) start every repeat from the same state.
+
+    Attributes:
+        name (str): The unique name of the benchmark, used as key in the result files.
+        setup (Callable[[], Callable[[], object]]): Prepares the state and returns the operation to time.
+        number (int): The number of calls per repeat.
+        repeat (int): The number of repeats.
+        description (str): A short description of what is measured.
+
+    Methods:
+        measure(repeat): Time the operation and return the statistics.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[], Callable[[], object]],
+        number: int = 1,
+        repeat: int = 5,
+        description: str = "",
+    ) -> None:
+        """
+        Initialize a Benchmark.
+
+        Parameters:
+            name (str): The unique name of the benchmark.
+            setup (Callable[[], Callable[[], object]]): Prepares the state and returns the operation to time.
+            number (int): The number of calls per repeat. Default is 1.
+            repeat (int): The number of repeats. Default is 5.
+            description (str): A short description of what is measured. Default is "".
+
+        Raises:
+            ValueError: If number or repeat is smaller than 1.
+
+        Returns:
+            None
+        """
+        if number < 1:
+            raise ValueError(f"Number of calls {number} needs to be at least 1.")
+        if repeat < 1:
+            raise ValueError(f"Number of repeats {repeat} needs to be at least 1.")
+
+        self.name: str = name
+        self.setup: Callable[[], Callable[[], object]] = setup
+        self.number: int = number
+        self.repeat: int = repeat
+        self.description: str = description
+
+    def measure(self, repeat: int | None = None) -> dict:
+        """
+        Time the operation.
+
+        Parameters:
+            repeat (int | None): Overrides the number of repeats if given. Default is None.
+
+        Returns:
+            dict: The seconds per call (min, median, mean and stdev over the repeats) and the number of calls and repeats.
+        """
+        repeat = repeat or self.repeat
+        timings = []
+        for _ in range(repeat):
+            operation = self.setup()
+            start = time.perf_counter()
+            for _ in range(self.number):
+                operation()
+            timings.append((time.perf_counter() - start) / self.number)
+
+        return {
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "mean": statistics.fmean(timings),
+            "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            "number": self.number,
+            "repeat": repeat,
+        }
+
+
+def run_benchmarks(
+    benchmarks: list[Benchmark],
+    repeat: int | None = None,
+    log: Callable[[str], None] | None = print,
+) -> dict:
+    """
+    Run the given benchmarks one after the other.
+
+    Parameters:
+        benchmarks (list[Benchmark]): The benchmarks to run.
+        repeat (int | None): Overrides the number of repeats of every benchmark if given. Default is None.
+        log (Callable[[str], None] | None): Called with a line for every finished benchmark. Default is print.
+
+    Returns:
+        dict: The results, containing the environment under "meta" and the statistics of every benchmark under
+            "results".
+    """
+    results = {}
+    for benchmark in benchmarks:
+        results[benchmark.name] = benchmark.measure(repeat)
+        if log:
+            median = format_seconds(results[benchmark.name]["median"])
+            log(f"{benchmark.name:<40} {median}")
+
+    return {"meta": environment(), "results": results}
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.2) -> dict:
+    """
+    Compare benchmark results against a baseline.
+
+    The medians are compared. A benchmark is reported as slower or faster if its median differs from the baseline by
+    more than the tolerance.
+
+    Parameters:
+        results (dict): The results to check, as returned by run_benchmarks.
+        baseline (dict): The results to compare against, as returned by run_benchmarks.
+        tolerance (float): The relative change that is still considered unchanged. Default is 0.2.
+
+    Raises:
+        ValueError: If the tolerance is negative.
+
+    Returns:
+        dict: For every benchmark in the results its median, the baseline median, the ratio between them and a status,
+            which is one of "faster", "slower", "unchanged" or "new".
+    """
+    if tolerance < 0:
+        raise ValueError(f"Tolerance {tolerance} cannot be negative.")
+
+    comparison = {}
+    for name, result in results["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            comparison[name] = {
+                "median": result["median"],
+                "baseline": None,
+                "ratio": None,
+                "status": "new",
+            }
+            continue
+
+        ratio = result["median"] / reference["median"]
+        if ratio > 1 + tolerance:
+            status = "slower"
+        elif ratio < 1 - tolerance:
+            status = "faster"
+        else:
+            status = "unchanged"
+        comparison[name] = {
+            "median": result["median"],
+            "baseline": reference["median"],
+            "ratio": ratio,
+            "status": status,
+        }
+    return comparison
+
+
+def format_comparison(comparison: dict) -> str:
+    """
+    Format a comparison as a table.
+
+    Parameters:
+        comparison (dict): The comparison as returned by compare.
+
+    Returns:
+        str: One line per benchmark with its median, the baseline median, the ratio and the status.
+    """
+    lines = [f"{'benchmark':<40} {'median':>10} {'baseline':>10} {'ratio':>7}  status"]
+    for name, entry in comparison.items():
+        baseline = format_seconds(entry["baseline"]) if entry["baseline"] else "-"
+        ratio = f"{entry['ratio']:.2f}x" if entry["ratio"] else "-"
+        median = format_seconds(entry["median"])
+        lines.append(
+            f"{name:<40} {median:>10} {baseline:>10} {ratio:>7}  {entry['status']}"
+        )
+    return "\n".join(lines)
+
+
+def format_seconds(seconds: float) -> str:
+    """
+    Format a duration with a fitting unit.
+
+    Parameters:
+        seconds (float): The duration in seconds.
+
+    Returns:
+        str: The formatted duration, e.g. "12.3ms".
+    """
+    for unit, factor in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:.1f}{unit}"
+    return f"{seconds / 1e-9:.1f}ns"
+
+
+def environment() -> dict:
+    """
+    Describe the environment the benchmarks run in, to be stored with the results.
+
+    Returns:
+        dict: The time, commit, platform and library versions.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pygame": pygame.version.ver,
+    }
+
+
+def load(path: str) -> dict:
+    """
+    Load benchmark results from a JSON file.
+
+    Parameters:
+        path (str): The path of the file.
+
+    Returns:
+        dict: The results.
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save(results: dict, path: str) -> None:
+    """
+    Save benchmark results to a JSON file.
+
+    Parameters:
+        results (dict): The results as returned by run_benchmarks.
+        path (str): The path of the file.
+
+    Returns:
+        None
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=4)
+        file.write("\n")
@@ -0,0 +1,263 @@
+"""
+The benchmarks of the simulation hot paths.
+
+Every benchmark runs on a fixed seed, so repeated runs measure the same terrain and the same populations.
+"""
+
+from __future__ import annotations
+
+import os
+
+# Never open a window, the drawing benchmarks render to an offscreen surface.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from src.entities.organism import Organism  # noqa: E402
+from src.helper.noise_function import NoiseFunction  # noqa: E402
+from src.settings import simulation  # noqa: E402
+from src.terrain.world import World  # noqa: E402
+
+from .runner import Benchmark  # noqa: E402
+
+SEED: int = 1234
+WORLD_SIZE: tuple[int, int] = (960, 1000)
+TILE_SIZE: int = 8
+POPULATIONS: tuple[int, ...] = (250, 1000, 4000)
+ANIMAL_SHARE: float = 0.2
+UPDATE_TICKS: int = 5
+
+_worlds: dict[bool, World] = {}
+
+
+def world(headless: bool = True) -> World:
+    """
+    Return the shared benchmark world, creating it on first use.
+
+    Parameters:
+        headless (bool): If False a world with surfaces is returned, which is needed for drawing. Default is True.
+
+    Returns:
+        World: The world, without any organisms.
+    """
+    if headless not in _worlds:
+        if not headless:
+            # The loading menu of a drawable world needs a display, with the dummy driver none is shown
+            pygame.init()
+            pygame.display.set_mode(WORLD_SIZE)
+        _worlds[headless] = create_world(headless)
+    simulation.reset_organisms()
+    return _worlds[headless]
+
+
+def create_world(headless: bool = True) -> World:
+    """
+    Create a new benchmark world.
+
+    Parameters:
+        headless (bool): If False the world is created with surfaces. Default is True.
+
+    Returns:
+        World: The created world.
+    """
+    rect = World.adjust_dimensions(pygame.Rect(0, 0, *WORLD_SIZE), TILE_SIZE)
+    return World(rect, TILE_SIZE, headless=headless, seed=SEED)
+
+
+def populate(target: World, organisms: int) -> None:
+    """
+    Remove all organisms and spawn a new population on a world.
+
+    Parameters:
+        target (World): The world to populate.
+        organisms (int): The number of organisms to spawn, ANIMAL_SHARE of them are animals.
+
+    Returns:
+        None
+    """
+    simulation.reset_organisms()
+    simulation.seed(SEED)
+    animals = int(organisms * ANIMAL_SHARE)
+    target.spawn_animals(animals)
+    target.spawn_plants(organisms - animals)
+
+
+# region setups
+def _setup_world_init():
+    simulation.reset_organisms()
+    return create_world
+
+
+def _setup_world_reload():
+    return world().reload
+
+
+def _setup_world_update(organisms: int):
+    def setup():
+        target = world()
+        populate(target, organisms)
+        return target.update
+
+    return setup
+
+
+def _setup_organism_update():
+    target = world()
+    populate(target, POPULATIONS[1])
+    Organism.births.clear()
+    store = simulation.organism_store
+    indices = iter(store.alive_indices().tolist())
+
+    def update():
+        # One call per organism, like a tick of World.update without the batched parts
+        index = next(indices)
+        if store.alive[index]:
+            store.views[index].update()
+
+    return update
+
+
+def _setup_organism_energy():
+    target = world()
+    simulation.seed(SEED)
+    target.spawn_animals(1)
+    animal = simulation.animals.sprites()[0]
+
+    def gain_energy():
+        # A full animal, so the energy overflows into health and both are clamped
+        animal.energy += 1
+
+    return gain_energy
+
+
+def _setup_dna():
+    target = world()
+    simulation.seed(SEED)
+    target.spawn_animals(1)
+    dna = simulation.animals.sprites()[0].dna
+
+    def copy_and_mutate():
+        dna.copy().mutate()
+
+    return copy_and_mutate
+
+
+def _setup_noise_weigh():
+    target = world()
+    x, y = target.cols / 2, target.rows / 2
+
+    def weigh():
+        NoiseFunction.weigh(
+            x, y, target.height_functions, target.height_functions_weights
+        )
+
+    return weigh
+
+
+def _setup_random_neighbor():
+    target = world()
+    tile = target.tile_grid[target.rows // 2][target.cols // 2]
+    return tile.get_random_neigbor
+
+
+def _setup_world_draw(full: bool, grid: bool = False):
+    def setup():
+        target = world(headless=False)
+        target.set_grid_rendering(grid)
+        surface = pygame.Surface(target.rect.size)
+        populate(target, POPULATIONS[1])
+        target.invalidate()
+        target.draw(surface)
+        target.update()
+
+        def draw():
+            if full:
+                target.invalidate()
+            target.draw(surface)
+
+        return draw
+
+    return setup
+
+
+# endregion
+
+
+def benchmarks() -> list[Benchmark]:
+    """
+    Return all benchmarks of the suite.
+
+    Returns:
+        list[Benchmark]: The benchmarks in the order they should be run.
+    """
+    suite = [
+        Benchmark(
+            "world.init",
+            _setup_world_init,
+            repeat=3,
+            description=f"Create a headless {WORLD_SIZE[0]}x{WORLD_SIZE[1]} world.",
+        ),
+        Benchmark(
+            "world.reload",
+            _setup_world_reload,
+            description="Regenerate the terrain of the world.",
+        ),
+    ]
+    for organisms in POPULATIONS:
+        suite.append(
+            Benchmark(
+                f"world.update.{organisms}",
+                _setup_world_update(organisms),
+                number=UPDATE_TICKS,
+                description=f"One tick with {organisms} organisms spawned.",
+            )
+        )
+    suite += [
+        Benchmark(
+            "organism.update",
+            _setup_organism_update,
+            number=POPULATIONS[1],
+            description=f"Update one organism, over one tick of {POPULATIONS[1]}.",
+        ),
+        Benchmark(
+            "organism.energy",
+            _setup_organism_energy,
+            number=10000,
+            description="Add energy to a full animal.",
+        ),
+        Benchmark(
+            "dna.copy_mutate",
+            _setup_dna,
+            number=1000,
+            description="Copy and mutate the DNA of an animal.",
+        ),
+        Benchmark(
+            "noise_function.weigh",
+            _setup_noise_weigh,
+            number=1000,
+            description="Weigh the height noise functions at one point.",
+        ),
+        Benchmark(
+            "tile.get_random_neigbor",
+            _setup_random_neighbor,
+            number=10000,
+            description="Pick a random neighbor of a tile.",
+        ),
+        Benchmark(
+            "world.draw.dirty",
+            _setup_world_draw(full=False),
+            description="Draw the changes of one tick on an offscreen surface.",
+        ),
+        Benchmark(
+            "world.draw.full",
+            _setup_world_draw(full=True),
+            description="Draw the whole world on an offscreen surface.",
+        ),
+        Benchmark(
+            "world.draw.grid",
+            _setup_world_draw(full=True, grid=True),
+            description="Draw the whole world as one scaled color grid.",
+        ),
+    ]
+    return suite
@@ -0,0 +1,199 @@
+"""
+Headless entry point for running the simulation without a display.
+
+Builds a World without any surfaces, menus or fonts, seeds it with animals and plants and runs a fixed number of
+World.update() ticks as fast as possible. At the end the achieved ticks per second and the population counts are reported.
+
+Usage:
+    python headless.py --ticks 1000 --animals 200 --plants 800 --seed 42
+    python headless.py --ticks 1000 --seed 42 --save data/checkpoint.bin
+    python headless.py --ticks 1000 --load data/checkpoint.bin
+    python headless.py --ticks 1000 --profile-phases 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+# Never open a window, even if a display happens to be available.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from src import checkpoint  # noqa: E402
+from src.settings import screen, simulation  # noqa: E402
+from src.terrain.world import World  # noqa: E402
+
+
+def create_world(
+    width: int, height: int, tile_size: int, seed: int | None = None
+) -> World:
+    """
+    Create a headless world with the given dimensions.
+
+    Parameters:
+        width (int): The width of the world in pixels.
+        height (int): The height of the world in pixels.
+        tile_size (int): The size of the tiles in pixels.
+        seed (int | None): The seed of the world. If None a random seed is used. Default is None.
+
+    Returns:
+        World: The created headless world.
+    """
+    rect = World.adjust_dimensions(pygame.Rect(0, 0, width, height), tile_size)
+    return World(rect, tile_size, headless=True, seed=seed)
+
+
+def run(
+    world: World, ticks: int, report_interval: int = 0, stop_when_extinct: bool = False
+) -> dict:
+    """
+    Run a number of ticks on a world and measure the throughput.
+
+    Parameters:
+        world (World): The world to update.
+        ticks (int): The number of ticks to run.
+        report_interval (int): If bigger than 0, print the progress every report_interval ticks. Default is 0.
+        stop_when_extinct (bool): If True, stop as soon as no organisms are left. Default is False.
+
+    Returns:
+        dict: A summary containing the ticks run, the elapsed time, the ticks per second and the population counts.
+    """
+    start = time.perf_counter()
+    ticks_run = 0
+    for _ in range(ticks):
+        world.update()
+        ticks_run += 1
+
+        if report_interval and ticks_run % report_interval == 0:
+            print(
+                f"tick {world.age}: {len(simulation.animals)} animals, {len(simulation.plants)} plants"
+            )
+        if stop_when_extinct and not simulation.organisms:
+            break
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ticks": ticks_run,
+        "seconds": elapsed,
+        "ticks_per_second": ticks_run / elapsed if elapsed > 0 else float("inf"),
+        "world_age": world.age,
+        "animals": len(simulation.animals),
+        "plants": len(simulation.plants),
+        "organisms": len(simulation.organisms),
+    }
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run the evolution simulation without a display."
+    )
+    parser.add_argument(
+        "--ticks", type=int, default=1000, help="Number of ticks to run."
+    )
+    parser.add_argument(
+        "--animals", type=int, default=100, help="Number of animals to spawn."
+    )
+    parser.add_argument(
+        "--plants", type=int, default=400, help="Number of plants to spawn."
+    )
+    parser.add_argument(
+        "--width",
+        type=int,
+        default=int(screen.SCREEN_WIDTH * 0.6),
+        help="World width in pixels.",
+    )
+    parser.add_argument(
+        "--height", type=int, default=screen.SCREEN_HEIGHT, help="World height in pixels."
+    )
+    parser.add_argument(
+        "--tile-size", type=int, default=screen.TILE_SIZE, help="Tile size in pixels."
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed of the world, runs with the same seed and options are identical.",
+    )
+    parser.add_argument(
+        "--load",
+        metavar="PATH",
+        default=None,
+        help="Continue from a checkpoint instead of creating a new world.",
+    )
+    parser.add_argument(
+        "--save",
+        metavar="PATH",
+        default=None,
+        help="Save a checkpoint of the world after the run.",
+    )
+    parser.add_argument(
+        "--profile-phases",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Time the phases of the organism updates and log them every N ticks (0 disables it).",
+    )
+    parser.add_argument(
+        "--report-interval",
+        type=int,
+        default=0,
+        help="Print the population every N ticks (0 disables it).",
+    )
+    parser.add_argument(
+        "--stop-when-extinct",
+        action="store_true",
+        help="Stop early once no organisms are left.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> dict:
+    args = _parse_args(argv)
+    if args.profile_phases:
+        simulation.profiler.interval = args.profile_phases
+        simulation.profiler.log = True
+        simulation.profiler.set_enabled(True)
+
+    setup_start = time.perf_counter()
+    if args.load:
+        world = checkpoint.load(args.load, headless=True)
+    else:
+        world = create_world(args.width, args.height, args.tile_size, seed=args.seed)
+        world.spawn_animals(args.animals)
+        world.spawn_plants(args.plants)
+    setup_seconds = time.perf_counter() - setup_start
+
+    print(
+        f"World {world.cols}x{world.rows} tiles with seed {world.seed} "
+        f"{'loaded at tick ' + str(world.age) if args.load else 'created'} in "
+        f"{setup_seconds:.2f}s "
+        f"with {len(simulation.animals)} animals and {len(simulation.plants)} plants."
+    )
+
+    summary = run(
+        world,
+        args.ticks,
+        report_interval=args.report_interval,
+        stop_when_extinct=args.stop_when_extinct,
+    )
+
+    print(
+        f"Ran {summary['ticks']} ticks in {summary['seconds']:.2f}s "
+        f"({summary['ticks_per_second']:.1f} ticks/s)."
+    )
+    print(
+        f"Population at tick {summary['world_age']}: {summary['animals']} animals, "
+        f"{summary['plants']} plants ({summary['organisms']} organisms)."
+    )
+
+    if args.save:
+        checkpoint.save(world, args.save)
+        print(f"Checkpoint saved to {args.save}.")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1 @@
-__all__ = ["simulation"]
+__all__ = ["checkpoint", "simulation", "simulation_worker"]
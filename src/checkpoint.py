@@ -0,0 +1,381 @@
+"""
+Binary checkpoints of the complete state of a world.
+
+A checkpoint file consists of:
+    - the magic bytes CHECKPOINT_MAGIC,
+    - the length of the header as little endian unsigned 64 bit integer,
+    - the header as UTF-8 JSON, holding the world dimensions, age and seed, the noise settings, the class settings and
+      counters, the state of the random streams and the dtype, shape and offset of every array,
+    - the raw arrays: the terrain grids, the tile visits and the store columns, genes, gene mutation ranges and stats of
+      all living organisms, each aligned to ARRAY_ALIGNMENT bytes.
+
+On load the arrays are memory-mapped copy-on-write, so only the pages that are actually read are loaded from disk and
+the file is never modified. The organism columns are copied into the organism store in bulk, only the organism views
+are created one by one.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+
+import numpy as np
+import pygame
+
+from .entities.animal import Animal
+from .entities.organism import Organism
+from .entities.organism_store import OrganismStore
+from .entities.plant import Plant
+from .entities.properties.dna import DNA
+from .entities.properties.gene import Gene
+from .settings import simulation
+from .terrain.world import World
+
+CHECKPOINT_MAGIC: bytes = b"EVOCKPT\x00"
+CHECKPOINT_VERSION: int = 1
+ARRAY_ALIGNMENT: int = 64
+
+# The classes whose class level settings and counters are part of the state
+SETTING_CLASSES: dict[str, type] = {
+    "Animal": Animal,
+    "DNA": DNA,
+    "Gene": Gene,
+    "Organism": Organism,
+    "Plant": Plant,
+}
+
+ORGANISM_CLASSES: dict[int, type] = {Animal.KIND: Animal, Plant.KIND: Plant}
+
+# The per organism statistics that are not kept in the organism store
+STAT_ATTRIBUTES: tuple[str, ...] = (
+    "animals_killed",
+    "plants_killed",
+    "organisms_attacked",
+    "total_energy_gained",
+    "tiles_visited",
+    "num_offspring",
+    "birth_time",
+    "death_time",
+)
+
+_STORE_COLUMNS: tuple[str, ...] = (
+    "id",
+    "kind",
+    "row",
+    "col",
+    "health",
+    "energy",
+    "tick_age",
+    "parent_id",
+)
+
+
+# region save
+def save(world: World, path: str) -> None:
+    """
+    Save the complete state of a world and its organisms to a checkpoint file.
+
+    Parameters:
+        world (World): The world to save.
+        path (str): The path of the checkpoint file.
+
+    Returns:
+        None
+    """
+    store = simulation.organism_store
+    alive = store.alive_indices()
+    views = [store.views[index] for index in alive.tolist()]
+
+    arrays: dict[str, np.ndarray] = {
+        "height_map": world.height_map,
+        "moisture_map": world.moisture_map,
+        "tile_visits": np.array(
+            [[tile.times_visted for tile in row] for row in world.tile_grid],
+            dtype=np.int64,
+        ).reshape(world.rows, world.cols),
+        "genes": store.genes[alive],
+        "gene_mutation_ranges": np.array(
+            [view.dna.mutation_ranges for view in views],
+            dtype=np.float64,
+        ).reshape(len(views), len(OrganismStore.GENE_NAMES)),
+        "stats": np.array(
+            [
+                [_stat_value(getattr(view, name)) for name in STAT_ATTRIBUTES]
+                for view in views
+            ],
+            dtype=np.float64,
+        ).reshape(len(views), len(STAT_ATTRIBUTES)),
+    }
+    for name in _STORE_COLUMNS:
+        arrays[name] = getattr(store, name)[alive]
+
+    rng_version, rng_internal, rng_gauss = world.rng.getstate()
+    header = {
+        "version": CHECKPOINT_VERSION,
+        "world": {
+            "rect": list(world.rect),
+            "tile_size": world.tile_size,
+            "age": world.age,
+            "seed": world.seed,
+        },
+        "noise": {
+            "settings": [
+                setting._value
+                for setting in (
+                    world.moisture_setting,
+                    world.height_setting,
+                    world.scale_setting,
+                )
+            ],
+            "height_functions": _noise_function_values(world.height_functions),
+            "height_functions_weights": list(world.height_functions_weights),
+            "moisture_functions": _noise_function_values(world.moisture_functions),
+            "moisture_functions_weights": list(world.moisture_functions_weights),
+        },
+        "class_settings": class_settings(),
+        "rng": {
+            "random": [rng_version, list(rng_internal), rng_gauss],
+            "numpy": world.np_rng.bit_generator.state,
+        },
+        "arrays": {},
+    }
+
+    # The offsets are relative to the start of the data, which is aligned after the header
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[name] = array
+        header["arrays"][name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+        }
+        offset = _align(offset + array.nbytes)
+    header_bytes = json.dumps(header).encode("utf-8")
+    data_start = _align(len(CHECKPOINT_MAGIC) + 8 + len(header_bytes))
+
+    # The terrain of a loaded world is memory-mapped from its checkpoint, which may be the file being saved. It is only
+    # replaced once the new checkpoint has been written completely.
+    with open(path + ".tmp", "wb") as file:
+        file.write(CHECKPOINT_MAGIC)
+        file.write(struct.pack("<Q", len(header_bytes)))
+        file.write(header_bytes)
+        for name, array in arrays.items():
+            file.seek(data_start + header["arrays"][name]["offset"])
+            file.write(array.tobytes())
+        file.truncate(data_start + offset)
+    os.replace(path + ".tmp", path)
+
+
+def class_settings() -> dict:
+    """
+    Return the class level settings and counters of the setting classes.
+
+    Parameters:
+        None
+
+    Returns:
+        dict: The value of every plain (number, string, or tuple of numbers) class attribute by <Class>.<attribute>.
+    """
+    settings = {}
+    for class_name, cls in SETTING_CLASSES.items():
+        for name, value in vars(cls).items():
+            if not name.startswith("__") and _is_plain(value):
+                settings[f"{class_name}.{name}"] = value
+    return settings
+
+
+def _is_plain(value) -> bool:
+    if isinstance(value, tuple):
+        return all(isinstance(item, (bool, int, float)) for item in value)
+    return isinstance(value, (bool, int, float, str))
+
+
+def _stat_value(value) -> float:
+    return np.nan if value is None else value
+
+
+def _noise_function_values(functions: list) -> list[list[float]]:
+    return [[setting._value for setting in function.settings] for function in functions]
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ARRAY_ALIGNMENT) * ARRAY_ALIGNMENT
+
+
+# endregion
+
+
+# region load
+def load(path: str, headless: bool = False) -> World:
+    """
+    Restore a world and its organisms from a checkpoint file.
+
+    All organisms currently in the simulation are removed. The class settings, counters and random streams are set to
+    the saved values, so the restored world continues exactly like the saved one would have.
+
+    Parameters:
+        path (str): The path of the checkpoint file.
+        headless (bool): If True the world is restored without any surfaces. Default is False.
+
+    Raises:
+        ValueError: If the file is no checkpoint or has an unsupported version.
+
+    Returns:
+        World: The restored world.
+    """
+    header, arrays = read(path)
+
+    simulation.reset_organisms()
+    apply_class_settings(header["class_settings"])
+
+    world_state = header["world"]
+    world = World(
+        pygame.Rect(world_state["rect"]),
+        world_state["tile_size"],
+        headless=headless,
+        seed=world_state["seed"],
+        height_map=arrays["height_map"],
+        moisture_map=arrays["moisture_map"],
+    )
+    world.age = world_state["age"]
+    _restore_noise(world, header["noise"])
+
+    _restore_organisms(world, arrays)
+    for tile, visits in zip(
+        (tile for row in world.tile_grid for tile in row),
+        arrays["tile_visits"].ravel().tolist(),
+    ):
+        tile.times_visted = visits
+
+    rng_version, rng_internal, rng_gauss = header["rng"]["random"]
+    world.rng.setstate((rng_version, tuple(rng_internal), rng_gauss))
+    world.np_rng.bit_generator.state = header["rng"]["numpy"]
+    return world
+
+
+def read(path: str) -> tuple[dict, dict[str, np.ndarray]]:
+    """
+    Read the header of a checkpoint file and memory-map its arrays.
+
+    Parameters:
+        path (str): The path of the checkpoint file.
+
+    Raises:
+        ValueError: If the file is no checkpoint or has an unsupported version.
+
+    Returns:
+        tuple[dict, dict[str, np.ndarray]]: The header and the copy-on-write memory-mapped arrays by name.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(CHECKPOINT_MAGIC)) != CHECKPOINT_MAGIC:
+            raise ValueError(f"{path} is not a checkpoint file.")
+        (header_length,) = struct.unpack("<Q", file.read(8))
+        header = json.loads(file.read(header_length).decode("utf-8"))
+    if header.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(
+            f"Checkpoint version {header.get('version')} is not supported."
+        )
+
+    data_start = _align(len(CHECKPOINT_MAGIC) + 8 + header_length)
+    arrays = {}
+    for name, spec in header["arrays"].items():
+        shape = tuple(spec["shape"])
+        if 0 in shape:
+            # Empty arrays can not be memory-mapped
+            arrays[name] = np.empty(shape, dtype=spec["dtype"])
+            continue
+        arrays[name] = np.memmap(
+            path,
+            dtype=np.dtype(spec["dtype"]),
+            mode="c",
+            offset=data_start + spec["offset"],
+            shape=shape,
+        )
+    return header, arrays
+
+
+def apply_class_settings(settings: dict) -> None:
+    """
+    Set the class level settings and counters of the setting classes.
+
+    Parameters:
+        settings (dict): The values by <Class>.<attribute>, as returned by class_settings.
+
+    Raises:
+        ValueError: If a class is not in SETTING_CLASSES.
+
+    Returns:
+        None
+    """
+    for name, value in settings.items():
+        class_name, _, attribute = name.partition(".")
+        cls = SETTING_CLASSES.get(class_name)
+        if cls is None:
+            raise ValueError(f"{name} is not a known setting.")
+        setattr(cls, attribute, tuple(value) if isinstance(value, list) else value)
+
+
+def _restore_noise(world: World, noise: dict) -> None:
+    for setting, value in zip(
+        (world.moisture_setting, world.height_setting, world.scale_setting),
+        noise["settings"],
+    ):
+        setting._value = value
+    for functions, values in (
+        (world.height_functions, noise["height_functions"]),
+        (world.moisture_functions, noise["moisture_functions"]),
+    ):
+        for function, function_values in zip(functions, values):
+            for setting, value in zip(function.settings, function_values):
+                setting._value = value
+    world.height_functions_weights[:] = noise["height_functions_weights"]
+    world.moisture_functions_weights[:] = noise["moisture_functions_weights"]
+
+
+def _restore_organisms(world: World, arrays: dict[str, np.ndarray]) -> None:
+    # The store columns and the occupancy grids are filled from the memory-mapped arrays with one assignment each, only
+    # the thin organism views with their DNA and stats are created one by one
+    store = simulation.organism_store
+    kinds = np.asarray(arrays["kind"])
+    rows = np.asarray(arrays["row"])
+    cols = np.asarray(arrays["col"])
+    dnas = DNA.from_values_many(arrays["genes"], arrays["gene_mutation_ranges"])
+
+    start = store.size
+    views = [
+        ORGANISM_CLASSES[kind].view(start + i, world.tile_grid[row][col], dna)
+        for i, (kind, row, col, dna) in enumerate(
+            zip(kinds.tolist(), rows.tolist(), cols.tolist(), dnas)
+        )
+    ]
+    store.extend(
+        views,
+        {name: arrays[name] for name in _STORE_COLUMNS},
+        np.array([dna.values for dna in dnas]).reshape(
+            len(dnas), len(OrganismStore.GENE_NAMES)
+        ),
+    )
+
+    indices = np.arange(start, start + len(views))
+    animals = kinds == Animal.KIND
+    world.occupancy.animals[rows[animals], cols[animals]] = indices[animals]
+    world.occupancy.plants[rows[~animals], cols[~animals]] = indices[~animals]
+
+    is_animal = animals.tolist()
+    simulation.organisms.add(*views)
+    simulation.animals.add(*[view for view, a in zip(views, is_animal) if a])
+    simulation.plants.add(*[view for view, a in zip(views, is_animal) if not a])
+
+    for organism, stats in zip(views, arrays["stats"].tolist()):
+        for name, value in zip(STAT_ATTRIBUTES, stats):
+            if name == "death_time" and np.isnan(value):
+                value = None
+            elif name != "total_energy_gained":
+                value = int(value)
+            setattr(organism, name, value)
+
+
+# endregion
+
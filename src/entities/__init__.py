@@ -1 +1 @@
-__all__ = ["organism", "plant", "animal"]
+__all__ = ["organism", "organism_store", "birth_queue", "plant", "animal"]
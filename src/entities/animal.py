@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-import random
-
 import pygame
 
 from ..settings import database, simulation
 from ..terrain.tile import Tile
 from .organism import Organism
+from .organism_store import OrganismStore
 from .properties.dna import DNA
 
 
 class Animal(Organism):
+    __slots__ = ("desired_tile_movement",)
+    KIND: int = OrganismStore.ANIMAL
     # region class settings
     _BASE_ENERGY_MAINTENANCE: float = 10
     _MAX_HEALTH: float = 50
@@ -101,30 +102,12 @@ class Animal(Organism):
 
     # endregion
     # region class properties
-    @property
-    def MAX_HEALTH(self) -> float:
-        return Animal._MAX_HEALTH
-
-    @property
-    def MAX_ENERGY(self) -> float:
-        return Animal._MAX_ENERGY
-
-    @property
-    def NUTRITION_FACTOR(self) -> float:
-        return Animal._NUTRITION_FACTOR
-
-    @property
-    def MAX_ALPHA(self) -> float:
-        return Animal._MAX_ALPHA
-
-    @property
-    def MIN_ALPHA(self) -> float:
-        return Animal._MIN_ALPHA
-
     @staticmethod
     def BASE_ANIMAL_COLOR() -> pygame.Color:
         return pygame.Color(
-            random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)
+            simulation.rng.randint(0, 255),
+            simulation.rng.randint(0, 255),
+            simulation.rng.randint(0, 255),
         )
 
     # endregion
@@ -143,44 +126,42 @@ class Animal(Organism):
         energy: float = None,
     ):
         # region defaults
-        if not rect:
-            rect = tile.rect.copy()
         if not dna:
             dna = DNA(
                 Animal.BASE_ANIMAL_COLOR(),
-                random.uniform(
+                simulation.rng.uniform(
                     Animal._STARTING_ATTACK_POWER_RANGE[0],
                     Animal._STARTING_ATTACK_POWER_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Animal._STARTING_MOISTURE_PREFERENCE_RANGE[0],
                     Animal._STARTING_MOISTURE_PREFERENCE_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Animal._STARTING_HEIGHT_PREFERENCE_RANGE[0],
                     Animal._STARTING_HEIGHT_PREFERENCE_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Animal._STARTING_MUTATION_CHANCE_RANGE[0],
                     Animal._STARTING_MUTATION_CHANCE_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Animal._STARTING_MIN_REPRODUCTION_HEALTH_RANGE[0],
                     Animal._STARTING_MIN_REPRODUCTION_HEALTH_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Animal._STARTING_MIN_REPRODUCTION_ENERGY_RANGE[0],
                     Animal._STARTING_MIN_REPRODUCTION_ENERGY_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Animal._STARTING_REPRODUCTION_CHANCE_RANGE[0],
                     Animal._STARTING_REPRODUCTION_CHANCE_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Animal._STARTING_ENERGY_TO_OFFSPRING_RATIO_RANGE[0],
                     Animal._STARTING_ENERGY_TO_OFFSPRING_RATIO_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Animal._STARTING_DEFENSE_RANGE[0], Animal._STARTING_DEFENSE_RANGE[1]
                 ),
             )
@@ -190,15 +171,21 @@ class Animal(Organism):
             energy = Animal._STARTING_ENERGY
         # endregion
 
+        self.desired_tile_movement: Tile | None = None
         super().__init__(
             tile,
             rect,
             health,
             energy,
             dna,
+            parent,
         )
 
-        self.parent: Animal | None = parent
+    @classmethod
+    def view(cls, store_index: int, tile: Tile, dna: DNA) -> Animal:
+        animal = super().view(store_index, tile, dna)
+        animal.desired_tile_movement = None
+        return animal
 
     # region main methods
     def think(self):
@@ -215,7 +202,7 @@ class Animal(Organism):
         """
         super().think()
         if self.tile.has_plant():
-            best_growth = self.tile.plant.sprite.health
+            best_growth = self.tile.plant.health
             destination = None
         else:
             best_growth = 0
@@ -224,12 +211,12 @@ class Animal(Organism):
         ns = self.tile.get_neighboring_tiles()
         for n in ns:
             if n.has_animal():
-                if self.attack_power < n.animal.sprite.defense:
+                if self.attack_power < n.animal.defense:
                     continue
             if not n.has_plant():
                 continue
-            if n.plant.sprite.health > best_growth:
-                best_growth = n.plant.sprite.health
+            if n.plant.health > best_growth:
+                best_growth = n.plant.health
                 destination = n
 
         self.desired_tile_movement = destination
@@ -247,10 +234,10 @@ class Animal(Organism):
         if self.desired_tile_movement:
             if self.desired_tile_movement is not self.tile:
                 if self.desired_tile_movement.has_animal():
-                    self.attack(self.desired_tile_movement.animal.sprite)
+                    self.attack(self.desired_tile_movement.animal)
 
         if self.tile.has_plant() and self.wants_to_eat():
-            self.attack(self.tile.plant.sprite)
+            self.attack(self.tile.plant)
 
     def handle_movement(self):
         """
@@ -273,12 +260,12 @@ class Animal(Organism):
 
     # region tiles
     def enter_tile(self, tile: Tile):
-        super().enter_tile(tile)
         if tile.has_animal():
             raise ValueError("Animal trying to enter a tile that is already occupied.")
         else:
+            super().enter_tile(tile)
             if self.tile:
-                self.tile.animal.remove(self)
+                self.tile.remove_animal(self)
 
             self.tile = tile
             tile.add_animal(self)
@@ -288,9 +275,12 @@ class Animal(Organism):
     def check_tile_assignment(self):
         if not self.tile:
             raise ValueError("Animal does not have a tile!")
-        if not self.tile.animal.has(self):
+        if self.tile.animal is not self:
             raise ValueError("Animal-Tile assignment not equal.")
 
+    def leave_tile(self):
+        self.tile.remove_animal(self)
+
     # endregion
 
     # region energy and health
@@ -299,7 +289,7 @@ class Animal(Organism):
         Animal.animals_died += 1
 
         if self.tile.has_plant():
-            self.tile.plant.sprite.energy += self.health * 0.5
+            self.tile.plant.energy += self.health * 0.5
 
         if database.save_csv and database.save_animals_csv:
             self.save_to_csv()
@@ -308,7 +298,7 @@ class Animal(Organism):
 
     def get_energy_maintenance(self) -> float:
         # TODO update this so it is different for different animals
-        return Animal._BASE_ENERGY_MAINTENANCE
+        return self.constants.energy_maintenance
 
     # endregion
 
@@ -320,7 +310,13 @@ class Animal(Organism):
 
     def wants_to_eat(self) -> bool:
         # TODO add genes that define eating habits of animals
-        return self.energy_ratio() < 1 or self.health_ratio() < 1
+        store = self.store
+        index = self.store_index
+        constants = self.constants
+        return (
+            store.energy.item(index) < constants.max_energy
+            or store.health.item(index) < constants.max_health
+        )
 
     # endregion
 
@@ -331,26 +327,37 @@ class Animal(Organism):
         )
         if options:
             # TODO add a gene that defines how long an animal is pregnant
-            ENERGY_TO_CHILD = self.MAX_ENERGY * self.energy_to_offspring_ratio
+            ENERGY_TO_CHILD = self.constants.max_energy * self.energy_to_offspring_ratio
             offspring_energy_distribution = (
                 0.4  # TODO add a gene that defines the energy distribution
             )
-            self.energy -= ENERGY_TO_CHILD
-            offspring = self.copy(
+            # BirthQueue takes the energy now and creates the offspring at the end of the tick
+            Organism.births.request(
+                self,
                 options,
                 health=ENERGY_TO_CHILD * offspring_energy_distribution,
                 energy=ENERGY_TO_CHILD * (1 - offspring_energy_distribution),
             )
-            simulation.organisms.add(offspring)
-            simulation.animals.add(offspring)
 
-    def copy(self, tile: Tile, health: float = None, energy: float = None) -> Animal:
+    def copy(
+        self,
+        tile: Tile,
+        health: float = None,
+        energy: float = None,
+        dna: DNA | None = None,
+    ) -> Animal:
         super().copy(tile)
-        Animal.animals_birthed += 1
 
-        copied_dna = self.dna.copy()
-        copied_dna.mutate()
+        copied_dna = dna
+        if copied_dna is None:
+            copied_dna = self.dna.copy()
+            copied_dna.mutate()
 
         return Animal(tile, parent=self, dna=copied_dna, health=health, energy=energy)
 
+    @classmethod
+    def count_births(cls, count: int) -> None:
+        super().count_births(count)
+        Animal.animals_birthed += count
+
     # endregion
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pygame
+
+from ..settings import simulation
+from .organism_store import OrganismStore
+from .properties.dna import DNA
+
+if TYPE_CHECKING:
+    from ..terrain.tile import Tile
+    from .organism import Organism
+
+
+class BirthQueue:
+    """
+    Class collecting the reproduction intents of a tick and creating all offspring of the tick at once.
+
+    While the organisms are updated a reproducing organism only queues an intent with the tile it chose, paying the
+    energy for its offspring (decision pass). After all updates commit resolves the intents and creates the offspring
+    (commit pass): the DNA of all offspring is copied and mutated as one array, their rows are written to the organism
+    store with one assignment per column (see OrganismStore.extend), the occupancy grids with one assignment each and
+    the sprite groups are filled with one call each. Per offspring only its view (see Organism.view) and counters are
+    created and updated.
+
+    Intents are resolved in the order they were queued. If the chosen tile has been claimed by an earlier intent for an
+    organism of the same kind, or has been occupied or flooded since the decision, another valid neighbor of the tile
+    the parent reproduced from is chosen. If there is none the intent is dropped and the health and energy the parent
+    paid are given back to it if it is still alive.
+
+    Attributes:
+        parents (list[Organism]): The parent of every queued intent.
+        origins (list[Tile]): The tile every parent was on when it decided to reproduce.
+        tiles (list[Tile]): The tile chosen for every offspring.
+        healths (list[float]): The starting health of every offspring.
+        energies (list[float]): The starting energy of every offspring.
+        paid_healths (list[float]): The health every parent paid, if its energy went below the minimum.
+        paid_energies (list[float]): The energy every parent paid.
+
+    Methods:
+        request(parent, tile, health, energy): Queue a reproduction intent.
+        commit(): Resolve the queued intents and create the offspring.
+        clear(): Drop all queued intents.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty BirthQueue.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self.parents: list[Organism] = []
+        self.origins: list[Tile] = []
+        self.tiles: list[Tile] = []
+        self.healths: list[float] = []
+        self.energies: list[float] = []
+        self.paid_healths: list[float] = []
+        self.paid_energies: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def request(
+        self, parent: Organism, tile: Tile, health: float, energy: float
+    ) -> None:
+        """
+        Queue a reproduction intent and take the health and energy of the offspring from the energy of the parent.
+
+        The payment follows the rules of the Organism.energy setter, so a deficit below the minimum energy is taken from
+        the health of the parent. What was actually taken from each is recorded to give it back if the intent is dropped.
+
+        Parameters:
+            parent (Organism): The reproducing organism.
+            tile (Tile): The tile chosen for the offspring.
+            health (float): The starting health of the offspring.
+            energy (float): The starting energy of the offspring.
+
+        Returns:
+            None
+        """
+        store = parent.store
+        index = parent.store_index
+        health_before = store.health.item(index)
+        energy_before = store.energy.item(index)
+        parent.energy = energy_before - health - energy
+
+        self.parents.append(parent)
+        self.origins.append(parent.tile)
+        self.tiles.append(tile)
+        self.healths.append(health)
+        self.energies.append(energy)
+        self.paid_healths.append(health_before - store.health.item(index))
+        self.paid_energies.append(energy_before - store.energy.item(index))
+
+    def commit(self) -> list[Organism]:
+        """
+        Resolve the queued intents, create all offspring and empty the queue.
+
+        Parameters:
+            None
+
+        Returns:
+            list[Organism]: The created offspring, in the order the intents were queued.
+        """
+        if not self.parents:
+            return []
+
+        accepted = self._resolve()
+        offspring = self._create(accepted) if accepted else []
+        self.clear()
+        return offspring
+
+    def clear(self) -> None:
+        """
+        Drop all queued intents without creating offspring or giving back energy.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self.parents.clear()
+        self.origins.clear()
+        self.tiles.clear()
+        self.healths.clear()
+        self.energies.clear()
+        self.paid_healths.clear()
+        self.paid_energies.clear()
+
+    def _resolve(self) -> dict[int, Tile]:
+        # Maps the index of every accepted intent to the tile of its offspring
+        accepted: dict[int, Tile] = {}
+        claimed: tuple[set[Tile], set[Tile]] = (set(), set())
+        for i, parent in enumerate(self.parents):
+            kind = parent.KIND
+            tile = self.tiles[i]
+            if not BirthQueue._is_free(tile, kind, claimed[kind]):
+                options = [
+                    neighbor
+                    for neighbor in self.origins[i].neighbors.values()
+                    if BirthQueue._is_free(neighbor, kind, claimed[kind])
+                ]
+                if not options:
+                    if parent.is_alive():
+                        self._refund(i, parent)
+                    continue
+                tile = simulation.rng.choice(options)
+
+            claimed[kind].add(tile)
+            accepted[i] = tile
+        return accepted
+
+    def _create(self, accepted: dict[int, Tile]) -> list[Organism]:
+        # Imported here as the organism module imports this one
+        from .organism import Organism
+
+        parents = [self.parents[i] for i in accepted]
+        tiles = list(accepted.values())
+        count = len(parents)
+
+        genes = np.array([parent.dna.values for parent in parents])
+        DNA.mutate_many(genes)
+        dnas = DNA.from_values_many(genes)
+
+        store = simulation.organism_store
+        start = store.size
+        offspring = [
+            type(parent).view(start + i, tile, dna)
+            for i, (parent, tile, dna) in enumerate(zip(parents, tiles, dnas))
+        ]
+        indices = np.arange(start, start + count)
+        kinds = np.array([parent.KIND for parent in parents], dtype=np.int8)
+        rows = np.array([tile.row for tile in tiles], dtype=np.int32)
+        cols = np.array([tile.col for tile in tiles], dtype=np.int32)
+        first_id = Organism.next_organism_id
+        Organism.next_organism_id += count
+        store.extend(
+            offspring,
+            {
+                "id": np.arange(first_id, first_id + count),
+                "kind": kinds,
+                "row": rows,
+                "col": cols,
+                "health": np.array([self.healths[i] for i in accepted]),
+                "parent_id": np.array([parent.id for parent in parents]),
+            },
+            genes,
+        )
+
+        # Health and energy follow the rules of the Organism setters with the constants of each species
+        energies = np.array([self.energies[i] for i in accepted])
+        for species in dict.fromkeys(type(parent) for parent in parents):
+            of_species = kinds == species.KIND
+            species_indices = indices[of_species]
+            constants = species.constants
+            store.health[species_indices] = np.minimum(
+                store.health[species_indices], constants.max_health
+            )
+            store.add_energy(
+                species_indices,
+                energies[of_species],
+                constants.min_energy,
+                constants.max_energy,
+                constants.max_health,
+            )
+            species.count_births(np.count_nonzero(of_species))
+
+        # All tiles of a world share its occupancy grids
+        occupancy = tiles[0].occupancy
+        animals = kinds == OrganismStore.ANIMAL
+        occupancy.animals[rows[animals], cols[animals]] = indices[animals]
+        occupancy.plants[rows[~animals], cols[~animals]] = indices[~animals]
+
+        birth_time = pygame.time.get_ticks()
+        for parent, child, tile in zip(parents, offspring, tiles):
+            parent.num_offspring += 1
+            child.birth_time = birth_time
+            child.tiles_visited = 1
+            if child.KIND == OrganismStore.ANIMAL:
+                tile.times_visted += 1
+
+        simulation.organisms.add(*offspring)
+        simulation.animals.add(
+            *[child for child in offspring if child.KIND == OrganismStore.ANIMAL]
+        )
+        simulation.plants.add(
+            *[child for child in offspring if child.KIND == OrganismStore.PLANT]
+        )
+        return offspring
+
+    def _refund(self, i: int, parent: Organism) -> None:
+        # Give back exactly what was taken from each column, only capped at the maxima of the species
+        store = parent.store
+        index = parent.store_index
+        constants = parent.constants
+        store.health[index] = min(
+            store.health.item(index) + self.paid_healths[i], constants.max_health
+        )
+        store.energy[index] = min(
+            store.energy.item(index) + self.paid_energies[i], constants.max_energy
+        )
+
+    @staticmethod
+    def _is_free(tile: Tile, kind: int, claimed: set[Tile]) -> bool:
+        if tile.has_water or tile in claimed:
+            return False
+        if kind == OrganismStore.ANIMAL:
+            return not tile.has_animal()
+        return not tile.has_plant()
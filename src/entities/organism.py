@@ -1,55 +1,125 @@
 from __future__ import annotations
 
-import csv
-import os
-import random
-from abc import ABC, abstractmethod
+import inspect
+from abc import ABC, ABCMeta, abstractmethod
 
+import numpy as np
 import pygame
 
 from ..gui.stat_panel import StatPanel
-from ..settings import database
+from ..settings import database, simulation
 from ..terrain.tile import Tile
+from .birth_queue import BirthQueue
+from .organism_store import OrganismStore
 from .properties.dna import DNA
-
-
-class Organism(ABC, pygame.sprite.Sprite):
+from .species_constants import SpeciesConstants
+
+
+class OrganismMeta(ABCMeta):
+    """
+    Metaclass of the organisms, recompiling the constants of a species whenever one of its settings is set.
+
+    The class setters, the settings menu, sweeps and checkpoints all end in an assignment to a class attribute, which is
+    intercepted here, so the compiled constants can never get out of date (see Organism.refresh_constants).
+    """
+
+    _SETTING_NAMES: frozenset[str] = frozenset(SpeciesConstants.SETTINGS.values())
+
+    def __init__(cls, name: str, bases: tuple, namespace: dict, **kwargs) -> None:
+        super().__init__(name, bases, namespace, **kwargs)
+        cls.refresh_constants()
+
+    def __setattr__(cls, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in OrganismMeta._SETTING_NAMES:
+            cls.refresh_constants()
+
+
+class Organism(ABC, metaclass=OrganismMeta):
+    # Organisms are slotted and own no surface, the world draws them from the organism store and image returns a
+    # shared surface of the image cache. They are not pygame.sprite.Sprite instances but implement the methods sprite
+    # groups call on their members.
+    __slots__ = (
+        "store",
+        "store_index",
+        "stat_panel",
+        "animals_killed",
+        "plants_killed",
+        "organisms_attacked",
+        "total_energy_gained",
+        "tiles_visited",
+        "num_offspring",
+        "birth_time",
+        "death_time",
+        "_rect",
+        "dna",
+        "tile",
+        "color",
+        "_groups",
+    )
     SELECTED_ORGANISM_COLOR: pygame.Color = pygame.Color("white")
     SELECTED_ORGANISM_RECT_WIDTH: float = 1
+    KIND: int  # Kind code of the organism in the organism store
 
+    # region class settings
+    _MIN_HEALTH: float = 0
+    _MIN_ENERGY: float = 0
+    # endregion
     # region class properties
+    # The class settings compiled into one object per species, kept up to date by OrganismMeta
+    constants: SpeciesConstants
+
     @property
-    @abstractmethod
     def MAX_HEALTH(self) -> float:
-        pass
+        return self.constants.max_health
 
     @property
-    @abstractmethod
     def MAX_ENERGY(self) -> float:
-        pass
+        return self.constants.max_energy
 
     @property
     def MIN_HEALTH(self) -> float:
-        return 0
+        return self.constants.min_health
 
     @property
     def MIN_ENERGY(self) -> float:
-        return 0
+        return self.constants.min_energy
 
     @property
-    @abstractmethod
     def NUTRITION_FACTOR(self) -> float:
-        pass
+        return self.constants.nutrition_factor
 
     @property
-    @abstractmethod
     def MAX_ALPHA(self) -> float:
-        pass
+        return self.constants.max_alpha
 
     @property
-    @abstractmethod
     def MIN_ALPHA(self) -> float:
-        pass
+        return self.constants.min_alpha
+
+    @classmethod
+    def refresh_constants(cls) -> None:
+        """
+        Compile the constants of the species and its subclasses from their current class settings.
+
+        Living organisms of a species whose maximum health or energy was lowered are clamped to the new maximum, so the
+        health and energy ratios never exceed 1.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        if not inspect.isabstract(cls):
+            cls.constants = SpeciesConstants.compile(cls)
+            store = simulation.organism_store
+            rows = store.alive_indices(cls.KIND)
+            constants = cls.constants
+            store.health[rows] = np.minimum(store.health[rows], constants.max_health)
+            store.energy[rows] = np.minimum(store.energy[rows], constants.max_energy)
+        for species in cls.__subclasses__():
+            species.refresh_constants()
 
     # endregion
     # region stats
@@ -57,84 +127,203 @@ class Organism(ABC, pygame.sprite.Sprite):
     organisms_died: int = 0
     next_organism_id: int = 0
     # endregion
+    # Reproduction intents of the current tick, committed by the world after all updates
+    births: BirthQueue = BirthQueue()
 
     def __init__(
         self,
         tile: Tile,
-        rect: pygame.Rect,
+        rect: pygame.Rect | None,
         health: float,
         energy: float,
         dna: DNA,
+        parent: Organism | None = None,
     ) -> None:
-        pygame.sprite.Sprite.__init__(self)
+        # A list is smaller than a set for the few groups an organism is in
+        self._groups: list[pygame.sprite.AbstractGroup] = []
+
+        # The state used by the update loop lives in a row of the global organism store, this object is a view on it
+        self.store: OrganismStore = simulation.organism_store
+        self.store_index: int = self.store.add(
+            self,
+            self.KIND,
+            Organism.next_organism_id,
+            parent.id if parent else -1,
+        )
+        Organism.next_organism_id += 1
 
         # region stats
-        self.stat_panel: StatPanel = None
+        # Only created when the organism is inspected
+        self.stat_panel: StatPanel | None = None
         self.animals_killed: int = 0
         self.plants_killed: int = 0
         self.organisms_attacked: int = 0
         self.total_energy_gained: float = 0
         self.tiles_visited: int = 0
         self.num_offspring: int = 0
-        self.tick_age: int = 0
         self.birth_time: int = (
             pygame.time.get_ticks()
         )  # TODO update this so it works with tick age, needs world tick age at initialisation
         self.death_time: int | None = None  # TODO update this to work with tick age
         # endregion
 
-        self.rect: pygame.Rect = rect
-        self.image: pygame.Surface = pygame.Surface(self.rect.size)
-
-        self.id = Organism.next_organism_id
-        Organism.next_organism_id += 1
+        # Without an explicit rect the organism uses the rect of its tile
+        self._rect: pygame.Rect | None = rect
 
         self.health = health
         self.energy = energy
 
-        self.parent: Organism
         self.dna: DNA = dna
         self.tile: Tile = None
-
         self.color: pygame.Color = None
-        self.attack_power: float = None
-        self.moisture_preference: float = None
-        self.height_preference: float = None
-        self.min_reproduction_health: float = None
-        self.min_reproduction_energy: float = None
-        self.reproduction_chance: float = None
-        self.energy_to_offspring_ratio: float = None
-        self.defense: float = None
 
         self._set_attributes_from_dna()
         self.enter_tile(tile)
 
+    @classmethod
+    def view(cls, store_index: int, tile: Tile, dna: DNA) -> Organism:
+        """
+        Create an organism viewing a row that has already been written to the organism store, e.g. by
+        OrganismStore.extend when a checkpoint is restored.
+
+        Unlike the constructor nothing is written to the store, the occupancy of the tile or the sprite groups, the
+        caller does that for all restored organisms at once. The stats start at zero.
+
+        Parameters:
+            store_index (int): The row of the organism in the global organism store.
+            tile (Tile): The tile the organism is on.
+            dna (DNA): The DNA of the organism, matching the genes of its row.
+
+        Returns:
+            Organism: The organism.
+        """
+        organism = cls.__new__(cls)
+        organism._groups = []
+        organism.store = simulation.organism_store
+        organism.store_index = store_index
+        organism.stat_panel = None
+        organism.animals_killed = 0
+        organism.plants_killed = 0
+        organism.organisms_attacked = 0
+        organism.total_energy_gained = 0
+        organism.tiles_visited = 0
+        organism.num_offspring = 0
+        organism.birth_time = 0
+        organism.death_time = None
+        organism._rect = None
+        organism.dna = dna
+        organism.tile = tile
+        organism.color = dna.color
+        return organism
+
+    # region sprite groups
+    def add_internal(self, group: pygame.sprite.AbstractGroup) -> None:
+        if group not in self._groups:
+            self._groups.append(group)
+
+    def remove_internal(self, group: pygame.sprite.AbstractGroup) -> None:
+        if group in self._groups:
+            self._groups.remove(group)
+
+    def groups(self) -> list[pygame.sprite.AbstractGroup]:
+        return list(self._groups)
+
+    # endregion
+
     # region properties
+    @property
+    def rect(self) -> pygame.Rect:
+        return self._rect if self._rect is not None else self.tile.rect
+
+    @property
+    def image(self) -> pygame.Surface:
+        # Shared with all organisms of the same quantized color, it must not be modified
+        max_alpha = self.constants.max_alpha
+        alpha = max_alpha if max_alpha < 255 else None
+        return simulation.image_cache.get(self.color, alpha, self.rect.size)
+
+    @property
+    def id(self) -> int:
+        return self.store.id.item(self.store_index)
+
+    @property
+    def parent_id(self) -> int | None:
+        parent_id = self.store.parent_id.item(self.store_index)
+        return parent_id if parent_id >= 0 else None
+
+    @property
+    def tick_age(self) -> int:
+        return self.store.tick_age.item(self.store_index)
+
+    @tick_age.setter
+    def tick_age(self, value: int):
+        self.store.tick_age[self.store_index] = value
+
     @property
     def health(self) -> float:
-        return self._health
+        return self.store.health.item(self.store_index)
 
     @health.setter
     def health(self, value: float):
-        if value > self.MAX_HEALTH:
-            self._health = self.MAX_HEALTH
-        else:
-            self._health = value
+        max_health = self.constants.max_health
+        self.store.health[self.store_index] = (
+            value if value < max_health else max_health
+        )
 
     @property
     def energy(self) -> float:
-        return self._energy
+        return self.store.energy.item(self.store_index)
 
     @energy.setter
     def energy(self, value: float):
-        if value < self.MIN_ENERGY:
-            self._energy = self.MIN_ENERGY
-            self.health += value
-        elif value > self.MAX_ENERGY:
-            self._energy = self.MAX_ENERGY
-            self.health += value - self.MAX_ENERGY
+        # Energy is clamped and the overflow or deficit applied to the capped health in one step, like
+        # OrganismStore.add_energy
+        constants = self.constants
+        store = self.store
+        index = self.store_index
+        if value < constants.min_energy:
+            store.energy[index] = constants.min_energy
+            health = store.health.item(index) + value
+        elif value > constants.max_energy:
+            store.energy[index] = constants.max_energy
+            health = store.health.item(index) + value - constants.max_energy
         else:
-            self._energy = value
+            store.energy[index] = value
+            return
+        max_health = constants.max_health
+        store.health[index] = health if health < max_health else max_health
+
+    @property
+    def attack_power(self) -> float:
+        return self.store.genes.item(self.store_index, OrganismStore.ATTACK_POWER)
+
+    @property
+    def defense(self) -> float:
+        return self.store.genes.item(self.store_index, OrganismStore.DEFENSE)
+
+    @property
+    def moisture_preference(self) -> float:
+        return self.store.genes.item(self.store_index, OrganismStore.PREFERED_MOISTURE)
+
+    @property
+    def height_preference(self) -> float:
+        return self.store.genes.item(self.store_index, OrganismStore.PREFERED_HEIGHT)
+
+    @property
+    def min_reproduction_health(self) -> float:
+        return self.store.genes.item(self.store_index, OrganismStore.MIN_REPRODUCTION_HEALTH)
+
+    @property
+    def min_reproduction_energy(self) -> float:
+        return self.store.genes.item(self.store_index, OrganismStore.MIN_REPRODUCTION_ENERGY)
+
+    @property
+    def reproduction_chance(self) -> float:
+        return self.store.genes.item(self.store_index, OrganismStore.REPRODUCTION_CHANCE)
+
+    @property
+    def energy_to_offspring_ratio(self) -> float:
+        return self.store.genes.item(self.store_index, OrganismStore.ENERGY_TO_OFFSPRING_RATIO)
 
     # endregion
 
@@ -144,20 +333,8 @@ class Organism(ABC, pygame.sprite.Sprite):
             raise ValueError("Trying to set attributes from DNA despite DNA being None")
 
         self.color: pygame.Color = self.dna.color
-        self.image.fill(self.color)
 
-        self.attack_power: float = self.dna.attack_power_gene.value
-        self.moisture_preference: float = self.dna.prefered_moisture_gene.value
-        self.height_preference: float = self.dna.prefered_height_gene.value
-        self.min_reproduction_health: float = (
-            self.dna.min_reproduction_health_gene.value
-        )
-        self.min_reproduction_energy: float = (
-            self.dna.min_reproduction_energy_gene.value
-        )
-        self.reproduction_chance: float = self.dna.reproduction_chance_gene.value
-        self.energy_to_offspring_ratio = self.dna.energy_to_offspring_ratio_gene.value
-        self.defense = self.dna.defense_gene.value
+        self.store.genes[self.store_index] = self.dna.values
 
     # endregion
 
@@ -177,12 +354,18 @@ class Organism(ABC, pygame.sprite.Sprite):
         7. Handle Movement: Handles the movement process of the organism.
         8. Post Update: Performs any post-update actions, such as checking if the organism is still alive and triggering its death if necessary.
 
+        If the phase profiler is enabled the same phases (see PhaseProfiler.PHASES) are run and timed by it instead.
+
         Parameters:
             None
 
         Returns:
             None
         """
+        if simulation.profiler.enabled:
+            simulation.profiler.profile(self)
+            return
+
         self.use_maintanance_energy()
         self.handle_aging()
         self.handle_reproduction()
@@ -221,7 +404,10 @@ class Organism(ABC, pygame.sprite.Sprite):
         Returns:
             None
         """
-        if self.can_reproduce() and random.random() <= self.reproduction_chance:
+        if (
+            self.can_reproduce()
+            and simulation.rng.random() <= self.reproduction_chance
+        ):
             self.reproduce()
 
     def handle_drowning(self):
@@ -257,29 +443,29 @@ class Organism(ABC, pygame.sprite.Sprite):
     # region tiles
     @abstractmethod
     def enter_tile(self, tile: Tile):
-        self.rect.topleft = tile.rect.topleft
+        if self._rect is not None:
+            self._rect.topleft = tile.rect.topleft
+        self.store.row[self.store_index] = tile.row
+        self.store.col[self.store_index] = tile.col
         self.tiles_visited += 1
 
     @abstractmethod
     def check_tile_assignment(self):
         pass
 
+    @abstractmethod
+    def leave_tile(self):
+        pass
+
     # endregion
 
     # region energy and health
+    # The setters and refresh_constants keep health and energy at most at their maximum, so the ratios are at most 1
     def health_ratio(self) -> float:
-        ratio = self.health / self.MAX_HEALTH
-
-        if ratio > 1:
-            raise ValueError(f"Health ratio {ratio} is bigger than 1")
-        return ratio
+        return self.store.health.item(self.store_index) / self.constants.max_health
 
     def energy_ratio(self) -> float:
-        ratio = self.energy / self.MAX_ENERGY
-
-        if ratio > 1:
-            raise ValueError(f"Energy ratio {ratio} is bigger than 1")
-        return ratio
+        return self.store.energy.item(self.store_index) / self.constants.max_energy
 
     def is_alive(self) -> bool:
         return self.health > 0
@@ -291,6 +477,23 @@ class Organism(ABC, pygame.sprite.Sprite):
         Organism.organisms_died += 1
         self.death_time = pygame.time.get_ticks()
 
+    def kill(self) -> None:
+        """
+        Remove the organism from its tile and all sprite groups and release its row in the organism store.
+
+        The organism keeps a detached copy of its last state so it can still be inspected after its death.
+
+        Returns:
+            None
+        """
+        if self.store.alive[self.store_index]:
+            self.leave_tile()
+            self.store = self.store.release(self.store_index)
+            self.store_index = 0
+        for group in self._groups:
+            group.remove_internal(self)
+        self._groups.clear()
+
     @abstractmethod
     def get_energy_maintenance(self) -> float:
         pass
@@ -324,8 +527,8 @@ class Organism(ABC, pygame.sprite.Sprite):
 
             if damage > 0:
                 self.health -= damage
-                attacking_organism.energy += damage * self.NUTRITION_FACTOR
-            elif random.random() <= 0.1:  # Counter Attack
+                attacking_organism.energy += damage * self.constants.nutrition_factor
+            elif simulation.rng.random() <= 0.1:  # Counter Attack
                 self.attack(attacking_organism)
 
     # endregion
@@ -337,15 +540,33 @@ class Organism(ABC, pygame.sprite.Sprite):
 
     def can_reproduce(self) -> bool:
         # TODO add a gene that defines these thresholds
+        store = self.store
+        index = self.store_index
+        constants = self.constants
         return (
-            self.health_ratio() >= self.min_reproduction_health
-            and self.energy_ratio() >= self.min_reproduction_energy
+            store.health.item(index) / constants.max_health
+            >= store.genes.item(index, OrganismStore.MIN_REPRODUCTION_HEALTH)
+            and store.energy.item(index) / constants.max_energy
+            >= store.genes.item(index, OrganismStore.MIN_REPRODUCTION_ENERGY)
         )
 
     @abstractmethod
-    def copy(self, tile: Tile) -> Organism:
+    def copy(self, tile: Tile, dna: DNA | None = None) -> Organism:
         self.num_offspring += 1
-        Organism.organisms_birthed += 1
+        type(self).count_births(1)
+
+    @classmethod
+    def count_births(cls, count: int) -> None:
+        """
+        Add births to the birth counters of the species, e.g. when the BirthQueue created offspring in bulk.
+
+        Parameters:
+            count (int): The number of organisms of the species that have been born.
+
+        Returns:
+            None
+        """
+        Organism.organisms_birthed += count
 
     # endregion
 
@@ -392,7 +613,7 @@ class Organism(ABC, pygame.sprite.Sprite):
             self.organisms_attacked,
             self.animals_killed,
             self.plants_killed,
-            self.parent.id if self.parent else None,
+            self.parent_id,
             self.num_offspring,
             self.color.r,
             self.color.g,
@@ -442,15 +663,7 @@ class Organism(ABC, pygame.sprite.Sprite):
         ]
 
     def save_to_csv(self):
-        file_exists = os.path.isfile(database.database_csv_filename)
-
-        try:
-            with open(database.database_csv_filename, mode="a", newline="") as file:
-                writer = csv.writer(file)
-                if not file_exists:
-                    writer.writerow(self.get_headers())
-                writer.writerow(self.get_stats())
-        except IOError as e:
-            print(f"Error writing to CSV: {e}")
+        # The record is written in a batch by the background writer, the simulation never waits for the disk
+        database.writer.submit(database.sink, self.get_headers(), self.get_stats())
 
     # endregion
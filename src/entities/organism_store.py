@@ -0,0 +1,386 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+class OrganismStore:
+    """
+    Structure-of-arrays storage for the state of all organisms in the simulation.
+
+    Every organism owns one row in the store. The per-organism state that is needed in the hot update loop is kept in
+    contiguous NumPy columns so it can be read and updated for the whole population at once. Organism instances are thin
+    views onto their row (see Organism.store and Organism.store_index).
+
+    Rows are only ever appended. Released rows are marked as not alive and are reclaimed by compact(), which moves all
+    living rows to the front and updates the indices of their views.
+
+    Attributes:
+        ANIMAL (int): Kind code for animals.
+        PLANT (int): Kind code for plants.
+        GENE_NAMES (tuple[str, ...]): The names of the gene columns, in the same order as DNA.genes.
+        INITIAL_CAPACITY (int): The number of rows allocated by default.
+        size (int): The number of rows in use (alive and released).
+        num_alive (int): The number of rows belonging to living organisms.
+        views (list): The organism viewing each row, None for released rows.
+        id, kind, row, col, health, energy, tick_age, parent_id, alive (np.ndarray): The per-organism columns.
+        genes (np.ndarray): The gene values, one row per organism and one column per gene.
+
+    Methods:
+        add(view, kind, organism_id, parent_id): Append a row for a new organism and return its index.
+        reserve(count): Make room for count more rows with at most one reallocation.
+        extend(views, columns, genes): Append the rows of many organisms at once.
+        release(index): Release the row of a dead organism and return a detached snapshot of it.
+        alive_indices(kind): Return the indices of all living rows, optionally filtered by kind.
+        compact(): Remove released rows and return the mapping from old to new indices.
+        needs_compaction(): Check if enough rows have been released to make compaction worthwhile.
+        clear(): Remove all rows.
+        add_energy(indices, amounts, min_energy, max_energy, max_health): Add energy to many rows at once.
+        gene_index(name): Return the column index of a gene.
+    """
+
+    ANIMAL: int = 0
+    PLANT: int = 1
+
+    GENE_NAMES: tuple[str, ...] = (
+        "color_r",
+        "color_g",
+        "color_b",
+        "attack_power",
+        "defense",
+        "prefered_moisture",
+        "prefered_height",
+        "mutation_chance",
+        "min_reproduction_health",
+        "min_reproduction_energy",
+        "reproduction_chance",
+        "energy_to_offspring_ratio",
+    )
+    # region gene column indices
+    COLOR_R: int = 0
+    COLOR_G: int = 1
+    COLOR_B: int = 2
+    ATTACK_POWER: int = 3
+    DEFENSE: int = 4
+    PREFERED_MOISTURE: int = 5
+    PREFERED_HEIGHT: int = 6
+    MUTATION_CHANCE: int = 7
+    MIN_REPRODUCTION_HEALTH: int = 8
+    MIN_REPRODUCTION_ENERGY: int = 9
+    REPRODUCTION_CHANCE: int = 10
+    ENERGY_TO_OFFSPRING_RATIO: int = 11
+    # endregion
+
+    INITIAL_CAPACITY: int = 1024
+
+    _COLUMN_DTYPES: dict[str, type] = {
+        "id": np.int64,
+        "kind": np.int8,
+        "row": np.int32,
+        "col": np.int32,
+        "health": np.float64,
+        "energy": np.float64,
+        "tick_age": np.int64,
+        "parent_id": np.int64,
+        "alive": np.bool_,
+    }
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        """
+        Initialize an empty OrganismStore.
+
+        Parameters:
+            capacity (int): The number of rows to allocate up front. Default is OrganismStore.INITIAL_CAPACITY.
+
+        Returns:
+            None
+        """
+        if capacity < 1:
+            raise ValueError(f"Capacity {capacity} needs to be at least 1.")
+
+        self.capacity: int = capacity
+        self.size: int = 0
+        self.num_alive: int = 0
+        self.views: list = []
+
+        self.id: np.ndarray
+        self.kind: np.ndarray
+        self.row: np.ndarray
+        self.col: np.ndarray
+        self.health: np.ndarray
+        self.energy: np.ndarray
+        self.tick_age: np.ndarray
+        self.parent_id: np.ndarray
+        self.alive: np.ndarray
+        self.genes: np.ndarray
+        self._allocate(capacity)
+
+    def __len__(self) -> int:
+        return self.num_alive
+
+    # region rows
+    def add(self, view, kind: int, organism_id: int, parent_id: int = -1) -> int:
+        """
+        Append a row for a new organism.
+
+        Health, energy, position and genes are initialised to zero and are expected to be written by the organism.
+
+        Parameters:
+            view (Organism): The organism viewing the new row.
+            kind (int): The kind of the organism (OrganismStore.ANIMAL or OrganismStore.PLANT).
+            organism_id (int): The unique id of the organism.
+            parent_id (int): The id of the parent organism or -1 if it has none. Default is -1.
+
+        Returns:
+            int: The index of the new row.
+        """
+        if self.size == self.capacity:
+            self._grow(self.capacity * 2)
+
+        index = self.size
+        self.id[index] = organism_id
+        self.kind[index] = kind
+        self.row[index] = 0
+        self.col[index] = 0
+        self.health[index] = 0
+        self.energy[index] = 0
+        self.tick_age[index] = 0
+        self.parent_id[index] = parent_id
+        self.alive[index] = True
+        self.genes[index] = 0
+
+        self.views.append(view)
+        self.size += 1
+        self.num_alive += 1
+        return index
+
+    def reserve(self, count: int) -> None:
+        """
+        Make room for count more rows, so adding them reallocates the columns at most once.
+
+        Parameters:
+            count (int): The number of rows that are about to be added.
+
+        Returns:
+            None
+        """
+        capacity = self.capacity
+        while capacity < self.size + count:
+            capacity *= 2
+        if capacity != self.capacity:
+            self._grow(capacity)
+
+    def extend(
+        self, views: list, columns: dict[str, np.ndarray], genes: np.ndarray
+    ) -> None:
+        """
+        Append the rows of many organisms at once, writing every column with a single array assignment.
+
+        The views are expected to view the new rows in order, so the first one has the current size as its index.
+
+        Parameters:
+            views (list): The organisms viewing the new rows.
+            columns (dict[str, np.ndarray]): The values of the new rows by column name. Columns that are not given are
+                set to zero, the rows are always alive.
+            genes (np.ndarray): The gene values of the new rows.
+
+        Raises:
+            ValueError: If a column or the genes do not have one value per view.
+
+        Returns:
+            None
+        """
+        count = len(views)
+        if len(genes) != count or any(
+            len(values) != count for values in columns.values()
+        ):
+            raise ValueError(
+                f"Every column needs one value for each of the {count} rows."
+            )
+
+        self.reserve(count)
+        rows = slice(self.size, self.size + count)
+        for name in self._COLUMN_DTYPES:
+            getattr(self, name)[rows] = columns.get(name, 0)
+        self.alive[rows] = True
+        self.genes[rows] = genes
+
+        self.views.extend(views)
+        self.size += count
+        self.num_alive += count
+
+    def release(self, index: int) -> OrganismStore:
+        """
+        Release the row of a dead organism.
+
+        The row is marked as not alive and stops being iterated. A detached single row copy of its values is returned so
+        the organism can still be inspected (e.g. by the stat panel or the database) after its death.
+
+        Parameters:
+            index (int): The index of the row to release.
+
+        Raises:
+            ValueError: If the row has already been released.
+
+        Returns:
+            OrganismStore: A detached store holding a copy of the row at index 0.
+        """
+        if not self.alive[index]:
+            raise ValueError(f"Row {index} has already been released.")
+
+        snapshot = OrganismStore(capacity=1)
+        for name in self._COLUMN_DTYPES:
+            getattr(snapshot, name)[0] = getattr(self, name)[index]
+        snapshot.genes[0] = self.genes[index]
+        snapshot.alive[0] = False
+        snapshot.size = 1
+        snapshot.views.append(self.views[index])
+
+        self.alive[index] = False
+        self.views[index] = None
+        self.num_alive -= 1
+        return snapshot
+
+    def alive_indices(self, kind: int | None = None) -> np.ndarray:
+        """
+        Return the indices of all living rows in insertion order.
+
+        Parameters:
+            kind (int | None): If given, only rows of this kind are returned. Default is None.
+
+        Returns:
+            np.ndarray: The indices of the matching rows.
+        """
+        mask = self.alive[: self.size]
+        if kind is not None:
+            mask = mask & (self.kind[: self.size] == kind)
+        return np.flatnonzero(mask)
+
+    def needs_compaction(self) -> bool:
+        """
+        Check if at least half of the used rows have been released.
+
+        Returns:
+            bool: True if compact() should be called.
+        """
+        return self.size >= OrganismStore.INITIAL_CAPACITY and self.num_alive * 2 <= self.size
+
+    def compact(self) -> np.ndarray:
+        """
+        Move all living rows to the front of the columns and drop the released ones.
+
+        The indices of the views are updated. Anything else that holds row indices has to be remapped with the returned
+        array.
+
+        Returns:
+            np.ndarray: For every old row index the new index, or -1 if the row was released.
+        """
+        keep = self.alive_indices()
+        remap = np.full(self.size, -1, dtype=np.int64)
+        remap[keep] = np.arange(keep.size)
+
+        for name in self._COLUMN_DTYPES:
+            column = getattr(self, name)
+            column[: keep.size] = column[keep]
+        self.genes[: keep.size] = self.genes[keep]
+        self.alive[keep.size : self.size] = False
+
+        self.views = [self.views[index] for index in keep]
+        for new_index, view in enumerate(self.views):
+            view.store_index = new_index
+
+        self.size = keep.size
+        return remap
+
+    def clear(self) -> None:
+        """
+        Remove all rows from the store.
+
+        Returns:
+            None
+        """
+        self.alive[: self.size] = False
+        self.views = []
+        self.size = 0
+        self.num_alive = 0
+
+    # endregion
+
+    # region energy and health
+    def add_energy(
+        self,
+        indices: np.ndarray,
+        amounts: np.ndarray,
+        min_energy: float,
+        max_energy: float,
+        max_health: float,
+    ) -> None:
+        """
+        Add energy to many rows at once.
+
+        This applies the same rules as the Organism.energy setter: energy is clamped to [min_energy, max_energy], energy
+        above the maximum overflows into health and a deficit below the minimum is taken from health. Health is capped at
+        max_health whenever it changes.
+
+        Parameters:
+            indices (np.ndarray): The rows to add energy to.
+            amounts (np.ndarray): The amount of energy to add to each row.
+            min_energy (float): The minimum energy of the organisms.
+            max_energy (float): The maximum energy of the organisms.
+            max_health (float): The maximum health of the organisms.
+
+        Returns:
+            None
+        """
+        energy = self.energy[indices] + amounts
+        health = self.health[indices]
+
+        below = energy < min_energy
+        above = energy > max_energy
+        health_change = np.where(below, energy, 0) + np.where(
+            above, energy - max_energy, 0
+        )
+        changed = below | above
+
+        self.health[indices] = np.where(
+            changed, np.minimum(health + health_change, max_health), health
+        )
+        self.energy[indices] = np.clip(energy, min_energy, max_energy)
+
+    # endregion
+
+    # region helpers
+    @classmethod
+    def gene_index(cls, name: str) -> int:
+        """
+        Return the column index of a gene in the genes array.
+
+        Parameters:
+            name (str): The name of the gene as listed in OrganismStore.GENE_NAMES.
+
+        Raises:
+            ValueError: If there is no gene with the given name.
+
+        Returns:
+            int: The column index of the gene.
+        """
+        try:
+            return cls.GENE_NAMES.index(name)
+        except ValueError:
+            raise ValueError(f"{name} is not a known gene.") from None
+
+    def _allocate(self, capacity: int) -> None:
+        for name, dtype in self._COLUMN_DTYPES.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.genes = np.zeros((capacity, len(self.GENE_NAMES)), dtype=np.float64)
+
+    def _grow(self, capacity: int) -> None:
+        for name, dtype in self._COLUMN_DTYPES.items():
+            column = np.zeros(capacity, dtype=dtype)
+            column[: self.size] = getattr(self, name)[: self.size]
+            setattr(self, name, column)
+        genes = np.zeros((capacity, len(self.GENE_NAMES)), dtype=np.float64)
+        genes[: self.size] = self.genes[: self.size]
+        self.genes = genes
+        self.capacity = capacity
+
+    # endregion
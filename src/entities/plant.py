@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-import random
-
+import numpy as np
 import pygame
 
 from ..settings import database, simulation
 from ..terrain.tile import Tile
 from .organism import Organism
+from .organism_store import OrganismStore
 from .properties.dna import DNA
 
 
 class Plant(Organism):
+    __slots__ = ()
+    KIND: int = OrganismStore.PLANT
     # region class settings
     _BASE_ENERGY_MAINTENANCE: float = 0
     _MAX_HEALTH: float = 50
@@ -100,28 +102,6 @@ class Plant(Organism):
     def set_starting_energy_to_offspring_ratio_range(cls, value: tuple[float, float]):
         cls._STARTING_ENERGY_TO_OFFSPRING_RATIO_RANGE = value
 
-    # endregion
-    # region class properties
-    @property
-    def MAX_HEALTH(self) -> float:
-        return Plant._MAX_HEALTH
-
-    @property
-    def MAX_ENERGY(self) -> float:
-        return Plant._MAX_ENERGY
-
-    @property
-    def NUTRITION_FACTOR(self) -> float:
-        return Plant._NUTRITION_FACTOR
-
-    @property
-    def MAX_ALPHA(self) -> float:
-        return Plant._MAX_ALPHA
-
-    @property
-    def MIN_ALPHA(self) -> float:
-        return Plant._MIN_ALPHA
-
     # endregion
     # region stats
     plants_birthed: int = 0
@@ -138,44 +118,42 @@ class Plant(Organism):
         energy: float = None,
     ):
         # region defaults
-        if not rect:
-            rect = tile.rect.copy()
         if not dna:
             dna = DNA(
                 Plant._BASE_COLOR,
-                random.uniform(
+                simulation.rng.uniform(
                     Plant._STARTING_ATTACK_POWER_RANGE[0],
                     Plant._STARTING_ATTACK_POWER_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Plant._STARTING_MOISTURE_PREFERENCE_RANGE[0],
                     Plant._STARTING_MOISTURE_PREFERENCE_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Plant._STARTING_HEIGHT_PREFERENCE_RANGE[0],
                     Plant._STARTING_HEIGHT_PREFERENCE_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Plant._STARTING_MUTATION_CHANCE_RANGE[0],
                     Plant._STARTING_MUTATION_CHANCE_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Plant._STARTING_MIN_REPRODUCTION_HEALTH_RANGE[0],
                     Plant._STARTING_MIN_REPRODUCTION_HEALTH_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Plant._STARTING_MIN_REPRODUCTION_ENERGY_RANGE[0],
                     Plant._STARTING_MIN_REPRODUCTION_ENERGY_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Plant._STARTING_REPRODUCTION_CHANCE_RANGE[0],
                     Plant._STARTING_REPRODUCTION_CHANCE_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Plant._STARTING_ENERGY_TO_OFFSPRING_RATIO_RANGE[0],
                     Plant._STARTING_ENERGY_TO_OFFSPRING_RATIO_RANGE[1],
                 ),
-                random.uniform(
+                simulation.rng.uniform(
                     Plant._STARTING_DEFENSE_RANGE[0], Plant._STARTING_DEFENSE_RANGE[1]
                 ),
             )
@@ -191,15 +169,10 @@ class Plant(Organism):
             health,
             energy,
             dna,
+            parent,
         )
-        self.image.set_alpha(100)
-        self.parent: Plant | None = parent
 
     # region main methods
-    def update(self):
-        super().update()
-        self.photosynthesise()
-
     def photosynthesise(self):
         """
         Calculate the energy gained through photosynthesis.
@@ -220,11 +193,12 @@ class Plant(Organism):
 
         4. Add the adjusted energy gain to the plant's energy.
 
-        This method is called during the plant's update process to simulate photosynthesis and increase its energy level.
+        The world does not call this for every plant but uses the batched Plant.photosynthesise_all, which applies the
+        same calculation to the whole plant population at once.
         """
         # Base photosynthesis energy calculation
         base_energy = (
-            random.random()
+            simulation.rng.random()
             * self.tile.plant_growth_potential
             * Plant._PHOTOSYNTHESIS_ENERGY_MULTIPLIER
         )
@@ -242,6 +216,67 @@ class Plant(Organism):
 
         self.energy += adjusted_energy_gain
 
+    @classmethod
+    def photosynthesise_all(
+        cls,
+        indices: np.ndarray,
+        height_map: np.ndarray,
+        moisture_map: np.ndarray,
+        growth_map: np.ndarray,
+    ) -> None:
+        """
+        Let all given plants photosynthesise at once.
+
+        This is the batched version of photosynthesise. The growth potential, height and moisture of the tiles under the
+        plants are gathered from the per-tile maps of the world, the preferences come from the gene columns of the
+        organism store and a single vectorized random draw replaces the per-plant random draw.
+
+        Parameters:
+            indices (np.ndarray): The organism store rows of the plants that photosynthesise.
+            height_map (np.ndarray): The height of every tile, indexed by (row, col).
+            moisture_map (np.ndarray): The moisture of every tile, indexed by (row, col).
+            growth_map (np.ndarray): The plant growth potential of every tile, indexed by (row, col).
+
+        Returns:
+            None
+        """
+        if indices.size == 0:
+            return
+
+        store = simulation.organism_store
+        rows = store.row[indices]
+        cols = store.col[indices]
+
+        # Base photosynthesis energy calculation
+        base_energy = (
+            simulation.np_rng.random(indices.size)
+            * growth_map[rows, cols]
+            * cls._PHOTOSYNTHESIS_ENERGY_MULTIPLIER
+        )
+
+        # Calculate the preference match
+        height_preference_match = 1 - np.abs(
+            height_map[rows, cols] - store.genes[indices, OrganismStore.PREFERED_HEIGHT]
+        )
+        moisture_preference_match = 1 - np.abs(
+            moisture_map[rows, cols]
+            - store.genes[indices, OrganismStore.PREFERED_MOISTURE]
+        )
+
+        # Combine the matches to adjust the base energy gain
+        adjusted_energy_gain = (
+            base_energy * (height_preference_match + moisture_preference_match) / 2
+        )
+
+        constants = cls.constants
+        store.add_energy(
+            indices,
+            adjusted_energy_gain,
+            constants.min_energy,
+            constants.max_energy,
+            constants.max_health,
+        )
+
     # endregion
 
     # region tile
@@ -249,7 +284,7 @@ class Plant(Organism):
         super().enter_tile(tile)
 
         if self.tile:
-            self.tile.plant.remove(self)
+            self.tile.remove_plant(self)
 
         self.tile = tile
         tile.add_plant(self)
@@ -259,9 +294,12 @@ class Plant(Organism):
     def check_tile_assignment(self):
         if not self.tile:
             raise ValueError("Plant does not have a tile!")
-        if not self.tile.plant.has(self):
+        if self.tile.plant is not self:
             raise ValueError("Plant-Tile assignment not equal.")
 
+    def leave_tile(self):
+        self.tile.remove_plant(self)
+
     # endregion
 
     # region health and energy
@@ -277,7 +315,7 @@ class Plant(Organism):
 
     def get_energy_maintenance(self) -> float:
         # TODO update this so it is different for different plants
-        return Plant._BASE_ENERGY_MAINTENANCE
+        return self.constants.energy_maintenance
 
     # endregion
 
@@ -293,26 +331,37 @@ class Plant(Organism):
     def reproduce(self):
         option = self.tile.get_random_neigbor(needs_no_plant=True, needs_no_water=True)
         if option:
-            ENERGY_TO_CHILD = self.MAX_ENERGY * self.energy_to_offspring_ratio
+            ENERGY_TO_CHILD = self.constants.max_energy * self.energy_to_offspring_ratio
             offspring_energy_distribution = (
                 0.4  # TODO add a gene that defines the energy distribution
             )
-            self.energy -= ENERGY_TO_CHILD
-            offspring = self.copy(
+            # BirthQueue takes the energy now and creates the offspring at the end of the tick
+            Organism.births.request(
+                self,
                 option,
                 health=ENERGY_TO_CHILD * offspring_energy_distribution,
                 energy=ENERGY_TO_CHILD * (1 - offspring_energy_distribution),
             )
-            simulation.organisms.add(offspring)
-            simulation.plants.add(offspring)
 
-    def copy(self, tile: Tile, health: float = None, energy: float = None):
+    def copy(
+        self,
+        tile: Tile,
+        health: float = None,
+        energy: float = None,
+        dna: DNA | None = None,
+    ):
         super().copy(tile)
-        Plant.plants_birthed += 1
 
-        copied_dna = self.dna.copy()
-        copied_dna.mutate()
+        copied_dna = dna
+        if copied_dna is None:
+            copied_dna = self.dna.copy()
+            copied_dna.mutate()
 
         return Plant(tile, parent=self, dna=copied_dna, health=health, energy=energy)
 
+    @classmethod
+    def count_births(cls, count: int) -> None:
+        super().count_births(count)
+        Plant.plants_birthed += count
+
     # endregion
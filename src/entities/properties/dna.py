@@ -1,17 +1,52 @@
 from __future__ import annotations
 
-import random
-
+import numpy as np
 import pygame
 
-from .gene import ColorComponentGene, Gene, PercentageGene
+from ...settings import simulation
+from ..organism_store import OrganismStore
+from .gene import ColorComponentGene, Gene, GeneSpec, PercentageGene
+
+
+class DNAMeta(type):
+    """
+    Metaclass of DNA, dropping the compiled schema whenever one of the gene settings is set.
+
+    The class setters, the settings menu, sweeps and checkpoints all end in an assignment to a class attribute, which is
+    intercepted here, so the schema can never get out of date (see DNA.schema). The gene settings are the numeric public
+    class attributes of the class.
+    """
+
+    def __init__(cls, name: str, bases: tuple, namespace: dict, **kwargs) -> None:
+        super().__init__(name, bases, namespace, **kwargs)
+        cls._setting_names = frozenset(
+            name
+            for name, value in namespace.items()
+            if not name.startswith("_") and isinstance(value, (int, float))
+        )
+        cls._schema = None
+
+    def __setattr__(cls, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in cls._setting_names:
+            super().__setattr__("_schema", None)
 
 
-class DNA:
+class DNA(metaclass=DNAMeta):
     """
     Class representing a DNA configuration for an organism.
 
+    All gene values are kept in one contiguous float array (values), in the order of OrganismStore.GENE_NAMES. The
+    bounds and mutation ranges of the genes are not stored per DNA: they are compiled from the gene settings below once
+    and shared as read only arrays by all DNA created until a setting changes (see schema), built from one shared
+    GeneSpec per gene kind. Changing a setting therefore only affects DNA created afterwards. The genes and
+    *_gene attributes are views on the arrays offering the Gene interface, they are only created when accessed.
+
     Attributes:
+        values (np.ndarray): The value of every gene.
+        min_values (np.ndarray): The minimum value of every gene, shared.
+        max_values (np.ndarray): The maximum value of every gene, shared.
+        mutation_ranges (np.ndarray): The mutation range of every gene, shared.
         attack_power_min (float): The minimum value for attack power.
         attack_power_max (float): The maximum value for attack power.
         attack_power_mutation_range (float): The range within which attack power can mutate.
@@ -55,8 +90,20 @@ class DNA:
 
         __init__(color, attack_power, prefered_moisture, prefered_height, mutation_chance, min_reproduction_health, min_reproduction_energy, reproduction_chance, energy_to_offspring_ratio, defense): Initialize a new DNA instance with the provided parameters.
 
+        from_values(values, mutation_ranges): Create a DNA directly from gene values.
+
+        from_values_many(values, mutation_ranges): Create many DNA at once from rows of gene values.
+
+        mutate_many(values): Mutate the gene values of many DNA at once.
+
+        schema(): Return the gene bounds and mutation ranges of the current settings.
+
         color(): Return the color represented by the RGB values stored in the genes of the DNA instance.
 
+        set_mutation_ranges(mutation_ranges): Give the DNA its own mutation ranges.
+
+        genes(): Return views on all genes.
+
         copy(): Return a new DNA instance that is a copy of the current DNA instance.
 
         mutate(): Mutate each gene in the DNA instance based on the mutation chance.
@@ -235,6 +282,239 @@ class DNA:
 
     # endregion
 
+    _schema: tuple[np.ndarray, np.ndarray, np.ndarray] | None
+
+    @classmethod
+    def schema(cls) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the gene bounds and mutation ranges of the current gene settings.
+
+        The arrays are built and validated on the first call after a setting changed (see DNAMeta) and shared by every
+        DNA created until the next change, they are read only.
+
+        Parameters:
+            None
+
+        Raises:
+            ValueError: If a maximum is smaller than its minimum, a mutation range is negative or a bound exceeds the
+                limits of the gene type.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The minimum values, maximum values and mutation ranges, in the
+                order of OrganismStore.GENE_NAMES.
+        """
+        schema = cls._schema
+        if schema is not None:
+            return schema
+
+        color = (
+            ColorComponentGene,
+            ColorComponentGene.MIN,
+            ColorComponentGene.MAX,
+            cls.color_mutation_range,
+        )
+        settings = (
+            color,
+            color,
+            color,
+            (
+                Gene,
+                cls.attack_power_min,
+                cls.attack_power_max,
+                cls.attack_power_mutation_range,
+            ),
+            (Gene, cls.defense_min, cls.defense_max, cls.defense_muation_range),
+            (
+                PercentageGene,
+                cls.prefered_moisture_min,
+                cls.prefered_moisture_max,
+                cls.prefered_moisture_muation_range,
+            ),
+            (
+                PercentageGene,
+                cls.prefered_height_min,
+                cls.prefered_height_max,
+                cls.prefered_height_muation_range,
+            ),
+            (
+                PercentageGene,
+                cls.mutation_chance_min,
+                cls.mutation_chance_max,
+                cls.mutation_chance_mutation_range,
+            ),
+            (
+                PercentageGene,
+                cls.min_reproduction_health_min,
+                cls.min_reproduction_health_max,
+                cls.min_reproduction_health_mutation_range,
+            ),
+            (
+                PercentageGene,
+                cls.min_reproduction_energy_min,
+                cls.min_reproduction_energy_max,
+                cls.min_reproduction_energy_mutation_range,
+            ),
+            (
+                PercentageGene,
+                cls.reproduction_chance_min,
+                cls.reproduction_chance_max,
+                cls.reproduction_chance_mutation_range,
+            ),
+            (
+                PercentageGene,
+                cls.energy_to_offspring_min,
+                cls.energy_to_offspring_max,
+                cls.energy_to_offspring_mutation_range,
+            ),
+        )
+        # The gene types validate the settings and share one GeneSpec per gene kind
+        specs = [
+            gene_type(
+                value=min_value,
+                max_value=max_value,
+                min_value=min_value,
+                mutation_range=mutation_range,
+            ).spec
+            for gene_type, min_value, max_value, mutation_range in settings
+        ]
+        schema = tuple(
+            np.array([getattr(spec, field) for spec in specs], dtype=np.float64)
+            for field in ("min_value", "max_value", "mutation_range")
+        )
+        for array in schema:
+            array.flags.writeable = False
+        cls._schema = schema
+        return schema
+
+    @classmethod
+    def from_values(
+        cls, values: np.ndarray, mutation_ranges: np.ndarray | None = None
+    ) -> DNA:
+        """
+        Create a DNA directly from gene values, without going through the individual gene parameters.
+
+        Parameters:
+            values (np.ndarray): The value of every gene, in the order of OrganismStore.GENE_NAMES. Values outside of
+                the bounds are clipped.
+            mutation_ranges (np.ndarray | None): The mutation range of every gene. Default is None, using the mutation
+                ranges of the current settings.
+
+        Raises:
+            ValueError: If the number of values or mutation ranges does not match the number of genes.
+
+        Returns:
+            DNA: The new DNA.
+        """
+        dna = cls.__new__(cls)
+        dna.min_values, dna.max_values, dna.mutation_ranges = cls.schema()
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape != dna.min_values.shape:
+            raise ValueError(
+                f"Expected {dna.min_values.size} gene values but got {values.shape}."
+            )
+        dna.values = np.clip(values, dna.min_values, dna.max_values)
+        dna._color = None
+        if mutation_ranges is not None:
+            dna.set_mutation_ranges(mutation_ranges)
+        return dna
+
+    @classmethod
+    def from_values_many(
+        cls, values: np.ndarray, mutation_ranges: np.ndarray | None = None
+    ) -> list[DNA]:
+        """
+        Create many DNA at once from rows of gene values, e.g. when a checkpoint is restored.
+
+        This is the batched version of from_values: the bounds are applied and the mutation ranges validated and
+        compared with the shared ones for all rows at once. Only rows whose mutation ranges differ from the current
+        settings get their own.
+
+        Parameters:
+            values (np.ndarray): The gene values, one row per DNA in the order of OrganismStore.GENE_NAMES. Values
+                outside of the bounds are clipped.
+            mutation_ranges (np.ndarray | None): The mutation ranges, one row per DNA. Default is None, using the
+                mutation ranges of the current settings.
+
+        Raises:
+            ValueError: If the shape of the values or mutation ranges does not match the number of genes or a mutation
+                range is negative.
+
+        Returns:
+            list[DNA]: The new DNA, one per row.
+        """
+        min_values, max_values, shared_ranges = cls.schema()
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 2 or values.shape[1] != min_values.size:
+            raise ValueError(
+                f"Expected rows of {min_values.size} gene values but got {values.shape}."
+            )
+        values = np.clip(values, min_values, max_values)
+
+        own = np.zeros(len(values), dtype=bool)
+        if mutation_ranges is not None:
+            mutation_ranges = np.array(mutation_ranges, dtype=np.float64)
+            if mutation_ranges.shape != values.shape:
+                raise ValueError(
+                    f"Expected mutation ranges of shape {values.shape} "
+                    f"but got {mutation_ranges.shape}."
+                )
+            if (mutation_ranges < 0).any():
+                raise ValueError("Mutation Ranges cannot be negative!")
+            own = (mutation_ranges != shared_ranges).any(axis=1)
+
+        dnas = []
+        for i, (row, has_own_ranges) in enumerate(zip(values, own.tolist())):
+            dna = cls.__new__(cls)
+            dna.min_values = min_values
+            dna.max_values = max_values
+            dna.mutation_ranges = (
+                mutation_ranges[i] if has_own_ranges else shared_ranges
+            )
+            dna.values = row
+            dna._color = None
+            dnas.append(dna)
+        return dnas
+
+    @classmethod
+    def mutate_many(cls, values: np.ndarray) -> None:
+        """
+        Mutate the gene values of many DNA at once, in place, with the mutation ranges of the current settings.
+
+        This applies the rules of mutate to every row. As the mutating genes of all rows are drawn in one batch the
+        draws come from simulation.np_rng only.
+
+        Parameters:
+            values (np.ndarray): The gene values, one row per DNA in the order of OrganismStore.GENE_NAMES.
+
+        Raises:
+            ValueError: If Gene.MUTATION_TYPE is not recognized.
+
+        Returns:
+            None
+        """
+        min_values, max_values, mutation_ranges = cls.schema()
+        mutation_chances = values[:, OrganismStore.MUTATION_CHANCE, np.newaxis]
+        mutating = simulation.np_rng.random(values.shape) <= mutation_chances
+        count = np.count_nonzero(mutating)
+        if not count:
+            return
+
+        genes = np.nonzero(mutating)[1]
+        match Gene.MUTATION_TYPE:
+            case "gauss":
+                mutation = simulation.np_rng.standard_normal(count)
+                mutation *= mutation_ranges[genes] / 3
+            case "uniform":
+                mutation = simulation.np_rng.random(count) * 2 - 1
+                mutation *= mutation_ranges[genes]
+            case _:
+                raise ValueError(f"{Gene.MUTATION_TYPE} is invalid!")
+
+        values[mutating] = np.minimum(
+            np.maximum(values[mutating] + mutation, min_values[genes]),
+            max_values[genes],
+        )
+
     def __init__(
         self,
         color: pygame.Color,
@@ -263,133 +543,278 @@ class DNA:
             energy_to_offspring_ratio (float): The energy to offspring ratio of the organism.
             defense (float): The defense of the organism.
 
+        Raises:
+            ValueError: If the current gene settings are invalid, see schema.
+
         Returns:
             None
         """
-        self.genes: list[Gene] = []
-
-        self.color_r_gene: ColorComponentGene = ColorComponentGene(
-            value=color.r, mutation_range=DNA.color_mutation_range
-        )
-        self.genes.append(self.color_r_gene)
-        self.color_g_gene: ColorComponentGene = ColorComponentGene(
-            value=color.g,
-            mutation_range=DNA.color_mutation_range,
-        )
-        self.genes.append(self.color_g_gene)
-        self.color_b_gene: ColorComponentGene = ColorComponentGene(
-            value=color.b,
-            mutation_range=DNA.color_mutation_range,
-        )
-        self.genes.append(self.color_b_gene)
-        self.attack_power_gene: Gene = Gene(
-            max_value=DNA.attack_power_max,
-            min_value=DNA.attack_power_min,
-            value=attack_power,
-            mutation_range=DNA.attack_power_mutation_range,
-        )
-        self.genes.append(self.attack_power_gene)
-        self.defense_gene: Gene = Gene(
-            max_value=DNA.defense_max,
-            min_value=DNA.defense_min,
-            value=defense,
-            mutation_range=DNA.defense_muation_range,
-        )
-        self.genes.append(self.defense_gene)
-        self.prefered_moisture_gene: PercentageGene = PercentageGene(
-            max_value=DNA.prefered_moisture_max,
-            min_value=DNA.prefered_moisture_min,
-            value=prefered_moisture,
-            mutation_range=DNA.prefered_moisture_muation_range,
-        )
-        self.genes.append(self.prefered_moisture_gene)
-        self.prefered_height_gene: PercentageGene = PercentageGene(
-            max_value=DNA.prefered_height_max,
-            min_value=DNA.prefered_height_min,
-            value=prefered_height,
-            mutation_range=DNA.prefered_height_muation_range,
+        self.min_values: np.ndarray
+        self.max_values: np.ndarray
+        self.mutation_ranges: np.ndarray
+        self.min_values, self.max_values, self.mutation_ranges = DNA.schema()
+        self.values: np.ndarray = np.clip(
+            np.array(
+                (
+                    color.r,
+                    color.g,
+                    color.b,
+                    attack_power,
+                    defense,
+                    prefered_moisture,
+                    prefered_height,
+                    muation_chance,
+                    min_reproduction_health,
+                    min_reproduction_energy,
+                    reproduction_chance,
+                    energy_to_offspring_ratio,
+                ),
+                dtype=np.float64,
+            ),
+            self.min_values,
+            self.max_values,
         )
-        self.genes.append(self.prefered_height_gene)
-        self.mutation_chance_gene: PercentageGene = PercentageGene(
-            max_value=DNA.mutation_chance_max,
-            min_value=DNA.mutation_chance_min,
-            value=muation_chance,
-            mutation_range=DNA.mutation_chance_mutation_range,
-        )
-        self.genes.append(self.mutation_chance_gene)
-        self.min_reproduction_health_gene: PercentageGene = PercentageGene(
-            max_value=DNA.min_reproduction_health_max,
-            min_value=DNA.min_reproduction_health_min,
-            value=min_reproduction_health,
-            mutation_range=DNA.min_reproduction_health_mutation_range,
-        )
-        self.genes.append(self.min_reproduction_health_gene)
-        self.min_reproduction_energy_gene: PercentageGene = PercentageGene(
-            max_value=DNA.min_reproduction_energy_max,
-            min_value=DNA.min_reproduction_energy_min,
-            value=min_reproduction_energy,
-            mutation_range=DNA.min_reproduction_energy_mutation_range,
-        )
-        self.genes.append(self.min_reproduction_energy_gene)
-        self.reproduction_chance_gene: PercentageGene = PercentageGene(
-            max_value=DNA.reproduction_chance_max,
-            min_value=DNA.reproduction_chance_min,
-            value=reproduction_chance,
-            mutation_range=DNA.reproduction_chance_mutation_range,
-        )
-        self.genes.append(self.reproduction_chance_gene)
-        self.energy_to_offspring_ratio_gene: PercentageGene = PercentageGene(
-            max_value=DNA.energy_to_offspring_max,
-            min_value=DNA.energy_to_offspring_min,
-            value=energy_to_offspring_ratio,
-            mutation_range=DNA.energy_to_offspring_mutation_range,
-        )
-        self.genes.append(self.energy_to_offspring_ratio_gene)
+        self._color: pygame.Color | None = None
+
+    # region genes
+    def set_mutation_ranges(self, mutation_ranges: np.ndarray) -> None:
+        """
+        Give this DNA its own mutation ranges instead of the shared ones of the settings. Ranges equal to the
+        current ones are ignored so the shared array stays in use.
+
+        Parameters:
+            mutation_ranges (np.ndarray): The mutation range of every gene.
+
+        Raises:
+            ValueError: If the number of mutation ranges does not match the number of genes or a range is negative.
+
+        Returns:
+            None
+        """
+        mutation_ranges = np.array(mutation_ranges, dtype=np.float64)
+        if mutation_ranges.shape != self.values.shape:
+            raise ValueError(
+                f"Expected {self.values.size} mutation ranges "
+                f"but got {mutation_ranges.shape}."
+            )
+        if (mutation_ranges < 0).any():
+            raise ValueError(f"Mutation Ranges {mutation_ranges} cannot be negative!")
+        if np.array_equal(mutation_ranges, self.mutation_ranges):
+            return
+        self.mutation_ranges = mutation_ranges
+
+    @property
+    def genes(self) -> list[DNAGene]:
+        """
+        Return views on all genes, in the order of OrganismStore.GENE_NAMES.
+
+        Returns:
+            list[DNAGene]: The genes.
+        """
+        return [DNAGene(self, index) for index in range(self.values.size)]
+
+    color_r_gene = property(lambda self: DNAGene(self, OrganismStore.COLOR_R))
+    color_g_gene = property(lambda self: DNAGene(self, OrganismStore.COLOR_G))
+    color_b_gene = property(lambda self: DNAGene(self, OrganismStore.COLOR_B))
+    attack_power_gene = property(
+        lambda self: DNAGene(self, OrganismStore.ATTACK_POWER)
+    )
+    defense_gene = property(lambda self: DNAGene(self, OrganismStore.DEFENSE))
+    prefered_moisture_gene = property(
+        lambda self: DNAGene(self, OrganismStore.PREFERED_MOISTURE)
+    )
+    prefered_height_gene = property(
+        lambda self: DNAGene(self, OrganismStore.PREFERED_HEIGHT)
+    )
+    mutation_chance_gene = property(
+        lambda self: DNAGene(self, OrganismStore.MUTATION_CHANCE)
+    )
+    min_reproduction_health_gene = property(
+        lambda self: DNAGene(self, OrganismStore.MIN_REPRODUCTION_HEALTH)
+    )
+    min_reproduction_energy_gene = property(
+        lambda self: DNAGene(self, OrganismStore.MIN_REPRODUCTION_ENERGY)
+    )
+    reproduction_chance_gene = property(
+        lambda self: DNAGene(self, OrganismStore.REPRODUCTION_CHANCE)
+    )
+    energy_to_offspring_ratio_gene = property(
+        lambda self: DNAGene(self, OrganismStore.ENERGY_TO_OFFSPRING_RATIO)
+    )
+
+    # endregion
 
     @property
     def color(self) -> pygame.Color:
         """
         Return the color represented by the RGB values stored in the genes of the DNA instance.
 
+        The color is created once and reused until a color gene changes, it must not be modified.
+
         Returns:
             pygame.Color: The color represented by the RGB values stored in the genes.
         """
-        return pygame.Color(
-            int(self.color_r_gene.value),
-            int(self.color_g_gene.value),
-            int(self.color_b_gene.value),
-        )
+        if self._color is None:
+            self._color = pygame.Color(
+                int(self.values[OrganismStore.COLOR_R]),
+                int(self.values[OrganismStore.COLOR_G]),
+                int(self.values[OrganismStore.COLOR_B]),
+            )
+        return self._color
 
     def copy(self) -> DNA:
         """
         Return a new DNA instance that is a copy of the current DNA instance.
 
+        Like a newly created DNA the copy uses the bounds and mutation ranges of the current settings.
+
         Returns:
             DNA: A new DNA instance that is an exact copy of the current DNA instance, with the same gene values.
         """
-        return DNA(
-            self.color,
-            self.attack_power_gene.value,
-            self.prefered_moisture_gene.value,
-            self.prefered_height_gene.value,
-            self.mutation_chance_gene.value,
-            self.min_reproduction_health_gene.value,
-            self.min_reproduction_energy_gene.value,
-            self.reproduction_chance_gene.value,
-            self.energy_to_offspring_ratio_gene.value,
-            self.defense_gene.value,
+        copied = DNA.__new__(DNA)
+        copied.min_values, copied.max_values, copied.mutation_ranges = DNA.schema()
+        same_bounds = (
+            copied.max_values is self.max_values and copied.min_values is self.min_values
         )
+        if same_bounds:
+            copied.values = self.values.copy()
+        else:
+            copied.values = np.clip(self.values, copied.min_values, copied.max_values)
+        copied._color = self._color
+        return copied
 
     def mutate(self) -> None:
         """
         Mutates each gene in the DNA instance based on the mutation chance.
 
-        For each gene in the list of genes:
-            - If the mutation chance is greater than a random value between 0 and 1, the gene will mutate.
+        For each gene a random value between 0 and 1 is drawn, if the mutation chance is greater or equal the gene
+        mutates. All mutating genes are changed at once by a draw of the Gene.MUTATION_TYPE distribution scaled by
+        their mutation range and clipped to their bounds. Like in mutate_many all draws come from simulation.np_rng.
+
+        Raises:
+            ValueError: If Gene.MUTATION_TYPE is not recognized.
+
+        Returns:
+            None
+        """
+        values = self.values
+        mutating = (
+            simulation.np_rng.random(values.size)
+            <= values.item(OrganismStore.MUTATION_CHANCE)
+        )
+        count = np.count_nonzero(mutating)
+        if not count:
+            return
+
+        mutation_ranges = self.mutation_ranges[mutating]
+        match Gene.MUTATION_TYPE:
+            case "gauss":
+                mutation = simulation.np_rng.standard_normal(count)
+                mutation *= mutation_ranges / 3
+            case "uniform":
+                mutation = simulation.np_rng.random(count) * 2 - 1
+                mutation *= mutation_ranges
+            case _:
+                raise ValueError(f"{Gene.MUTATION_TYPE} is invalid!")
+
+        values[mutating] = np.minimum(
+            np.maximum(values[mutating] + mutation, self.min_values[mutating]),
+            self.max_values[mutating],
+        )
+        self._color = None
+
+
+class DNAGene:
+    """
+    View on a single gene of a DNA, offering the interface of Gene on top of the arrays of the DNA.
+
+    Attributes:
+        dna (DNA): The DNA of the gene.
+        index (int): The index of the gene in the arrays of the DNA.
+
+    Methods:
+        spec(): Get the shared GeneSpec of the bounds and mutation range of the gene.
+        value(): Get or set the value of the gene, clamped to its bounds.
+        copy(): Create a standalone Gene with the values of this gene.
+        mutate(): Mutate the value of the gene.
+    """
+
+    __slots__ = ("dna", "index")
+
+    def __init__(self, dna: DNA, index: int) -> None:
+        """
+        Initialize a view on a gene of a DNA.
+
+        Parameters:
+            dna (DNA): The DNA of the gene.
+            index (int): The index of the gene in the arrays of the DNA.
+
+        Returns:
+            None
+        """
+        self.dna: DNA = dna
+        self.index: int = index
+
+    @property
+    def value(self) -> float:
+        return self.dna.values.item(self.index)
+
+    @value.setter
+    def value(self, value: float) -> None:
+        if value >= self._max_value:
+            value = self._max_value
+        elif value <= self._min_value:
+            value = self._min_value
+        self.dna.values[self.index] = value
+        self.dna._color = None
+
+    @property
+    def spec(self) -> GeneSpec:
+        return GeneSpec.get(self._max_value, self._min_value, self._mutation_range)
+
+    @property
+    def _max_value(self) -> float:
+        return self.dna.max_values.item(self.index)
+
+    @property
+    def _min_value(self) -> float:
+        return self.dna.min_values.item(self.index)
+
+    @property
+    def _mutation_range(self) -> float:
+        return self.dna.mutation_ranges.item(self.index)
+
+    @_mutation_range.setter
+    def _mutation_range(self, mutation_range: float) -> None:
+        mutation_ranges = self.dna.mutation_ranges.copy()
+        mutation_ranges[self.index] = mutation_range
+        self.dna.set_mutation_ranges(mutation_ranges)
+
+    def copy(self) -> Gene:
+        """
+        Creates a standalone Gene with the bounds, value and mutation range of this gene.
+
+        Returns:
+            Gene: The new Gene.
+        """
+        return Gene.from_spec(self.spec, self.value)
+
+    def mutate(self) -> None:
+        """
+        Mutates the value of the gene like Gene.mutate.
+
+        Raises:
+            ValueError: If Gene.MUTATION_TYPE is not recognized.
 
         Returns:
             None
         """
-        for gene in self.genes:
-            if self.mutation_chance_gene.value >= random.random():
-                gene.mutate()
+        mutation_range = self._mutation_range
+        match Gene.MUTATION_TYPE:
+            case "gauss":
+                mutation = simulation.rng.gauss(0, mutation_range / 3)
+            case "uniform":
+                mutation = simulation.rng.uniform(-mutation_range, mutation_range)
+            case _:
+                raise ValueError(f"{Gene.MUTATION_TYPE} is invalid!")
+        self.value += mutation
@@ -1,16 +1,101 @@
 from __future__ import annotations
 
-import random
-
 import pygame_menu
 
+from ...settings import simulation
+
+
+class GeneSpec:
+    """
+    Immutable specification of a gene kind: its bounds and mutation range.
+
+    Specifications are flyweights, get returns the same object for the same bounds and mutation range, so all genes of
+    a kind share one specification and a gene only stores its value and a reference to it.
+
+    Attributes:
+        max_value (float): The maximum value of the genes.
+        min_value (float): The minimum value of the genes.
+        mutation_range (float): The range within which the values of the genes can mutate.
+
+    Methods:
+        get(max_value, min_value, mutation_range): Return the shared specification for the given values.
+    """
+
+    __slots__ = ("max_value", "min_value", "mutation_range")
+    _specs: dict[tuple[float, float, float], GeneSpec] = {}
+
+    @classmethod
+    def get(
+        cls, max_value: float, min_value: float, mutation_range: float
+    ) -> GeneSpec:
+        """
+        Return the shared specification for the given bounds and mutation range, creating it on first use.
+
+        Parameters:
+            max_value (float): The maximum value of the genes.
+            min_value (float): The minimum value of the genes.
+            mutation_range (float): The range within which the values of the genes can mutate.
+
+        Raises:
+            ValueError: If max_value is less than min_value or if mutation_range is negative.
+
+        Returns:
+            GeneSpec: The specification.
+        """
+        key = (max_value, min_value, mutation_range)
+        spec = cls._specs.get(key)
+        if spec is None:
+            spec = cls(max_value, min_value, mutation_range)
+            cls._specs[key] = spec
+        return spec
+
+    def __init__(
+        self, max_value: float, min_value: float, mutation_range: float
+    ) -> None:
+        """
+        Initialize a GeneSpec. Use get to share specifications.
+
+        Parameters:
+            max_value (float): The maximum value of the genes.
+            min_value (float): The minimum value of the genes.
+            mutation_range (float): The range within which the values of the genes can mutate.
+
+        Raises:
+            ValueError: If max_value is less than min_value or if mutation_range is negative.
+
+        Returns:
+            None
+        """
+        if max_value < min_value:
+            raise ValueError(
+                f"Max Value {max_value} needs to be bigger or equal than min value {min_value}."
+            )
+        if mutation_range < 0:
+            raise ValueError(f"Mutation Range {mutation_range} cannot be negative!")
+
+        object.__setattr__(self, "max_value", max_value)
+        object.__setattr__(self, "min_value", min_value)
+        object.__setattr__(self, "mutation_range", mutation_range)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"GeneSpec is immutable, cannot set {name}.")
+
+    def __repr__(self) -> str:
+        return (
+            f"GeneSpec(max_value={self.max_value}, min_value={self.min_value}, "
+            f"mutation_range={self.mutation_range})"
+        )
+
 
 class Gene:
     """
     Represents a generic gene with a value that can mutate within a specified range.
 
+    The bounds and the mutation range are kept in a shared GeneSpec, a gene only stores its value and its spec.
+
     Attributes:
         MUTATION_TYPE (str): The type of mutation applied to the gene, either "gauss" for Gaussian distribution mutation or "uniform" for uniform distribution mutation.
+        spec (GeneSpec): The bounds and mutation range of the gene.
 
     Methods:
         set_mutation_type(type: str) -> None:
@@ -25,6 +110,9 @@ class Gene:
         value(value: float) -> None:
             Set the current value of the gene.
 
+        from_spec(spec: GeneSpec, value: float | int) -> Gene:
+            Create a gene of a shared specification.
+
         copy() -> Gene:
             Create a copy of the current Gene instance.
 
@@ -38,6 +126,7 @@ class Gene:
         None
     """
 
+    __slots__ = ("spec", "_value")
     MUTATION_TYPE: str = "gauss"
 
     @classmethod
@@ -85,17 +174,25 @@ class Gene:
         Returns:
         - None
         """
-        if max_value < min_value:
-            raise ValueError(
-                f"Max Value {max_value} needs to be bigger or equal than min value {min_value}."
-            )
-        if mutation_range < 0:
-            raise ValueError(f"Mutation Range {mutation_range} cannot be negative!")
-
-        self._max_value: float = max_value
-        self._min_value: float = min_value
+        self.spec: GeneSpec = GeneSpec.get(max_value, min_value, mutation_range)
         self.value = value
-        self._mutation_range: float = mutation_range
+
+    @classmethod
+    def from_spec(cls, spec: GeneSpec, value: float | int) -> Gene:
+        """
+        Create a gene of a shared specification, without looking the specification up.
+
+        Parameters:
+            spec (GeneSpec): The bounds and mutation range of the gene.
+            value (float | int): The current value of the gene, clamped to the bounds.
+
+        Returns:
+            Gene: The new gene.
+        """
+        gene = cls.__new__(cls)
+        gene.spec = spec
+        gene.value = value
+        return gene
 
     @property
     def value(self) -> float:
@@ -103,13 +200,26 @@ class Gene:
 
     @value.setter
     def value(self, value: float) -> None:
-        if value >= self._max_value:
-            self._value = self._max_value
-        elif value <= self._min_value:
-            self._value = self._min_value
+        spec = self.spec
+        if value >= spec.max_value:
+            self._value = spec.max_value
+        elif value <= spec.min_value:
+            self._value = spec.min_value
         else:
             self._value = value
 
+    @property
+    def _max_value(self) -> float:
+        return self.spec.max_value
+
+    @property
+    def _min_value(self) -> float:
+        return self.spec.min_value
+
+    @property
+    def _mutation_range(self) -> float:
+        return self.spec.mutation_range
+
     def copy(self) -> Gene:
         """
         Creates a copy of the current Gene instance.
@@ -120,12 +230,7 @@ class Gene:
         Returns:
             Gene: A new Gene instance with the same maximum value, minimum value, current value, and mutation range as the original Gene instance.
         """
-        return Gene(
-            self._max_value,
-            self._min_value,
-            value=self.value,
-            mutation_range=self._mutation_range,
-        )
+        return Gene.from_spec(self.spec, self.value)
 
     def mutate(self) -> None:
         """
@@ -144,11 +249,11 @@ class Gene:
         mutation = None
         match self.MUTATION_TYPE:
             case "gauss":
-                mutation = random.gauss(
+                mutation = simulation.rng.gauss(
                     0, self._mutation_range / 3
                 )  # TODO figure if it makes sense so that most values are in the mutation range
             case "uniform":
-                mutation = random.uniform(-self._mutation_range, self._mutation_range)
+                mutation = simulation.rng.uniform(-self._mutation_range, self._mutation_range)
             case _:
                 raise ValueError(f"{self.MUTATION_TYPE} is invalid!")
 
@@ -179,6 +284,7 @@ class PercentageGene(Gene):
             None
     """
 
+    __slots__ = ()
     MAX = 1
     MIN = 0
     BASE_MUTATION_RANGE = 0.01
@@ -241,6 +347,7 @@ class ColorComponentGene(Gene):
         None
     """
 
+    __slots__ = ()
     MAX = 255
     MIN = 1
     BASE_MUTATION_RANGE = 1
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+
+class SpeciesConstants:
+    """
+    Class holding the compiled class settings of an organism species that the update loop reads.
+
+    The settings of a species are class attributes that can be changed at any time by the class setters, the settings
+    menu, sweeps and checkpoints. Instead of reading them through properties on every update they are compiled into one
+    immutable SpeciesConstants per species (see Organism.constants), which is replaced whenever one of the settings is
+    set. Hot code reads the constants of its species into locals once and only reads plain slots afterwards.
+
+    Attributes:
+        SETTINGS (dict[str, str]): The class setting every constant is compiled from, by constant name.
+        max_health (float): The maximum health of the species.
+        max_energy (float): The maximum energy of the species.
+        min_health (float): The minimum health of the species.
+        min_energy (float): The minimum energy of the species.
+        nutrition_factor (float): The share of the damage an attacker gains as energy.
+        energy_maintenance (float): The energy the species uses every tick.
+        max_alpha (float): The alpha of a drawn organism of the species.
+        min_alpha (float): The minimum alpha of a drawn organism of the species.
+
+    Methods:
+        compile(species): Compile the constants of a species from its class settings.
+    """
+
+    SETTINGS: dict[str, str] = {
+        "max_health": "_MAX_HEALTH",
+        "max_energy": "_MAX_ENERGY",
+        "min_health": "_MIN_HEALTH",
+        "min_energy": "_MIN_ENERGY",
+        "nutrition_factor": "_NUTRITION_FACTOR",
+        "energy_maintenance": "_BASE_ENERGY_MAINTENANCE",
+        "max_alpha": "_MAX_ALPHA",
+        "min_alpha": "_MIN_ALPHA",
+    }
+    __slots__ = tuple(SETTINGS)
+
+    @classmethod
+    def compile(cls, species: type) -> SpeciesConstants:
+        """
+        Compile the constants of a species from its current class settings.
+
+        Parameters:
+            species (type): The organism class to read the settings from.
+
+        Returns:
+            SpeciesConstants: The compiled constants.
+        """
+        constants = object.__new__(cls)
+        for name, setting in SpeciesConstants.SETTINGS.items():
+            object.__setattr__(constants, name, getattr(species, setting))
+        return constants
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"SpeciesConstants is immutable, cannot set {name}.")
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={getattr(self, name)}" for name in SpeciesConstants.SETTINGS
+        )
+        return f"SpeciesConstants({values})"
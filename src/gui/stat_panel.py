@@ -9,13 +9,15 @@ class StatPanel(pygame.sprite.Sprite):
 
     offset: tuple[int, int] = (20, 20)
     alpha: int = 200
-    pygame.font.init()
-    font: pygame.font.Font = pygame.font.Font(None, 20)
+    font: pygame.font.Font = None  # Created on first use so headless runs never load a font
     border_size: int = 10
     offset_between_cols: int = 20
 
     def __init__(self, headers: list[str], stats: list):
         pygame.sprite.Sprite.__init__(self)
+        if StatPanel.font is None:
+            pygame.font.init()
+            StatPanel.font = pygame.font.Font(None, 20)
         self.headers = headers
         self.stats = stats
         self.rect: pygame.Rect
@@ -1 +1 @@
-__all__ = ["direction", "formatter", "noise_function", "setting"]
+__all__ = ["database_sinks", "database_writer", "direction", "formatter", "image_cache", "noise_function", "phase_profiler", "reload_scheduler", "setting", "simplex_noise", "tick_scheduler"]
@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+import csv
+import json
+import math
+import os
+import re
+import sqlite3
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class DatabaseSink(ABC):
+    """
+    Abstract base class for the storage formats of the organism database.
+
+    A sink receives the records in batches from the DatabaseWriter, always from its background thread.
+
+    Attributes:
+        path (str): The path of the file or directory the records are written to.
+
+    Methods:
+        write(headers, rows): Append a batch of records.
+        close(): Release the resources held by the sink.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+
+    @abstractmethod
+    def write(self, headers: list[str], rows: list[list]) -> None:
+        """
+        Append a batch of records.
+
+        Parameters:
+            headers (list[str]): The column names of the records.
+            rows (list[list]): The records, one value per column.
+
+        Returns:
+            None
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Release the resources held by the sink, e.g. an open connection. Writing again reopens them.
+
+        Returns:
+            None
+        """
+        pass
+
+
+class CsvSink(DatabaseSink):
+    """
+    Sink appending the records as rows of a csv file, with the column names as header row.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self._has_header: bool = False
+
+    def write(self, headers: list[str], rows: list[list]) -> None:
+        needs_header = not self._has_header and not os.path.isfile(self.path)
+        with open(self.path, mode="a", newline="") as file:
+            writer = csv.writer(file)
+            if needs_header:
+                writer.writerow(headers)
+            writer.writerows(rows)
+        self._has_header = True
+
+
+class ColumnarSink(DatabaseSink):
+    """
+    Sink storing the records column by column in a directory.
+
+    Every batch is stored as one segment: a compressed `<column>.<segment>.npz` file per column. A `manifest.json`
+    describes the columns and segments, so readers (see load_columnar) only need to load the columns they use. Numbers
+    are stored in binary and text columns (e.g. the organism type) as small integer codes into a category list kept in
+    the manifest.
+
+    The type of every column is chosen by the first batch:
+        - text columns are stored as int16 category codes,
+        - integer columns as int64, with -1 for missing values,
+        - all other columns as float64, with NaN for missing values.
+    An integer column that later receives fractional values is stored as float64 from then on, load_columnar converts
+    its earlier segments.
+
+    The manifest is replaced after every segment, so the directory is readable at any time, even after a crash.
+    """
+
+    MANIFEST: str = "manifest.json"
+    FORMAT: str = "organism-columnar"
+    VERSION: int = 1
+    INT_NULL: int = -1
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.columns: list[dict] | None = None
+        self.segments: list[int] = []
+
+    def write(self, headers: list[str], rows: list[list]) -> None:
+        if not rows:
+            return
+
+        values = list(zip(*rows))
+        if self.columns is None:
+            self.columns = [
+                ColumnarSink._column_spec(header, column)
+                for header, column in zip(headers, values)
+            ]
+        elif [column["name"] for column in self.columns] != list(headers):
+            raise ValueError("The columns of the records changed.")
+
+        os.makedirs(self.path, exist_ok=True)
+        segment = len(self.segments)
+        for spec, column in zip(self.columns, values):
+            np.savez_compressed(
+                os.path.join(self.path, segment_filename(spec["key"], segment)),
+                values=ColumnarSink._encode(spec, column),
+            )
+        self.segments.append(len(rows))
+        self._write_manifest()
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "format": ColumnarSink.FORMAT,
+            "version": ColumnarSink.VERSION,
+            "rows": sum(self.segments),
+            "segments": self.segments,
+            "columns": self.columns,
+        }
+        path = os.path.join(self.path, ColumnarSink.MANIFEST)
+        with open(path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=4)
+        os.replace(path + ".tmp", path)
+
+    @staticmethod
+    def _column_spec(name: str, values: tuple) -> dict:
+        spec = {"name": name, "key": column_key(name)}
+        present = [value for value in values if value is not None]
+        if any(isinstance(value, str) for value in present):
+            spec.update(dtype="int16", null=ColumnarSink.INT_NULL, categories=[])
+        elif present and all(
+            isinstance(value, (int, np.integer)) for value in present
+        ):
+            spec.update(dtype="int64", null=ColumnarSink.INT_NULL)
+        else:
+            spec.update(dtype="float64", null=None)
+        return spec
+
+    @staticmethod
+    def _encode(spec: dict, values: tuple) -> np.ndarray:
+        if "categories" in spec:
+            categories: list[str] = spec["categories"]
+            codes = []
+            for value in values:
+                if value is None:
+                    codes.append(ColumnarSink.INT_NULL)
+                    continue
+                value = str(value)
+                if value not in categories:
+                    categories.append(value)
+                codes.append(categories.index(value))
+            return np.array(codes, dtype=np.int16)
+
+        if spec["dtype"] == "int64" and any(
+            isinstance(value, float) and not value.is_integer() for value in values
+        ):
+            spec["dtype"] = "float64"
+            spec["null"] = None
+        if spec["dtype"] == "int64":
+            null = ColumnarSink.INT_NULL
+            return np.array(
+                [null if value is None else value for value in values], dtype=np.int64
+            )
+        return np.array(
+            [math.nan if value is None else value for value in values],
+            dtype=np.float64,
+        )
+
+
+class SqliteSink(DatabaseSink):
+    """
+    Sink inserting the records into the `organisms` table of a SQLite database.
+
+    The table is created from the first batch, with one column per record value named by its column key (see
+    column_key) and typed INTEGER, REAL or TEXT. Indexes on the id, parent id and type columns keep lineage and filter
+    queries fast on large databases. Every batch is inserted with a single executemany in one transaction.
+    """
+
+    TABLE: str = "organisms"
+    INDEXED_COLUMNS: tuple[str, ...] = ("id", "parent_id", "type")
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.columns: list[str] | None = None
+        self._connection: sqlite3.Connection | None = None
+        self._insert: str = ""
+
+    def write(self, headers: list[str], rows: list[list]) -> None:
+        if not rows:
+            return
+
+        if self._connection is None:
+            self._connection = connect_sqlite(self.path)
+        if self.columns is None:
+            self._create_table(headers, rows)
+        elif [column_key(header) for header in headers] != self.columns:
+            raise ValueError("The columns of the records changed.")
+
+        with self._connection:
+            self._connection.executemany(self._insert, rows)
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _create_table(self, headers: list[str], rows: list[list]) -> None:
+        self.columns = [column_key(header) for header in headers]
+        definitions = [
+            f"{key} {SqliteSink._column_type(column)}"
+            for key, column in zip(self.columns, zip(*rows))
+        ]
+        with self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {SqliteSink.TABLE} ({', '.join(definitions)})"
+            )
+            for key in SqliteSink.INDEXED_COLUMNS:
+                if key in self.columns:
+                    self._connection.execute(
+                        f"CREATE INDEX IF NOT EXISTS {SqliteSink.TABLE}_{key} "
+                        f"ON {SqliteSink.TABLE} ({key})"
+                    )
+        placeholders = ", ".join("?" for _ in self.columns)
+        self._insert = (
+            f"INSERT INTO {SqliteSink.TABLE} ({', '.join(self.columns)}) "
+            f"VALUES ({placeholders})"
+        )
+
+    @staticmethod
+    def _column_type(values: tuple) -> str:
+        present = [value for value in values if value is not None]
+        if any(isinstance(value, str) for value in present):
+            return "TEXT"
+        if present and all(isinstance(value, int) for value in present):
+            return "INTEGER"
+        return "REAL"
+
+
+def connect_sqlite(path: str) -> sqlite3.Connection:
+    """
+    Open a SQLite organism database, creating the file if needed.
+
+    Write ahead logging lets the analysis read the database while the simulation is still writing to it.
+
+    Parameters:
+        path (str): The path of the database file.
+
+    Returns:
+        sqlite3.Connection: The connection.
+    """
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+def ancestors(connection: sqlite3.Connection, organism_id: int) -> list[int]:
+    """
+    Return the ids of the ancestors of an organism, starting with its parent.
+
+    Parameters:
+        connection (sqlite3.Connection): The connection to a database written by SqliteSink.
+        organism_id (int): The id of the organism.
+
+    Returns:
+        list[int]: The ids of the parent, grandparent, and so on.
+    """
+    rows = connection.execute(
+        f"""
+        WITH RECURSIVE lineage(id, parent_id, depth) AS (
+            SELECT id, parent_id, 0 FROM {SqliteSink.TABLE} WHERE id = ?
+            UNION
+            SELECT o.id, o.parent_id, lineage.depth + 1
+            FROM {SqliteSink.TABLE} o JOIN lineage ON o.id = lineage.parent_id
+        )
+        SELECT id FROM lineage WHERE depth > 0 ORDER BY depth
+        """,
+        (organism_id,),
+    )
+    return [row[0] for row in rows]
+
+
+def descendants(connection: sqlite3.Connection, organism_id: int) -> list[int]:
+    """
+    Return the ids of all descendants of an organism, generation by generation.
+
+    Parameters:
+        connection (sqlite3.Connection): The connection to a database written by SqliteSink.
+        organism_id (int): The id of the organism.
+
+    Returns:
+        list[int]: The ids of the children, grandchildren, and so on.
+    """
+    rows = connection.execute(
+        f"""
+        WITH RECURSIVE lineage(id, depth) AS (
+            SELECT ?, 0
+            UNION
+            SELECT o.id, lineage.depth + 1
+            FROM {SqliteSink.TABLE} o JOIN lineage ON o.parent_id = lineage.id
+        )
+        SELECT id FROM lineage WHERE depth > 0 ORDER BY depth, id
+        """,
+        (organism_id,),
+    )
+    return [row[0] for row in rows]
+
+
+def column_key(name: str) -> str:
+    """
+    Turn a column name into the name used for its files, e.g. "Birth time (milsec)" into "birth_time_milsec".
+
+    Parameters:
+        name (str): The column name.
+
+    Returns:
+        str: The lower case name with every run of other characters than letters and digits replaced by "_".
+    """
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+
+def segment_filename(key: str, segment: int) -> str:
+    """
+    Return the name of the file storing a segment of a column.
+
+    Parameters:
+        key (str): The key of the column.
+        segment (int): The index of the segment.
+
+    Returns:
+        str: The file name.
+    """
+    return f"{key}.{segment:05d}.npz"
+
+
+def load_manifest(path: str) -> dict:
+    """
+    Load the manifest of a columnar database.
+
+    Parameters:
+        path (str): The directory of the database.
+
+    Raises:
+        ValueError: If the directory does not contain a columnar database.
+
+    Returns:
+        dict: The manifest.
+    """
+    with open(os.path.join(path, ColumnarSink.MANIFEST), encoding="utf-8") as file:
+        manifest = json.load(file)
+    if manifest.get("format") != ColumnarSink.FORMAT:
+        raise ValueError(f"{path} does not contain a columnar organism database.")
+    return manifest
+
+
+def load_columnar(
+    path: str, columns: list[str] | None = None, decode: bool = True
+) -> dict[str, np.ndarray]:
+    """
+    Load columns of a columnar database written by ColumnarSink.
+
+    Only the files of the requested columns are read. The result can be passed directly to pandas.DataFrame.
+
+    Parameters:
+        path (str): The directory of the database.
+        columns (list[str] | None): The names or keys of the columns to load. If None all columns are loaded.
+            Default is None.
+        decode (bool): If True text columns are returned as strings, otherwise as category codes. Default is True.
+
+    Raises:
+        ValueError: If the directory does not contain a columnar database or a requested column does not exist.
+
+    Returns:
+        dict[str, np.ndarray]: The values of every requested column, by column name.
+    """
+    manifest = load_manifest(path)
+    specs = manifest["columns"]
+    if columns is not None:
+        by_name = {spec["name"]: spec for spec in specs}
+        by_name.update({spec["key"]: spec for spec in specs})
+        missing = [column for column in columns if column not in by_name]
+        if missing:
+            raise ValueError(f"Unknown columns: {', '.join(missing)}.")
+        specs = [by_name[column] for column in columns]
+
+    data = {}
+    for spec in specs:
+        segments = []
+        for segment in range(len(manifest["segments"])):
+            filename = os.path.join(path, segment_filename(spec["key"], segment))
+            with np.load(filename) as archive:
+                segments.append(archive["values"])
+        if spec["dtype"] == "float64":
+            # Segments written before an integer column got fractional values
+            segments = [
+                np.where(segment == ColumnarSink.INT_NULL, np.nan, segment)
+                if segment.dtype.kind == "i"
+                else segment
+                for segment in segments
+            ]
+        values = (
+            np.concatenate(segments) if segments else np.empty(0, dtype=spec["dtype"])
+        )
+        if decode and "categories" in spec:
+            categories = np.array(spec["categories"] + [""])
+            # Missing values (-1) index the trailing empty string
+            values = categories[values]
+        data[spec["name"]] = values
+    return data
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import atexit
+import queue
+import threading
+import time
+
+from .database_sinks import DatabaseSink
+
+
+class DatabaseWriter:
+    """
+    Class writing database records in batches from a background thread.
+
+    The simulation thread only puts records into a queue, which never blocks. A background thread collects them and
+    hands them in batches to their sinks (see DatabaseSink), so every file is opened once per batch instead of once per
+    record. flush() waits until every
+    record submitted so far has been written, it is called when the simulation is paused, cleared or quit.
+
+    Attributes:
+        batch_size (int): The number of records after which a batch is written.
+        flush_interval (float): The number of seconds after which a started batch is written even if it is not full.
+        records_written (int): The number of records written so far.
+
+    Methods:
+        submit(sink, headers, row): Queue a record to be written to a sink.
+        flush(timeout): Wait until all submitted records have been written.
+        close(timeout): Flush, close all sinks and stop the background thread.
+    """
+
+    DEFAULT_BATCH_SIZE: int = 1024
+    DEFAULT_FLUSH_INTERVAL: float = 1.0
+    _STOP: object = object()
+
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        """
+        Initialize a DatabaseWriter. The background thread is only started with the first record.
+
+        Parameters:
+            batch_size (int): The number of records after which a batch is written. Default is DEFAULT_BATCH_SIZE.
+            flush_interval (float): The number of seconds after which a started batch is written even if it is not full.
+                Default is DEFAULT_FLUSH_INTERVAL.
+
+        Raises:
+            ValueError: If batch_size is smaller than 1 or flush_interval is not positive.
+
+        Returns:
+            None
+        """
+        if batch_size < 1:
+            raise ValueError(f"Batch size {batch_size} needs to be at least 1.")
+        if flush_interval <= 0:
+            raise ValueError(f"Flush interval {flush_interval} needs to be positive.")
+
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.records_written: int = 0
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._registered_at_exit: bool = False
+
+    # region simulation thread
+    def submit(self, sink: DatabaseSink, headers: list[str], row: list) -> None:
+        """
+        Queue a record to be written to a sink.
+
+        Parameters:
+            sink (DatabaseSink): The sink to write the record to.
+            headers (list[str]): The column names of the record.
+            row (list): The values of the record.
+
+        Returns:
+            None
+        """
+        self._start()
+        self._queue.put((sink, headers, row))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all records submitted so far have been written.
+
+        Parameters:
+            timeout (float | None): The maximum number of seconds to wait. If None wait until done. Default is None.
+
+        Returns:
+            bool: True if all records have been written, False if the timeout passed first.
+        """
+        if self._thread is None:
+            return True
+
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Write all submitted records, close all sinks written to and stop the background thread. A later submit starts a
+        new thread.
+
+        Parameters:
+            timeout (float | None): The maximum number of seconds to wait. If None wait until done. Default is None.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._thread is None:
+                return
+            self._queue.put(DatabaseWriter._STOP)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="DatabaseWriter", daemon=True
+                )
+                self._thread.start()
+                if not self._registered_at_exit:
+                    # Records still queued when the interpreter exits are written before it does
+                    atexit.register(self.close)
+                    self._registered_at_exit = True
+
+    # endregion
+
+    # region background thread
+    def _run(self) -> None:
+        batch: list[tuple[DatabaseSink, list[str], list]] = []
+        # Sinks are closed from this thread, as some of them can only be used by the thread that opened them
+        sinks: dict[int, DatabaseSink] = {}
+        deadline = 0.0
+        while True:
+            # Without pending records wait for the next one, otherwise at most until the batch is due
+            timeout = max(deadline - time.monotonic(), 0) if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, tuple):
+                sinks.setdefault(id(item[0]), item[0])
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(item)
+                if len(batch) < self.batch_size and time.monotonic() < deadline:
+                    continue
+
+            # Full batch, flush interval passed, flush or stop requested
+            self._write(batch)
+            batch = []
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is DatabaseWriter._STOP:
+                for sink in sinks.values():
+                    sink.close()
+                return
+
+    def _write(self, batch: list[tuple[DatabaseSink, list[str], list]]) -> None:
+        if not batch:
+            return
+
+        sinks: dict[int, tuple[DatabaseSink, list[str], list[list]]] = {}
+        for sink, headers, row in batch:
+            sinks.setdefault(id(sink), (sink, headers, []))[2].append(row)
+
+        for sink, headers, rows in sinks.values():
+            try:
+                sink.write(headers, rows)
+                self.records_written += len(rows)
+            except (OSError, ValueError) as e:
+                print(f"Error writing to database {sink.path}: {e}")
+
+    # endregion
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+
+class ImageCache:
+    """
+    Class sharing filled surfaces between everything drawn in the same color.
+
+    A surface is created once per key of quantized color, alpha and size and returned for every later request with the
+    same key. Colors are quantized to multiples of quantization per channel, so the slightly different colors of
+    related organisms share one surface. When more than capacity surfaces are cached the least recently used one is
+    evicted. The returned surfaces are shared and must not be modified.
+
+    Attributes:
+        DEFAULT_CAPACITY (int): The default number of cached surfaces.
+        DEFAULT_QUANTIZATION (int): The default step the color channels are quantized to.
+        capacity (int): The maximum number of cached surfaces.
+        quantization (int): The step the color channels are quantized to.
+        hits (int): The number of requests answered from the cache.
+        misses (int): The number of requests that created a surface.
+
+    Methods:
+        get(color, alpha, size): Return the shared surface for a color, alpha and size.
+        quantize(color): Return the quantized color used as part of the key.
+        clear(): Remove all cached surfaces.
+    """
+
+    DEFAULT_CAPACITY: int = 512
+    DEFAULT_QUANTIZATION: int = 4
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        quantization: int = DEFAULT_QUANTIZATION,
+    ) -> None:
+        """
+        Initialize an empty ImageCache.
+
+        Parameters:
+            capacity (int): The maximum number of cached surfaces. Default is DEFAULT_CAPACITY.
+            quantization (int): The step the color channels are quantized to, 1 keeps colors exact. Default is
+                DEFAULT_QUANTIZATION.
+
+        Raises:
+            ValueError: If capacity or quantization is smaller than 1.
+
+        Returns:
+            None
+        """
+        if capacity < 1:
+            raise ValueError(f"Capacity {capacity} needs to be at least 1.")
+        if quantization < 1:
+            raise ValueError(f"Quantization {quantization} needs to be at least 1.")
+
+        self.capacity: int = capacity
+        self.quantization: int = quantization
+        self.hits: int = 0
+        self.misses: int = 0
+        self._images: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def get(
+        self,
+        color: tuple[int, int, int] | pygame.Color,
+        alpha: int | None,
+        size: tuple[int, int],
+    ) -> pygame.Surface:
+        """
+        Return the shared surface for a color, alpha and size, creating it if it is not cached.
+
+        Parameters:
+            color (tuple[int, int, int] | pygame.Color): The color of the surface, the alpha channel of a pygame.Color
+                is ignored.
+            alpha (int | None): The alpha of the whole surface or None for an opaque surface.
+            size (tuple[int, int]): The size of the surface.
+
+        Returns:
+            pygame.Surface: The shared surface, filled with the quantized color.
+        """
+        key = (self.quantize(color), alpha, tuple(size))
+        images = self._images
+        image = images.get(key)
+        if image is not None:
+            images.move_to_end(key)
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = pygame.Surface(key[2])
+        image.fill(key[0])
+        if alpha is not None:
+            image.set_alpha(alpha)
+        images[key] = image
+        if len(images) > self.capacity:
+            images.popitem(last=False)
+        return image
+
+    def quantize(
+        self, color: tuple[int, int, int] | pygame.Color
+    ) -> tuple[int, int, int]:
+        """
+        Return the quantized color used as part of the key, every channel rounded down to a multiple of quantization.
+
+        Parameters:
+            color (tuple[int, int, int] | pygame.Color): The color to quantize.
+
+        Returns:
+            tuple[int, int, int]: The quantized color.
+        """
+        step = self.quantization
+        r, g, b = color[0], color[1], color[2]
+        if step == 1:
+            return (r, g, b)
+        return (r // step * step, g // step * step, b // step * step)
+
+    def clear(self) -> None:
+        """
+        Remove all cached surfaces.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self._images.clear()
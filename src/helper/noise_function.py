@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import opensimplex
 import pygame
 import pygame_menu
 
+from . import simplex_noise
 from .setting import BoundedSetting, Setting
 
 
@@ -32,6 +34,10 @@ class NoiseFunction:
             Calculate the transformed coordinates based on the input x and y values.
         noise(self, x: float, y: float) -> float:
             Calculate the noise value at the given coordinates using Perlin noise.
+        function_array(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            Calculate the transformed coordinates for arrays of x and y values.
+        noise_array(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+            Calculate the noise values for every combination of the given x and y coordinates.
         add_submenu(self, menu: pygame_menu.Menu, add_randomiser=False) -> pygame_menu.Menu:
             Add a submenu to the specified menu for the NoiseFunction instance.
         randomise(self) -> None:
@@ -40,6 +46,8 @@ class NoiseFunction:
             Normalize the input value to the range [0, 1] using a linear transformation.
         weigh(cls, x: float, y: float, functions: list[NoiseFunction], weights: list[float] = None) -> float:
             Calculate the weighted average of noise values generated by multiple NoiseFunction instances.
+        weigh_array(cls, x: np.ndarray, y: np.ndarray, functions: list[NoiseFunction], weights: list[float] = None) -> np.ndarray:
+            Calculate the weighted average of noise values over a whole coordinate grid.
 
     Raises:
         ValueError: If the noise value is not within the range [0, 1].
@@ -234,6 +242,65 @@ class NoiseFunction:
             raise ValueError(f"noise value not in range [0, 1] {value}")
         return value
 
+    def function_array(
+        self, x: np.ndarray, y: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate the transformed coordinates for arrays of x and y values.
+
+        This is the array version of function. The x transformation only depends on x and the y transformation only on y,
+        so the coordinates of a grid only need to be transformed once per column and once per row.
+        Values for which the power is not defined are left untransformed, just like in function.
+
+        Parameters:
+        x (np.ndarray): The x-coordinate values.
+        y (np.ndarray): The y-coordinate values.
+
+        Returns:
+        tuple[np.ndarray, np.ndarray]: A tuple containing the transformed x and y coordinates.
+        """
+        _x = np.asarray(x, dtype=np.float64) * self.factor_x._value
+        _y = np.asarray(y, dtype=np.float64) * self.factor_y._value
+
+        _x = NoiseFunction._pow_array(_x, self.pow_x._value)
+        _y = NoiseFunction._pow_array(_y, self.pow_y._value)
+
+        _x += self.offset_x._value
+        _y += self.offset_y._value
+
+        return _x, _y
+
+    def noise_array(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Calculate the noise values for every combination of the given x and y coordinates.
+
+        This is the array version of noise and returns the same values for every grid point.
+
+        Parameters:
+        x (np.ndarray): The x-coordinate values of the grid columns.
+        y (np.ndarray): The y-coordinate values of the grid rows.
+
+        Returns:
+        np.ndarray: The noise values of shape (y.size, x.size), normalized to the range [0, 1].
+        """
+        _x, _y = self.function_array(x, y)
+        _noise = simplex_noise.noise2array(_x, _y)
+        _noise = NoiseFunction._normalise_array(_noise)
+        _noise *= self.fudge._value
+        value = NoiseFunction._pow_array(_noise, self.pow._value)
+
+        return np.clip(value, 0, 1)
+
+    @staticmethod
+    def _pow_array(values: np.ndarray, exponent: float) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            powered = np.power(values, exponent)
+        undefined = ~np.isfinite(powered) & np.isfinite(values)
+        if undefined.any():
+            print("math domain error!")
+            powered[undefined] = values[undefined]
+        return powered
+
     def add_submenu(
         self, menu: pygame_menu.Menu, add_randomiser=False
     ) -> pygame_menu.Menu:
@@ -309,6 +376,15 @@ class NoiseFunction:
             raise ValueError(f"noise value not in range [0, 1] {value}")
         return value
 
+    @classmethod
+    def _normalise_array(cls, values: np.ndarray) -> np.ndarray:
+        values = (values + 1) / 2
+        if values.size and not (0 <= values.min() and values.max() <= 1):
+            raise ValueError(
+                f"noise value not in range [0, 1] {values.min()} {values.max()}"
+            )
+        return values
+
     @classmethod
     def weigh(
         cls,
@@ -351,3 +427,50 @@ class NoiseFunction:
             raise ValueError(f"noise value not in range [0, 1] {value}")
 
         return value
+
+    @classmethod
+    def weigh_array(
+        cls,
+        x: np.ndarray,
+        y: np.ndarray,
+        functions: list[NoiseFunction],
+        weights: list[float] = None,
+    ) -> np.ndarray:
+        """
+        Calculate the weighted average of noise values generated by multiple NoiseFunction instances over a coordinate grid.
+
+        This is the array version of weigh and returns the same values for every grid point.
+
+        Parameters:
+        x (np.ndarray): The x-coordinate values of the grid columns.
+        y (np.ndarray): The y-coordinate values of the grid rows.
+        functions (list[NoiseFunction]): A list of NoiseFunction instances to calculate noise values from.
+        weights (list[float], optional): A list of weights corresponding to each NoiseFunction instance. If not provided, defaults to "NoiseFunction.DEFAULT_WEIGHT" for all functions missing weights.
+
+        Returns:
+        np.ndarray: The weighted average noise values of shape (y.size, x.size), normalized to the range [0, 1].
+
+        Raises:
+        ValueError: If the list of functions is empty or if a resulting noise value is not within the range [0, 1].
+        """
+        if not functions:
+            raise ValueError("The list of functions cannot be empty.")
+
+        if not weights:
+            weights = []
+        while len(weights) < len(functions):
+            weights.append(cls.DEFAULT_WEIGHT)
+
+        total_noise = np.zeros((np.size(y), np.size(x)))
+        weight_sum = 0
+        for function, weight in zip(functions, weights):
+            total_noise += function.noise_array(x, y) * weight
+            weight_sum += weight
+        value = total_noise / weight_sum
+
+        if value.size and not (0 <= value.min() and value.max() <= 1):
+            raise ValueError(
+                f"noise value not in range [0, 1] {value.min()} {value.max()}"
+            )
+
+        return value
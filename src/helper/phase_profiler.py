@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import time
+
+
+class PhaseProfiler:
+    """
+    Class accumulating the wall time and call counts of the phases of Organism.update.
+
+    The profiler is opt-in: while it is disabled Organism.update only checks the enabled flag and runs its phases
+    directly. When enabled every phase is timed and the times are accumulated per organism kind. Every interval ticks
+    the accumulated numbers are closed into a window (see last_window), optionally printed as a log line, and the
+    accumulation starts over.
+
+    Attributes:
+        PHASES (tuple[str, ...]): The names of the phases in the order they are run.
+        KIND_NAMES (tuple[str, ...]): The names of the organism kinds, indexed by kind code.
+        enabled (bool): If True the phases are timed.
+        interval (int): The number of ticks of a window.
+        log (bool): If True every window is printed as a log line.
+        seconds (list[list[float]]): The accumulated seconds of the current window, indexed by [kind][phase].
+        calls (list[int]): The accumulated calls of the current window, indexed by kind.
+        ticks (int): The number of ticks of the current window.
+        last_window (dict | None): The report of the last closed window, see report.
+
+    Methods:
+        set_enabled(enabled): Enable or disable timing.
+        profile(organism): Run and time the phases of an organism update.
+        tick(age): Count a world tick and close the window every interval ticks.
+        report(): Get the per tick numbers of the current window.
+        format_report(report): Format a report as a single log line.
+        reset(): Forget the current window.
+    """
+
+    PHASES: tuple[str, ...] = (
+        "use_maintanance_energy",
+        "handle_aging",
+        "handle_reproduction",
+        "handle_drowning",
+        "think",
+        "handle_attack",
+        "handle_movement",
+        "_post_update",
+    )
+    KIND_NAMES: tuple[str, ...] = ("Animal", "Plant")
+    DEFAULT_INTERVAL: int = 100
+
+    def __init__(
+        self, enabled: bool = False, interval: int = DEFAULT_INTERVAL, log: bool = False
+    ) -> None:
+        """
+        Initialize a PhaseProfiler with an empty window.
+
+        Parameters:
+            enabled (bool): If True the phases are timed. Default is False.
+            interval (int): The number of ticks of a window. Default is DEFAULT_INTERVAL.
+            log (bool): If True every window is printed as a log line. Default is False.
+
+        Raises:
+            ValueError: If interval is smaller than 1.
+
+        Returns:
+            None
+        """
+        if interval < 1:
+            raise ValueError(f"Interval {interval} needs to be at least 1.")
+
+        self.enabled: bool = enabled
+        self.interval: int = interval
+        self.log: bool = log
+        self.seconds: list[list[float]]
+        self.calls: list[int]
+        self.ticks: int
+        self.last_window: dict | None = None
+        self.reset()
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Enable or disable timing. Enabling starts a new window.
+
+        Parameters:
+            enabled (bool): If True the phases are timed.
+
+        Returns:
+            None
+        """
+        if enabled and not self.enabled:
+            self.reset()
+            self.last_window = None
+        self.enabled = enabled
+
+    def profile(self, organism) -> None:
+        """
+        Run the phases of an organism update and add their times to the current window.
+
+        Parameters:
+            organism (Organism): The organism to update.
+
+        Returns:
+            None
+        """
+        seconds = self.seconds[organism.KIND]
+        clock = time.perf_counter
+        start = clock()
+        for phase, name in enumerate(PhaseProfiler.PHASES):
+            getattr(organism, name)()
+            now = clock()
+            seconds[phase] += now - start
+            start = now
+        self.calls[organism.KIND] += 1
+
+    def tick(self, age: int) -> None:
+        """
+        Count a world tick. Every interval ticks the current window is closed and a new one is started.
+
+        Parameters:
+            age (int): The age of the world after the tick, used in the log line.
+
+        Returns:
+            None
+        """
+        self.ticks += 1
+        if self.ticks < self.interval:
+            return
+
+        self.last_window = self.report()
+        self.last_window["age"] = age
+        if self.log:
+            print(PhaseProfiler.format_report(self.last_window))
+        self.reset()
+
+    def report(self) -> dict:
+        """
+        Get the per tick numbers of the current window.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: The number of ticks, and for every kind name the updates per tick and the milliseconds per tick of
+                every phase and in total.
+        """
+        ticks = max(self.ticks, 1)
+        report = {"ticks": self.ticks}
+        for kind, name in enumerate(PhaseProfiler.KIND_NAMES):
+            milliseconds = [seconds * 1000 / ticks for seconds in self.seconds[kind]]
+            report[name] = {
+                "updates": self.calls[kind] / ticks,
+                "phases": dict(zip(PhaseProfiler.PHASES, milliseconds)),
+                "total": sum(milliseconds),
+            }
+        return report
+
+    @staticmethod
+    def format_report(report: dict) -> str:
+        """
+        Format a report as a single log line, listing the phases of every updated kind from the slowest to the fastest.
+
+        Parameters:
+            report (dict): The report, as returned by report.
+
+        Returns:
+            str: The log line.
+        """
+        parts = [f"Phases at tick {report.get('age', '?')} over {report['ticks']} ticks"]
+        for name in PhaseProfiler.KIND_NAMES:
+            kind = report[name]
+            if not kind["updates"]:
+                continue
+            phases = sorted(kind["phases"].items(), key=lambda item: -item[1])
+            total = kind["total"] or 1
+            phase_texts = ", ".join(
+                f"{phase} {ms:.2f}ms ({ms / total:.0%})" for phase, ms in phases
+            )
+            parts.append(
+                f"{name} {kind['total']:.2f}ms/tick for {kind['updates']:.0f} updates: "
+                f"{phase_texts}"
+            )
+        return " | ".join(parts)
+
+    def reset(self) -> None:
+        """
+        Forget the numbers of the current window.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self.seconds = [
+            [0.0] * len(PhaseProfiler.PHASES) for _ in PhaseProfiler.KIND_NAMES
+        ]
+        self.calls = [0] * len(PhaseProfiler.KIND_NAMES)
+        self.ticks = 0
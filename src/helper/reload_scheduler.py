@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import Callable
+
+
+class ReloadScheduler:
+    """
+    Class coalescing many reload requests into a single reload.
+
+    Settings call request() whenever their value changes, e.g. for every intermediate value while a slider is dragged.
+    This only marks the reload as pending. The owner of the main loop calls flush() once per frame, which runs the reload
+    at most once with the newest values. A request arriving before the pending reload has run supersedes it, so stale
+    values are never regenerated.
+
+    Attributes:
+        reload (Callable[[], None]): The method doing the actual reload.
+        generation (int): The number of requests made so far.
+        reloaded_generation (int): The generation of the last request a reload has been run for.
+
+    Methods:
+        request(): Mark a reload as pending.
+        flush(): Run the pending reload, if there is one.
+        discard(): Forget about the pending reload.
+        pending(): Check if a reload is pending.
+    """
+
+    def __init__(self, reload: Callable[[], None]) -> None:
+        """
+        Initialize a ReloadScheduler without any pending reload.
+
+        Parameters:
+            reload (Callable[[], None]): The method doing the actual reload.
+
+        Raises:
+            ValueError: If reload is not callable.
+
+        Returns:
+            None
+        """
+        if not callable(reload):
+            raise ValueError("reload must be callable.")
+
+        self.reload: Callable[[], None] = reload
+        self.generation: int = 0
+        self.reloaded_generation: int = 0
+
+    def request(self) -> None:
+        """
+        Mark a reload as pending. Superseeds any reload that has been requested but not run yet.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self.generation += 1
+
+    def flush(self) -> bool:
+        """
+        Run the pending reload, if there is one.
+
+        Parameters:
+            None
+
+        Returns:
+            bool: True if a reload has been run.
+        """
+        if not self.pending():
+            return False
+
+        self.reloaded_generation = self.generation
+        self.reload()
+        return True
+
+    def discard(self) -> None:
+        """
+        Forget about the pending reload, e.g. because the owner reloaded directly with the newest values.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self.reloaded_generation = self.generation
+
+    def pending(self) -> bool:
+        """
+        Check if a reload has been requested since the last one was run.
+
+        Parameters:
+            None
+
+        Returns:
+            bool: True if a reload is pending.
+        """
+        return self.generation != self.reloaded_generation
@@ -1,8 +1,9 @@
-import random
 from abc import ABC, abstractmethod
 
 import pygame_menu
 
+from ..settings import simulation
+
 
 class Setting(ABC):
     """
@@ -206,9 +207,9 @@ class BoundedSetting(Setting):
             None
         """
         if type == "uniform":
-            self.set_value(random.uniform(self._min, self._max))
+            self.set_value(simulation.rng.uniform(self._min, self._max))
         elif type == "gauss":
-            self.set_value(random.gauss(self._mid, self._mid / 2))
+            self.set_value(simulation.rng.gauss(self._mid, self._mid / 2))
         else:
             raise ValueError("Type not defined")
         if self.widget:
@@ -309,9 +310,9 @@ class UnboundedSetting(Setting):
         """
         # TODO think of the best way to randomise an unbounded value
         if type == "uniform":
-            self.set_value(random.uniform(0, (self._value + 1) * 2))
+            self.set_value(simulation.rng.uniform(0, (self._value + 1) * 2))
         elif type == "gauss":
-            self.set_value(random.gauss(self._value))
+            self.set_value(simulation.rng.gauss(self._value))
         else:
             raise ValueError("Type not defined")
         if self.widget:
@@ -0,0 +1,150 @@
+"""
+NumPy implementation of opensimplex.noise2array.
+
+opensimplex only evaluates its array functions quickly if numba is installed, otherwise every point runs through the
+interpreted scalar code. This module evaluates the same 2D OpenSimplex noise with whole-array operations and produces the
+same values as opensimplex.noise2 for the currently seeded permutation.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+import opensimplex
+from opensimplex.internals import (
+    GRADIENTS2,
+    NORM_CONSTANT2,
+    SQUISH_CONSTANT2,
+    STRETCH_CONSTANT2,
+    _init,
+)
+
+
+def noise2array(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Generate 2D OpenSimplex noise for every combination of the given x and y coordinates.
+
+    Parameters:
+        x (np.ndarray): The x coordinates.
+        y (np.ndarray): The y coordinates.
+
+    Returns:
+        np.ndarray: The noise values of shape (y.size, x.size), between -1 and 1.
+    """
+    xs, ys = np.meshgrid(
+        np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    )
+    return noise2(xs, ys)
+
+
+def noise2(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Generate 2D OpenSimplex noise at the given points.
+
+    Parameters:
+        x (np.ndarray): The x coordinates of the points.
+        y (np.ndarray): The y coordinates of the points, same shape as x.
+
+    Returns:
+        np.ndarray: The noise value at every point, between -1 and 1.
+    """
+    perm = _permutation(opensimplex.get_seed())
+
+    # Place input coordinates onto grid.
+    stretch_offset = (x + y) * STRETCH_CONSTANT2
+    xs = x + stretch_offset
+    ys = y + stretch_offset
+
+    # Floor to get grid coordinates of rhombus (stretched square) super-cell origin.
+    xsb = np.floor(xs).astype(np.int64)
+    ysb = np.floor(ys).astype(np.int64)
+
+    # Skew out to get actual coordinates of rhombus origin.
+    squish_offset = (xsb + ysb) * SQUISH_CONSTANT2
+    xb = xsb + squish_offset
+    yb = ysb + squish_offset
+
+    # Compute grid coordinates relative to rhombus origin.
+    xins = xs - xsb
+    yins = ys - ysb
+    in_sum = xins + yins
+
+    # Positions relative to origin point.
+    dx0 = x - xb
+    dy0 = y - yb
+
+    # Contributions (1,0) and (0,1)
+    value = _contribution(
+        perm, xsb + 1, ysb, dx0 - 1 - SQUISH_CONSTANT2, dy0 - SQUISH_CONSTANT2
+    )
+    value += _contribution(
+        perm, xsb, ysb + 1, dx0 - SQUISH_CONSTANT2, dy0 - 1 - SQUISH_CONSTANT2
+    )
+
+    # Pick the extra vertex depending on the triangle (2-Simplex) the point is in
+    lower = in_sum <= 1
+    x_bigger = xins > yins
+    lower_closest = (1 - in_sum > xins) | (1 - in_sum > yins)
+    upper_closest = (2 - in_sum < xins) | (2 - in_sum < yins)
+    conditions = [
+        lower & lower_closest & x_bigger,
+        lower & lower_closest & ~x_bigger,
+        lower & ~lower_closest,
+        ~lower & upper_closest & x_bigger,
+        ~lower & upper_closest & ~x_bigger,
+    ]
+    xsv_ext = np.select(conditions, [xsb + 1, xsb - 1, xsb + 1, xsb + 2, xsb], xsb)
+    ysv_ext = np.select(conditions, [ysb - 1, ysb + 1, ysb + 1, ysb, ysb + 2], ysb)
+    dx_ext = np.select(
+        conditions,
+        [
+            dx0 - 1,
+            dx0 + 1,
+            dx0 - 1 - 2 * SQUISH_CONSTANT2,
+            dx0 - 2 - 2 * SQUISH_CONSTANT2,
+            dx0 + 0 - 2 * SQUISH_CONSTANT2,
+        ],
+        dx0,
+    )
+    dy_ext = np.select(
+        conditions,
+        [
+            dy0 + 1,
+            dy0 - 1,
+            dy0 - 1 - 2 * SQUISH_CONSTANT2,
+            dy0 + 0 - 2 * SQUISH_CONSTANT2,
+            dy0 - 2 - 2 * SQUISH_CONSTANT2,
+        ],
+        dy0,
+    )
+
+    # Contribution (0,0) or (1,1)
+    upper = ~lower
+    xsb = xsb + upper
+    ysb = ysb + upper
+    dx0 = np.where(upper, dx0 - 1 - 2 * SQUISH_CONSTANT2, dx0)
+    dy0 = np.where(upper, dy0 - 1 - 2 * SQUISH_CONSTANT2, dy0)
+    value += _contribution(perm, xsb, ysb, dx0, dy0)
+
+    # Extra vertex
+    value += _contribution(perm, xsv_ext, ysv_ext, dx_ext, dy_ext)
+
+    return value / NORM_CONSTANT2
+
+
+def _contribution(
+    perm: np.ndarray, xsb: np.ndarray, ysb: np.ndarray, dx: np.ndarray, dy: np.ndarray
+) -> np.ndarray:
+    attn = 2 - dx * dx - dy * dy
+    index = perm[(perm[xsb & 0xFF] + ysb) & 0xFF] & 0x0E
+    extrapolation = GRADIENTS2[index] * dx + GRADIENTS2[index + 1] * dy
+    attn = np.maximum(attn, 0)
+    attn *= attn
+    return attn * attn * extrapolation
+
+
+@lru_cache(maxsize=8)
+def _permutation(seed: int) -> np.ndarray:
+    perm, _ = _init(seed)
+    return perm
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+
+class TickScheduler:
+    """
+    Class deciding how many simulation ticks are run per displayed frame and how often frames start.
+
+    By default every frame runs ticks_per_frame ticks and frames start at most frame_rate times per second, so the
+    simulation runs at ticks_per_frame times the frame rate. In fast forward mode a frame instead runs ticks until
+    time_budget seconds have passed and the next frame starts right away, so the simulation speed is only capped by the
+    cost of the ticks and a new state is shown once per budget. At least one tick is run per frame in both modes.
+
+    Attributes:
+        ticks_per_frame (int): The number of ticks run per frame if fast forward is disabled.
+        fast_forward (bool): If True each frame runs as many ticks as fit into time_budget.
+        time_budget (float): The number of seconds a frame may spend on ticks in fast forward mode.
+        frame_rate (float | None): The maximum number of frames per second if fast forward is disabled, None if frames
+            are not paced.
+        ticks_last_frame (int): The number of ticks run in the last frame.
+
+    Methods:
+        run(tick): Run the ticks of one frame.
+        frame_interval(): Get the minimum number of seconds between the starts of two frames.
+        set_ticks_per_frame(ticks_per_frame): Set the number of ticks per frame.
+        set_fast_forward(fast_forward): Enable or disable fast forward.
+        set_time_budget(time_budget): Set the time budget of fast forward frames.
+        set_frame_rate(frame_rate): Set the maximum number of frames per second.
+    """
+
+    DEFAULT_TIME_BUDGET: float = 0.014
+    MAX_TICKS_PER_FRAME: int = 100
+
+    def __init__(
+        self,
+        ticks_per_frame: int = 1,
+        fast_forward: bool = False,
+        time_budget: float = DEFAULT_TIME_BUDGET,
+        frame_rate: float | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Initialize a TickScheduler.
+
+        Parameters:
+            ticks_per_frame (int): The number of ticks run per frame if fast forward is disabled. Default is 1.
+            fast_forward (bool): If True each frame runs as many ticks as fit into time_budget. Default is False.
+            time_budget (float): The number of seconds a frame may spend on ticks in fast forward mode. Default is
+                DEFAULT_TIME_BUDGET.
+            frame_rate (float | None): The maximum number of frames per second if fast forward is disabled, None if
+                frames are not paced. Default is None.
+            clock (Callable[[], float]): The clock measuring the time budget in seconds. Default is time.perf_counter.
+
+        Raises:
+            ValueError: If ticks_per_frame is not between 1 and MAX_TICKS_PER_FRAME or time_budget or frame_rate is
+                not positive.
+
+        Returns:
+            None
+        """
+        self.ticks_per_frame: int
+        self.fast_forward: bool = fast_forward
+        self.time_budget: float
+        self.frame_rate: float | None
+        self.ticks_last_frame: int = 0
+        self._clock: Callable[[], float] = clock
+
+        self.set_ticks_per_frame(ticks_per_frame)
+        self.set_time_budget(time_budget)
+        self.set_frame_rate(frame_rate)
+
+    def run(self, tick: Callable[[], None]) -> int:
+        """
+        Run the ticks of one frame.
+
+        Parameters:
+            tick (Callable[[], None]): The function running a single tick, e.g. World.update.
+
+        Returns:
+            int: The number of ticks that have been run.
+        """
+        ticks = 0
+        if self.fast_forward:
+            deadline = self._clock() + self.time_budget
+            tick()
+            ticks += 1
+            while self._clock() < deadline:
+                tick()
+                ticks += 1
+        else:
+            for _ in range(self.ticks_per_frame):
+                tick()
+            ticks = self.ticks_per_frame
+
+        self.ticks_last_frame = ticks
+        return ticks
+
+    def frame_interval(self) -> float:
+        """
+        Get the minimum number of seconds between the starts of two frames.
+
+        Parameters:
+            None
+
+        Returns:
+            float: 1 / frame_rate, 0 in fast forward mode or if frames are not paced.
+        """
+        if self.fast_forward or self.frame_rate is None:
+            return 0
+        return 1 / self.frame_rate
+
+    # region setters
+    def set_ticks_per_frame(self, ticks_per_frame: int) -> None:
+        """
+        Set the number of ticks run per frame if fast forward is disabled.
+
+        Parameters:
+            ticks_per_frame (int): The new number of ticks per frame, floats are rounded e.g. from a menu slider.
+
+        Raises:
+            ValueError: If ticks_per_frame is not between 1 and MAX_TICKS_PER_FRAME.
+
+        Returns:
+            None
+        """
+        ticks_per_frame = round(ticks_per_frame)
+        if not 1 <= ticks_per_frame <= TickScheduler.MAX_TICKS_PER_FRAME:
+            raise ValueError(
+                f"Ticks per frame {ticks_per_frame} needs to be between 1 and {TickScheduler.MAX_TICKS_PER_FRAME}."
+            )
+        self.ticks_per_frame = ticks_per_frame
+
+    def set_fast_forward(self, fast_forward: bool) -> None:
+        """
+        Enable or disable fast forward.
+
+        Parameters:
+            fast_forward (bool): If True each frame runs as many ticks as fit into time_budget.
+
+        Returns:
+            None
+        """
+        self.fast_forward = fast_forward
+
+    def set_time_budget(self, time_budget: float) -> None:
+        """
+        Set the number of seconds a frame may spend on ticks in fast forward mode.
+
+        Parameters:
+            time_budget (float): The new time budget in seconds.
+
+        Raises:
+            ValueError: If time_budget is not positive.
+
+        Returns:
+            None
+        """
+        if time_budget <= 0:
+            raise ValueError(f"Time budget {time_budget} needs to be positive.")
+        self.time_budget = time_budget
+
+    def set_frame_rate(self, frame_rate: float | None) -> None:
+        """
+        Set the maximum number of frames per second if fast forward is disabled.
+
+        Parameters:
+            frame_rate (float | None): The new frame rate, None if frames are not paced.
+
+        Raises:
+            ValueError: If frame_rate is not positive.
+
+        Returns:
+            None
+        """
+        if frame_rate is not None and frame_rate <= 0:
+            raise ValueError(f"Frame rate {frame_rate} needs to be positive.")
+        self.frame_rate = frame_rate
+
+    # endregion
@@ -1,16 +1,42 @@
 import datetime
 
-database_csv_filename: str = ""
+from ..helper.database_sinks import ColumnarSink, CsvSink, DatabaseSink, SqliteSink
+from ..helper.database_writer import DatabaseWriter
+
+# Writes the records of dead organisms in batches from a background thread
+writer: DatabaseWriter = DatabaseWriter()
+
+# region formats
+CSV: str = "csv"
+COLUMNAR: str = "columnar"
+SQLITE: str = "sqlite"
+FORMATS: tuple[str, ...] = (CSV, COLUMNAR, SQLITE)
+# endregion
+
+database_format: str = CSV
+database_filename: str = ""
+sink: DatabaseSink | None = None
 save_csv: bool = False
 save_animals_csv: bool = False
 save_plants_csv: bool = False
 
 
 def update_save_csv(value: bool):
-    global save_csv, database_csv_filename
+    global save_csv
     save_csv = value
     if save_csv:
-        database_csv_filename = f'data/organism_database_{datetime.datetime.now().strftime("%Y%m%d%H%M%S")}.csv'
+        _create_sink()
+
+
+def update_database_format(selected_item, value: str):
+    # A database that is being written is continued in a new file of the selected format
+    global database_format
+    if value not in FORMATS:
+        raise ValueError(f"Unknown database format {value}.")
+
+    database_format = value
+    if save_csv:
+        _create_sink()
 
 
 def update_save_animals_csv(value: bool):
@@ -21,3 +47,18 @@ def update_save_animals_csv(value: bool):
 def update_save_plants_csv(value: bool):
     global save_plants_csv
     save_plants_csv = value
+
+
+def _create_sink():
+    global database_filename, sink
+    database_filename = (
+        f'data/organism_database_{datetime.datetime.now().strftime("%Y%m%d%H%M%S")}'
+    )
+    if database_format == COLUMNAR:
+        sink = ColumnarSink(database_filename)
+    elif database_format == SQLITE:
+        database_filename += ".db"
+        sink = SqliteSink(database_filename)
+    else:
+        database_filename += ".csv"
+        sink = CsvSink(database_filename)
@@ -1,16 +1,104 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import opensimplex
 import pygame
 
+from ..entities.organism_store import OrganismStore
+from ..helper.image_cache import ImageCache
+from ..helper.phase_profiler import PhaseProfiler
+
 # TODO think of a way to have these variables in the world class
 
 organisms = pygame.sprite.Group()
 animals = pygame.sprite.Group()
 plants = pygame.sprite.Group()
+organism_store = OrganismStore()
+# Opt-in timing of the phases of Organism.update
+profiler = PhaseProfiler()
+# Filled surfaces shared by all organisms drawn in the same quantized color
+image_cache = ImageCache()
+
+# region randomness
+# All randomness of the simulation is drawn from these streams. Every World owns its own streams and makes them the
+# current ones (see use_streams) whenever it is created, updated, spawns organisms or reloads its terrain, so a world
+# created with the same seed replays the same run however many other worlds are created in between
+rng = random.Random()
+np_rng = np.random.default_rng()
+seed_value: int | None = None
+
+
+def random_seed() -> int:
+    """
+    Draw a new seed from the operating system.
+
+    Parameters:
+        None
+
+    Returns:
+        int: The seed.
+    """
+    return random.SystemRandom().randrange(2**32)
+
+
+def seed(value: int | None = None) -> int:
+    """
+    Seed the current random streams and the terrain noise.
+
+    The streams are reseeded in place, so the world owning them continues with the new seed.
+
+    Parameters:
+        value (int | None): The seed. If None a new seed is drawn from the operating system. Default is None.
+
+    Returns:
+        int: The seed that has been used.
+    """
+    global seed_value
+    if value is None:
+        value = random_seed()
+
+    rng.seed(value)
+    np_rng.bit_generator.state = np.random.PCG64(value).state
+    opensimplex.seed(value)
+    seed_value = value
+    return value
+
+
+def use_streams(
+    world_rng: random.Random, world_np_rng: np.random.Generator, noise_seed: int
+) -> None:
+    """
+    Make the random streams and the terrain noise seed of a world the current ones.
+
+    Parameters:
+        world_rng (random.Random): The stream of the world for Python level draws.
+        world_np_rng (np.random.Generator): The stream of the world for array draws.
+        noise_seed (int): The seed of the terrain noise of the world.
+
+    Returns:
+        None
+    """
+    global rng, np_rng, seed_value
+    rng = world_rng
+    np_rng = world_np_rng
+    # Seeding the noise builds its permutation tables, so it is only done when another world was current
+    if opensimplex.get_seed() != noise_seed:
+        opensimplex.seed(noise_seed)
+    seed_value = noise_seed
+
+
+# endregion
 
 
 def reset_organisms():
+    for organism in organisms.sprites():
+        organism.kill()
     organisms.empty()
     animals.empty()
     plants.empty()
+    organism_store.clear()
 
 
 def reset_stats():
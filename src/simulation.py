@@ -1,11 +1,20 @@
+from collections import deque
+from typing import Callable
+
 import pygame
 import pygame_menu
 
 from .entities.animal import Animal
+from .entities.organism import Organism
 from .entities.plant import Plant
 from .entities.properties.dna import DNA
 from .entities.properties.gene import ColorComponentGene, Gene
+from .gui.stat_panel import StatPanel
+from .helper.phase_profiler import PhaseProfiler
+from .helper.tick_scheduler import TickScheduler
 from .settings import database, screen, simulation
+from .simulation_worker import SimulationWorker
+from .terrain.snapshot import OrganismStats
 from .terrain.tile import Tile
 from .terrain.world import World
 
@@ -23,12 +32,14 @@ class Simulation:
         FPS_FONT_COLOR (tuple): The color code for the FPS font.
         fps_font (pygame.font.Font): The font for displaying FPS.
         fps_alpha (float): The alpha value for FPS display.
+        profile_font (pygame.font.Font): The font for the phase profiler overlay.
         world (World): The world object for the simulation.
-        selected_org (Organism): The currently selected organism.
         paused (bool): Flag indicating if the simulation is paused.
         alternating_moisture (bool): Flag indicating if moisture is alternating.
         brush_rect (pygame.Rect): The rectangle representing the brush.
         tool (function): The current tool function for interaction.
+        tick_scheduler (TickScheduler): Decides how many ticks are run per published snapshot.
+        worker (SimulationWorker): Updates the world on a background thread and runs the commands changing it.
 
     Methods:
         __init__: Initializes the simulation environment.
@@ -72,6 +83,7 @@ class Simulation:
     # endregion
     # region fonts
     fps_font = pygame.font.Font(None, 100)
+    profile_font = pygame.font.Font(None, 22)
     # endregion
     fps_alpha: float = 100
 
@@ -100,7 +112,13 @@ class Simulation:
 
         # region time
         self._clock = pygame.time.Clock()
-        self._fps = 0
+        # The world is updated by the worker, so frames are only drawn at display rate and leave it the rest of the time
+        self._fps = 60
+        # Outside of fast forward the worker runs one batch of ticks per displayed frame
+        self.tick_scheduler: TickScheduler = TickScheduler(frame_rate=self._fps)
+        # The ticks that passed between the snapshots drawn in the recent frames, see _fps_text
+        self._frame_ticks: deque[int] = deque(maxlen=self._fps)
+        self._drawn_age: int | None = None
         # endregion
 
         # region simulation
@@ -109,8 +127,13 @@ class Simulation:
         world_rect.width *= 0.6
         tile_size: int = world_rect.width // 50
         self.world: World = World(world_rect, tile_size)
+        self.worker: SimulationWorker = SimulationWorker(
+            self.world, self.tick_scheduler
+        )
         # Runtime variables
-        self.selected_org = None
+        # Shows the stats of the organism selected by the info tool, copied by the worker into its snapshots
+        self._stat_panel: StatPanel | None = None
+        self._stat_panel_id: int | None = None
         self.paused = True
         self.draw_world = True
         self.alternating_moisture = False
@@ -121,6 +144,21 @@ class Simulation:
         self._setup_menus()
 
     # region setup
+    def _on_worker(self, command: Callable) -> Callable:
+        """
+        Wrap a menu callback so it is submitted to the worker instead of being run on the pygame thread.
+
+        The organism and DNA setters change class settings the worker reads every tick, and setting a species
+        constant also clamps the health and energy of the living organisms in the organism store.
+
+        Parameters:
+            command (Callable): The callback to submit.
+
+        Returns:
+            Callable: A callback submitting command with the arguments it is called with.
+        """
+        return lambda *args: self.worker.submit(command, *args)
+
     def _setup_menus(self) -> None:
         """
         Initialising all the menus used by the simulation and setting up their elements.
@@ -257,7 +295,7 @@ class Simulation:
             "Data Analysis"
         )  # TODO add fuction call to data analysis module
         self.starting_menu.add.button("Options", self.options_menu)
-        self.starting_menu.add.button("Quit", quit)
+        self.starting_menu.add.button("Quit", self._quit)
 
     def _setup_options_menu(self) -> None:
         self.options_menu.add.button("Screen", self.screen_options)
@@ -296,6 +334,16 @@ class Simulation:
             database.save_plants_csv,
             onchange=database.update_save_plants_csv,
         )
+        self.database_options.add.dropselect(
+            "Database format",
+            [
+                ("CSV", database.CSV),
+                ("Columnar (.npz)", database.COLUMNAR),
+                ("SQLite (.db)", database.SQLITE),
+            ],
+            database.FORMATS.index(database.database_format),
+            onchange=database.update_database_format,
+        )
         self.database_options.add.button("Back", pygame_menu.pygame_menu.events.BACK)
 
     # endregion
@@ -317,6 +365,37 @@ class Simulation:
         self._running_settings_menu.add.toggle_switch(
             "Draw World", self.draw_world, self.set_draw_world
         )
+        self._running_settings_menu.add.toggle_switch(
+            "Grid renderer",
+            self.world.grid_rendering,
+            self.world.set_grid_rendering,
+        )
+        self._running_settings_menu.add.range_slider(
+            "Ticks per frame",
+            default=self.tick_scheduler.ticks_per_frame,
+            range_values=(1, TickScheduler.MAX_TICKS_PER_FRAME),
+            increment=1,
+            value_format=lambda value: str(round(value)),
+            onchange=self.tick_scheduler.set_ticks_per_frame,
+        )
+        self._running_settings_menu.add.toggle_switch(
+            "Fast forward",
+            self.tick_scheduler.fast_forward,
+            self.tick_scheduler.set_fast_forward,
+        )
+        self._running_settings_menu.add.toggle_switch(
+            "Profile phases",
+            simulation.profiler.enabled,
+            simulation.profiler.set_enabled,
+        )
+        self._running_settings_menu.add.range_slider(
+            "Frame budget (ms)",
+            default=round(self.tick_scheduler.time_budget * 1000),
+            range_values=(1, 100),
+            increment=1,
+            value_format=lambda value: str(round(value)),
+            onchange=lambda value: self.tick_scheduler.set_time_budget(value / 1000),
+        )
         self._running_settings_menu.add.button(
             "Back", self.starting_menu.mainloop, self._surface
         )
@@ -339,7 +418,8 @@ class Simulation:
         )
         self.world.scale_setting.add_controller_to_menu(self._world_settings_menu)
         self._world_settings_menu.add.button(
-            "Randomise Everything", self.world.randomise_freqs
+            "Randomise Everything",
+            lambda: self.worker.submit(self.world.randomise_freqs, False),
         )
 
         self._world_settings_menu.add.button(
@@ -363,13 +443,17 @@ class Simulation:
             "Num. Animals: ",
             0,
             input_type=pygame_menu.pygame_menu.locals.INPUT_INT,
-            onreturn=self.world.spawn_animals,
+            onreturn=lambda amount: self.worker.submit(
+                self.world.spawn_animals, amount
+            ),
         )
         self._spawning_settings_menu.add.text_input(
             "Num. Plants: ",
             0,
             input_type=pygame_menu.pygame_menu.locals.INPUT_INT,
-            onreturn=self.world.spawn_plants,
+            onreturn=lambda amount: self.worker.submit(
+                self.world.spawn_plants, amount
+            ),
         )
         self._spawning_settings_menu.add.button(
             "Back", pygame_menu.pygame_menu.events.BACK
@@ -380,7 +464,7 @@ class Simulation:
             "Mutation distribution type",
             [("Gauss", "gauss"), ("Uniform", "uniform")],
             0,
-            onreturn=Gene.set_mutation_type,
+            onreturn=self._on_worker(Gene.set_mutation_type),
         )
         self._dna_settings_menu.add.label("Attack Power Mutation Range")
         self._dna_settings_menu.add.range_slider(
@@ -388,7 +472,7 @@ class Simulation:
             DNA.attack_power_mutation_range,
             (0, DNA.attack_power_max),
             increment=1,
-            onchange=DNA.set_attack_power_mutation_range,
+            onchange=self._on_worker(DNA.set_attack_power_mutation_range),
         )
         self._dna_settings_menu.add.label("Defense Mutation Range")
         self._dna_settings_menu.add.range_slider(
@@ -396,7 +480,7 @@ class Simulation:
             DNA.defense_muation_range,
             (0, DNA.defense_max),
             increment=1,
-            onchange=DNA.set_defense_mutation_range,
+            onchange=self._on_worker(DNA.set_defense_mutation_range),
         )
         self._dna_settings_menu.add.label("Color Mutation Range")
         self._dna_settings_menu.add.range_slider(
@@ -404,7 +488,7 @@ class Simulation:
             DNA.color_mutation_range,
             (0, ColorComponentGene.MAX),
             increment=1,
-            onchange=DNA.set_color_mutation_range,
+            onchange=self._on_worker(DNA.set_color_mutation_range),
         )
         self._dna_settings_menu.add.label("Prefered Moisture Mutation Range")
         self._dna_settings_menu.add.range_slider(
@@ -412,7 +496,7 @@ class Simulation:
             DNA.prefered_moisture_muation_range,
             (0, DNA.prefered_moisture_max),
             increment=0.01,
-            onchange=DNA.set_prefered_moisture_mutation_range,
+            onchange=self._on_worker(DNA.set_prefered_moisture_mutation_range),
         )
         self._dna_settings_menu.add.label("Prefered Height Mutation Range")
         self._dna_settings_menu.add.range_slider(
@@ -420,7 +504,7 @@ class Simulation:
             DNA.prefered_height_muation_range,
             (0, DNA.prefered_height_max),
             increment=0.01,
-            onchange=DNA.set_prefered_height_mutation_range,
+            onchange=self._on_worker(DNA.set_prefered_height_mutation_range),
         )
         self._dna_settings_menu.add.label("Min Reproduction Health Mutation Range")
         self._dna_settings_menu.add.range_slider(
@@ -428,7 +512,7 @@ class Simulation:
             DNA.min_reproduction_health_mutation_range,
             (0, DNA.min_reproduction_health_max),
             increment=0.01,
-            onchange=DNA.set_min_reproduction_health_mutation_range,
+            onchange=self._on_worker(DNA.set_min_reproduction_health_mutation_range),
         )
         self._dna_settings_menu.add.label("Min Reproduction Energy Mutation Range")
         self._dna_settings_menu.add.range_slider(
@@ -436,7 +520,7 @@ class Simulation:
             DNA.min_reproduction_energy_mutation_range,
             (0, DNA.min_reproduction_energy_max),
             increment=0.01,
-            onchange=DNA.set_min_reproduction_energy_mutation_range,
+            onchange=self._on_worker(DNA.set_min_reproduction_energy_mutation_range),
         )
         self._dna_settings_menu.add.label("Reproduction Chance Mutation Range")
         self._dna_settings_menu.add.range_slider(
@@ -444,7 +528,7 @@ class Simulation:
             DNA.reproduction_chance_mutation_range,
             (0, DNA.reproduction_chance_max),
             increment=0.01,
-            onchange=DNA.set_reproduction_chance_mutation_range,
+            onchange=self._on_worker(DNA.set_reproduction_chance_mutation_range),
         )
         self._dna_settings_menu.add.label("Energy to offspring ratio Mutation Range")
         self._dna_settings_menu.add.range_slider(
@@ -452,7 +536,7 @@ class Simulation:
             DNA.energy_to_offspring_mutation_range,
             (0, DNA.energy_to_offspring_max),
             increment=0.01,
-            onchange=DNA.set_energy_to_offspring_mutation_range,
+            onchange=self._on_worker(DNA.set_energy_to_offspring_mutation_range),
         )
 
         self._dna_settings_menu.add.button("Back", pygame_menu.pygame_menu.events.BACK)
@@ -480,7 +564,7 @@ class Simulation:
             (DNA.attack_power_min, DNA.attack_power_max),
             increment=1,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Animal.set_starting_attack_power_range,
+            onchange=self._on_worker(Animal.set_starting_attack_power_range),
         )
         self._animal_settings_menu.add.label("Spawning Defense Range")
         self._animal_settings_menu.add.range_slider(
@@ -489,7 +573,7 @@ class Simulation:
             (DNA.defense_min, DNA.defense_max),
             increment=1,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Animal.set_starting_defense_range,
+            onchange=self._on_worker(Animal.set_starting_defense_range),
         )
         self._animal_settings_menu.add.label("Spawning Moisture Preference Range")
         self._animal_settings_menu.add.range_slider(
@@ -498,7 +582,7 @@ class Simulation:
             (DNA.prefered_moisture_min, DNA.prefered_moisture_max),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Animal.set_starting_moisture_preference_range,
+            onchange=self._on_worker(Animal.set_starting_moisture_preference_range),
         )
         self._animal_settings_menu.add.label("Spawning Height Preference Range")
         self._animal_settings_menu.add.range_slider(
@@ -507,7 +591,7 @@ class Simulation:
             (DNA.prefered_height_min, DNA.prefered_height_max),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Animal.set_starting_height_preference,
+            onchange=self._on_worker(Animal.set_starting_height_preference),
         )
         self._animal_settings_menu.add.label("Spawning Mutation Chance Range")
         self._animal_settings_menu.add.range_slider(
@@ -516,7 +600,7 @@ class Simulation:
             (DNA.mutation_chance_min, DNA.mutation_chance_max),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Animal.set_starting_mutation_chance_range,
+            onchange=self._on_worker(Animal.set_starting_mutation_chance_range),
         )
         self._animal_settings_menu.add.label("Spawning Min Health % to reproduce")
         self._animal_settings_menu.add.range_slider(
@@ -525,7 +609,7 @@ class Simulation:
             (DNA.min_reproduction_health_min, DNA.min_reproduction_health_max),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Animal.set_starting_min_reproduction_health_range,
+            onchange=self._on_worker(Animal.set_starting_min_reproduction_health_range),
         )
         self._animal_settings_menu.add.label("Spawning Min Energy % to reproduce")
         self._animal_settings_menu.add.range_slider(
@@ -534,7 +618,7 @@ class Simulation:
             (DNA.min_reproduction_energy_min, DNA.min_reproduction_energy_max),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Animal.set_starting_min_reproduction_energy_range,
+            onchange=self._on_worker(Animal.set_starting_min_reproduction_energy_range),
         )
         self._animal_settings_menu.add.label("Spawning Reproduction Chance")
         self._animal_settings_menu.add.range_slider(
@@ -543,7 +627,7 @@ class Simulation:
             (DNA.reproduction_chance_min, DNA.reproduction_chance_max),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Animal.set_starting_reproduction_chance_range,
+            onchange=self._on_worker(Animal.set_starting_reproduction_chance_range),
         )
         self._animal_settings_menu.add.label("Spawning Energy to offspring ratio")
         self._animal_settings_menu.add.range_slider(
@@ -552,7 +636,7 @@ class Simulation:
             (DNA.energy_to_offspring_min, DNA.energy_to_offspring_max),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Animal.set_starting_energy_to_offspring_ratio_range,
+            onchange=self._on_worker(Animal.set_starting_energy_to_offspring_ratio_range),
         )
 
         self._animal_settings_menu.add.label("Energy Maintenance Cost")
@@ -562,7 +646,7 @@ class Simulation:
             (0, 100),
             increment=1,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Animal.set_base_energy_maintenance,
+            onchange=self._on_worker(Animal.set_base_energy_maintenance),
         )
         self._animal_settings_menu.add.label("Max Health")
         self._animal_settings_menu.add.range_slider(
@@ -571,7 +655,7 @@ class Simulation:
             (1, 1000),
             increment=10,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Animal.set_max_health,
+            onchange=self._on_worker(Animal.set_max_health),
         )
         self._animal_settings_menu.add.label("Max Energy")
         self._animal_settings_menu.add.range_slider(
@@ -580,7 +664,7 @@ class Simulation:
             (1, 1000),
             increment=10,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Animal.set_max_energy,
+            onchange=self._on_worker(Animal.set_max_energy),
         )
         self._animal_settings_menu.add.label("Nutriton Factor")
         self._animal_settings_menu.add.range_slider(
@@ -589,7 +673,7 @@ class Simulation:
             (0, 1),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Animal.set_nutrition_factor,
+            onchange=self._on_worker(Animal.set_nutrition_factor),
         )
 
         self._animal_settings_menu.add.button(
@@ -604,7 +688,7 @@ class Simulation:
             (DNA.attack_power_min, DNA.attack_power_max),
             increment=1,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Plant.set_starting_attack_power_range,
+            onchange=self._on_worker(Plant.set_starting_attack_power_range),
         )
         self._plant_settings_menu.add.label("Spawning Defense Range")
         self._plant_settings_menu.add.range_slider(
@@ -613,7 +697,7 @@ class Simulation:
             (DNA.defense_min, DNA.defense_max),
             increment=1,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Plant.set_starting_defense_range,
+            onchange=self._on_worker(Plant.set_starting_defense_range),
         )
         self._plant_settings_menu.add.label("Spawning Moisture Preference Range")
         self._plant_settings_menu.add.range_slider(
@@ -622,7 +706,7 @@ class Simulation:
             (DNA.prefered_moisture_min, DNA.prefered_moisture_max),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Plant.set_starting_moisture_preference_range,
+            onchange=self._on_worker(Plant.set_starting_moisture_preference_range),
         )
         self._plant_settings_menu.add.label("Spawning Height Preference Range")
         self._plant_settings_menu.add.range_slider(
@@ -631,7 +715,7 @@ class Simulation:
             (DNA.prefered_height_min, DNA.prefered_height_max),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Plant.set_starting_height_preference,
+            onchange=self._on_worker(Plant.set_starting_height_preference),
         )
         self._plant_settings_menu.add.label("Spawning Mutation Chance Range")
         self._plant_settings_menu.add.range_slider(
@@ -640,7 +724,7 @@ class Simulation:
             (DNA.mutation_chance_min, DNA.mutation_chance_max),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Plant.set_starting_mutation_chance_range,
+            onchange=self._on_worker(Plant.set_starting_mutation_chance_range),
         )
         self._plant_settings_menu.add.label("Spawning Min Health % to reproduce")
         self._plant_settings_menu.add.range_slider(
@@ -649,7 +733,7 @@ class Simulation:
             (DNA.min_reproduction_health_min, DNA.min_reproduction_health_max),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Plant.set_starting_min_reproduction_health_range,
+            onchange=self._on_worker(Plant.set_starting_min_reproduction_health_range),
         )
         self._plant_settings_menu.add.label("Spawning Min Energy % to reproduce")
         self._plant_settings_menu.add.range_slider(
@@ -658,7 +742,7 @@ class Simulation:
             (DNA.min_reproduction_energy_min, DNA.min_reproduction_energy_max),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Plant.set_starting_min_reproduction_energy_range,
+            onchange=self._on_worker(Plant.set_starting_min_reproduction_energy_range),
         )
         self._plant_settings_menu.add.label("Spawning Reproduction Chance")
         self._plant_settings_menu.add.range_slider(
@@ -667,7 +751,7 @@ class Simulation:
             (DNA.reproduction_chance_min, DNA.reproduction_chance_max),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Plant.set_starting_reproduction_chance_range,
+            onchange=self._on_worker(Plant.set_starting_reproduction_chance_range),
         )
         self._plant_settings_menu.add.label("Spawning Energy to offspring ratio")
         self._plant_settings_menu.add.range_slider(
@@ -676,7 +760,7 @@ class Simulation:
             (DNA.energy_to_offspring_min, DNA.energy_to_offspring_max),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Plant.set_starting_energy_to_offspring_ratio_range,
+            onchange=self._on_worker(Plant.set_starting_energy_to_offspring_ratio_range),
         )
 
         self._plant_settings_menu.add.label("Energy Maintenance Cost")
@@ -686,7 +770,7 @@ class Simulation:
             (0, 100),
             increment=1,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Plant.set_base_energy_maintenance,
+            onchange=self._on_worker(Plant.set_base_energy_maintenance),
         )
         self._plant_settings_menu.add.label("Max Health")
         self._plant_settings_menu.add.range_slider(
@@ -695,7 +779,7 @@ class Simulation:
             (1, 1000),
             increment=10,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Plant.set_max_health,
+            onchange=self._on_worker(Plant.set_max_health),
         )
         self._plant_settings_menu.add.label("Max Energy")
         self._plant_settings_menu.add.range_slider(
@@ -704,7 +788,7 @@ class Simulation:
             (1, 1000),
             increment=10,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Plant.set_max_energy,
+            onchange=self._on_worker(Plant.set_max_energy),
         )
         self._plant_settings_menu.add.label("Nutriton Factor")
         self._plant_settings_menu.add.range_slider(
@@ -713,7 +797,7 @@ class Simulation:
             (0, 1),
             increment=0.01,
             range_box_color=self.TRANSPARENT_BLACK_COLOR,
-            onchange=Plant.set_nutrition_factor,
+            onchange=self._on_worker(Plant.set_nutrition_factor),
         )
 
         self._plant_settings_menu.add.button(
@@ -728,6 +812,8 @@ class Simulation:
         """
         Sets the running state of the simulation.
 
+        Pausing the simulation waits for the worker to finish its ticks and writes all pending database records.
+
         Parameters:
             is_running (bool): The new running state of the simulation.
 
@@ -735,6 +821,10 @@ class Simulation:
             None
         """
         self.paused = not is_running
+        self.worker.set_running(is_running)
+        if self.paused:
+            self.worker.flush()
+            database.writer.flush()
 
     def set_draw_world(self, draw_world) -> None:
         """
@@ -747,10 +837,12 @@ class Simulation:
             None
         """
         self.draw_world = draw_world
+        if draw_world:
+            self.world.invalidate()
 
     def clear_organisms(self) -> None:
         """
-        Clears all organisms from the simulation.
+        Clears all organisms from the simulation and writes all pending database records.
 
         Raises:
             No specific exceptions are raised.
@@ -758,7 +850,9 @@ class Simulation:
         Returns:
             None
         """
-        simulation.reset_organisms()
+        self.worker.submit(simulation.reset_organisms)
+        self.worker.flush()
+        database.writer.flush()
 
     def reset_stats(self) -> None:
         """
@@ -770,7 +864,7 @@ class Simulation:
         Returns:
             None
         """
-        simulation.reset_stats()
+        self.worker.submit(simulation.reset_stats)
 
     # region tools
     def animal_spawning_tool(self, tiles: list[Tile]) -> None:
@@ -807,7 +901,7 @@ class Simulation:
 
     def info_tool(self, tiles: list[Tile]) -> None:
         """
-        Displays information about the first tile in tiles.
+        Selects the organism on the first tile in tiles, whose stats the worker then copies into its snapshots.
 
         Args:
             tiles (list[Tile]): A list of tiles to extract the organism information from.
@@ -818,11 +912,11 @@ class Simulation:
         # TODO improve visual of info tool
         tile = tiles.pop(1)
         if tile.has_animal():
-            self.selected_org = tile.animal.sprite
+            self.worker.select(tile.animal)
         elif tile.has_plant():
-            self.selected_org = tile.plant.sprite
+            self.worker.select(tile.plant)
         else:
-            self.selected_org = None
+            self.worker.select(None)
 
     def choose_info_tool(self) -> None:
         self.tool = self.info_tool
@@ -839,8 +933,8 @@ class Simulation:
         """
         for tile in tiles:
             if tile.has_animal():
-                tile.animal.sprite.health = 0
-                tile.animal.sprite.die()
+                tile.animal.health = 0
+                tile.animal.die()
 
     def choose_animal_kill_tool(self) -> None:
         self.tool = self.animal_kill_tool
@@ -857,8 +951,8 @@ class Simulation:
         """
         for tile in tiles:
             if tile.has_plant():
-                tile.plant.sprite.health = 0
-                tile.plant.sprite.die()
+                tile.plant.health = 0
+                tile.plant.die()
 
     def choose_plant_kill_tool(self) -> None:
         self.tool = self.plant_kill_tool
@@ -869,20 +963,25 @@ class Simulation:
     # region loops
     def _update_gui(
         self, draw_menu=True, draw_grid=True, draw_fps=True, draw_world=True
-    ) -> None:
+    ) -> list[pygame.Rect]:
         """
         Updates the graphical user interface of the simulation.
 
+        The world is drawn from the latest snapshot published by the worker.
+
         Parameters:
             draw_menu (bool): Whether to draw the menu on the GUI. Default is True.
             draw_grid (bool): Whether to draw the grid on the GUI. Default is True.
             draw_fps (bool): Whether to display the frames per second on the GUI. Default is True.
 
         Returns:
-            None
+            list[pygame.Rect]: The parts of the screen that have been drawn to and need to be updated on the display.
         """
+        dirty_rects: list[pygame.Rect] = []
         if draw_world:
-            self.world.draw(self._surface)
+            dirty_rects.extend(
+                self.world.draw(self._surface, self.worker.buffer.latest())
+            )
 
         if draw_grid:
             # TODO implement grid drawing
@@ -890,10 +989,11 @@ class Simulation:
 
         if draw_menu and self._running_settings_menu.is_enabled():
             self._running_settings_menu.draw(self._surface)
+            dirty_rects.append(self._running_settings_menu.get_rect())
 
         if draw_fps:
             fps_surface: pygame.Surface = self.fps_font.render(
-                f"{int(self._clock.get_fps())}", True, self.FPS_FONT_COLOR
+                self._fps_text(), True, self.FPS_FONT_COLOR
             )
             fps_surface.set_alpha(self.fps_alpha)
             if not draw_world:
@@ -905,17 +1005,112 @@ class Simulation:
                         bottomleft=self._surface.get_rect().bottomleft
                     ),
                 )
-            self._surface.blit(
-                fps_surface,
-                fps_surface.get_rect(bottomleft=self._surface.get_rect().bottomleft),
+            fps_rect = fps_surface.get_rect(
+                bottomleft=self._surface.get_rect().bottomleft
             )
+            self._surface.blit(fps_surface, fps_rect)
+            dirty_rects.append(fps_rect)
+            self.world.invalidate(fps_rect)
+
+        if simulation.profiler.enabled:
+            profile_rect = self._draw_profile_overlay()
+            dirty_rects.append(profile_rect)
+            self.world.invalidate(profile_rect)
 
         self._running_menu_bar.draw(self._surface)
+        dirty_rects.append(self._running_menu_bar.get_rect())
+
+        return dirty_rects
+
+    def _draw_profile_overlay(self) -> pygame.Rect:
+        """
+        Draws the phase times of the last profiler window in the top left corner of the world, below the menu bar.
+
+        Parameters:
+            None
+
+        Returns:
+            pygame.Rect: The part of the screen that has been drawn to.
+        """
+        report = simulation.profiler.last_window
+        if report is None:
+            lines = [f"Profiling the first {simulation.profiler.interval} ticks..."]
+        else:
+            lines = [f"Phases at tick {report['age']} in ms/tick"]
+            for name in PhaseProfiler.KIND_NAMES:
+                kind = report[name]
+                phases = sorted(kind["phases"].items(), key=lambda item: -item[1])
+                lines.append(
+                    f"{name}: {kind['total']:.2f} for {kind['updates']:.0f} updates"
+                )
+                lines.extend(f"    {phase} {ms:.2f}" for phase, ms in phases[:4])
+
+        surfaces = [
+            self.profile_font.render(line, True, self.FPS_FONT_COLOR) for line in lines
+        ]
+        # Below the menu bar, which is drawn over the top of the world
+        rect = pygame.Rect(
+            (self.world.rect.left, self._running_menu_bar.get_rect().bottom),
+            (
+                max(surface.get_width() for surface in surfaces) + 10,
+                sum(surface.get_height() for surface in surfaces) + 10,
+            ),
+        )
+        background = pygame.Surface(rect.size)
+        background.fill((255, 255, 255))
+        background.set_alpha(200)
+        self._surface.blit(background, rect)
+        y = rect.y + 5
+        for surface in surfaces:
+            self._surface.blit(surface, (rect.x + 5, y))
+            y += surface.get_height()
+        return rect
+
+    def _count_frame_ticks(self) -> None:
+        # The snapshot ages tell how many ticks passed between two rendered frames, however the worker batches them
+        snapshot = self.worker.buffer.latest()
+        if snapshot is None:
+            return
+        if self._drawn_age is not None:
+            self._frame_ticks.append(snapshot.age - self._drawn_age)
+        self._drawn_age = snapshot.age
+
+    def _draw_selected(self, selected: OrganismStats) -> list[pygame.Rect]:
+        # Only the stats copied by the worker are drawn, the live organism is never read on this thread
+        rect = selected.rect.move(self.world.rect.topleft)
+        panel = self._stat_panel
+        if panel is None or self._stat_panel_id != selected.organism_id:
+            panel = self._stat_panel = StatPanel(selected.headers, selected.values)
+            self._stat_panel_id = selected.organism_id
+
+        pygame.draw.rect(
+            self._surface,
+            Organism.SELECTED_ORGANISM_COLOR,
+            rect,
+            width=Organism.SELECTED_ORGANISM_RECT_WIDTH,
+        )
+        panel.update(rect, selected.values)
+        panel.draw(self._surface)
+        return [rect, panel.rect.copy()]
+
+    def _fps_text(self) -> str:
+        fps = int(self._clock.get_fps())
+        if self.paused or not self._frame_ticks:
+            return f"{fps}"
+        ticks = round(sum(self._frame_ticks) / len(self._frame_ticks))
+        if ticks <= 1:
+            return f"{fps}"
+        return f"{fps} x{ticks}"
 
     def run_loop(self) -> None:
         """
         Runs the main loop of the simulation, handling user input, updating the world, and displaying the graphical user interface.
 
+        The world is updated by the worker on a background thread, which runs the ticks decided by the tick scheduler,
+        either a fixed number of ticks per displayed frame or in fast forward mode as many as fit into its time budget
+        without waiting for the display, and publishes a snapshot after each batch. This loop only handles input, sends the resulting changes to the worker as commands
+        and draws the latest snapshot at display rate.
+
         Raises:
             No specific exceptions are raised.
 
@@ -925,7 +1120,11 @@ class Simulation:
         # TODO add setting to disable drawing completely to improve speed
         # TODO improve fps displaying
         drawing = False
+        self.worker.start()
+        self.worker.set_running(not self.paused)
+        self.world.invalidate()
         self._update_gui()
+        pygame.display.flip()
 
         simulating = True
         while simulating:
@@ -950,18 +1149,24 @@ class Simulation:
                 if event.type == pygame.MOUSEBUTTONUP:
                     drawing = False
 
-            if not self.paused:
-                self.world.update()
+            # Terrain settings only request reloads, so dragging a slider regenerates the terrain at most once per frame
+            if self.world.reload_scheduler.pending():
+                self.worker.submit(self.world.reload_scheduler.flush)
 
             if drawing:
                 tiles = self.world.get_tiles(self.brush_rect)
                 if not tiles:
-                    self.selected_org = None
+                    self.worker.submit(self.worker.select, None)
                 else:
-                    self.tool(tiles)
+                    self.worker.submit(self.tool, tiles)
 
-            self._update_gui(draw_menu=menu_updated, draw_world=self.draw_world)
+            self._count_frame_ticks()
+            dirty_rects = self._update_gui(
+                draw_menu=menu_updated, draw_world=self.draw_world
+            )
 
+            # Everything drawn over the world has to be painted over again in the next frame
+            overlay_rects: list[pygame.Rect] = []
             if self.world.rect.contains(self.brush_rect) and self.draw_world:
                 # Draw cursor highlight
                 pygame.draw.rect(
@@ -970,12 +1175,17 @@ class Simulation:
                     self.brush_rect,
                     width=self.brush_outline,
                 )
+                overlay_rects.append(self.brush_rect.copy())
 
-            if self.selected_org:
+            snapshot = self.worker.buffer.latest()
+            if snapshot is not None and snapshot.selected is not None:
                 # TODO change this so there is a new stat panel that is locked in place
-                self.selected_org.show_stats(self._surface, self.world.rect.topleft)
+                overlay_rects.extend(self._draw_selected(snapshot.selected))
 
-            pygame.display.flip()
+            for rect in overlay_rects:
+                self.world.invalidate(rect)
+            dirty_rects.extend(overlay_rects)
+            pygame.display.update(dirty_rects)
 
             self._clock.tick(self._fps)
 
@@ -986,6 +1196,7 @@ class Simulation:
         This method updates the pause state of the simulation by toggling it between paused and running states.
         It retrieves the 'GameState' widget from the running settings menu and sets its value to the current pause state.
         Then, it toggles the pause state by negating the current value of 'paused' attribute.
+        Pausing the simulation waits for the worker to finish its ticks and writes all pending database records.
 
         Parameters:
             None
@@ -994,7 +1205,7 @@ class Simulation:
             None
         """
         self._running_settings_menu.get_widget("GameState").set_value(self.paused)
-        self.paused = not self.paused
+        self.set_running(self.paused)
 
     def mainlopp(self) -> None:
         self.starting_menu.mainloop(self._surface)
@@ -1002,5 +1213,7 @@ class Simulation:
     # endregion
 
     def _quit(self) -> None:
+        self.worker.stop()
+        database.writer.close()
         pygame.quit()
         exit()
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Callable
+
+from .helper.tick_scheduler import TickScheduler
+from .terrain.snapshot import SnapshotBuffer, WorldSnapshot
+from .terrain.world import World
+
+if TYPE_CHECKING:
+    from .entities.organism import Organism
+
+
+class SimulationWorker:
+    """
+    Class updating a world on a background thread.
+
+    The worker is the only thread touching the world once it is started. After every batch of ticks (see TickScheduler)
+    it publishes a WorldSnapshot into its buffer, which the pygame thread draws at display rate. Batches are started at
+    most at the frame rate of the tick scheduler, so a batch is one displayed frame, except in fast forward mode where
+    they follow each other without waiting. Everything else that
+    changes the world, e.g. the spawning and kill tools, terrain reloads or clearing the organisms, is sent to the
+    worker as a command and run between two ticks. Even the stats of the selected organism are copied into the snapshots
+    (see OrganismStats) instead of being read by the pygame thread. A slow tick therefore never delays input handling and a slow frame
+    never delays the simulation.
+
+    Attributes:
+        world (World): The world being updated.
+        tick_scheduler (TickScheduler): Decides how many ticks are run between two snapshots.
+        buffer (SnapshotBuffer): The latest snapshot of the world.
+        running (bool): If False the worker only runs commands and does not update the world.
+        selected (Organism | None): The organism whose stats are copied into every snapshot.
+
+    Methods:
+        start(): Start the background thread.
+        stop(timeout): Stop the background thread.
+        submit(command, *args): Run a command on the worker between two ticks.
+        flush(timeout): Wait until all commands submitted so far have been run.
+        set_running(running): Start or pause updating the world.
+        select(organism): Select the organism whose stats are copied into the snapshots.
+        is_alive(): Check if the background thread is running.
+    """
+
+    IDLE_INTERVAL: float = 0.05
+    _STOP: object = object()
+
+    def __init__(
+        self, world: World, tick_scheduler: TickScheduler | None = None
+    ) -> None:
+        """
+        Initialize a paused SimulationWorker. The background thread is only started by start().
+
+        Parameters:
+            world (World): The world to update.
+            tick_scheduler (TickScheduler | None): Decides how many ticks are run between two snapshots. If None one tick
+                is run per snapshot. Default is None.
+
+        Returns:
+            None
+        """
+        self.world: World = world
+        self.tick_scheduler: TickScheduler = tick_scheduler or TickScheduler()
+        self.buffer: SnapshotBuffer = SnapshotBuffer()
+        self.running: bool = False
+        self.selected: Organism | None = None
+
+        self._commands: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+
+    # region pygame thread
+    def start(self) -> None:
+        """
+        Publish a snapshot of the current state and start the background thread, if it is not running yet.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        if self._thread is not None:
+            return
+
+        self.buffer.publish(WorldSnapshot.capture(self.world, self.selected))
+        self._thread = threading.Thread(
+            target=self._run, name="SimulationWorker", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Run all submitted commands, finish the current ticks and stop the background thread.
+
+        Parameters:
+            timeout (float | None): The maximum number of seconds to wait. If None wait until done. Default is None.
+
+        Returns:
+            None
+        """
+        if self._thread is None:
+            return
+
+        self._commands.put(SimulationWorker._STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, command: Callable, *args) -> None:
+        """
+        Run a command on the worker between two ticks. Without a running background thread it is run immediately.
+
+        Parameters:
+            command (Callable): The function to call.
+            *args: The arguments to call it with.
+
+        Returns:
+            None
+        """
+        if self._thread is None:
+            command(*args)
+            return
+        self._commands.put((command, args))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all commands submitted so far have been run and a snapshot showing their effect has been published.
+
+        Parameters:
+            timeout (float | None): The maximum number of seconds to wait. If None wait until done. Default is None.
+
+        Returns:
+            bool: True if all commands have been run, False if the timeout passed first.
+        """
+        if self._thread is None:
+            return True
+
+        done = threading.Event()
+        self._commands.put(done)
+        return done.wait(timeout)
+
+    def set_running(self, running: bool) -> None:
+        """
+        Start or pause updating the world. Commands are run in both states.
+
+        Parameters:
+            running (bool): If True the world is updated continuously.
+
+        Returns:
+            None
+        """
+        self.running = running
+        # Wake up the background thread if it is waiting for commands
+        self._commands.put(None)
+
+    def select(self, organism: Organism | None) -> None:
+        """
+        Select the organism whose stats are copied into the snapshots. Has to be submitted as a command, e.g. by a tool.
+
+        Parameters:
+            organism (Organism | None): The organism to select, None to select none.
+
+        Returns:
+            None
+        """
+        self.selected = organism
+
+    def is_alive(self) -> bool:
+        """
+        Check if the background thread is running.
+
+        Parameters:
+            None
+
+        Returns:
+            bool: True if the background thread has been started and not stopped.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    # endregion
+
+    # region background thread
+    def _run(self) -> None:
+        next_batch = time.perf_counter()
+        while True:
+            # While paused wait for a command, while running wait for one until the next batch is due
+            if self.running:
+                timeout = next_batch - time.perf_counter()
+            else:
+                timeout = SimulationWorker.IDLE_INTERVAL
+            try:
+                if timeout > 0:
+                    first = self._commands.get(timeout=timeout)
+                else:
+                    first = self._commands.get_nowait()
+            except queue.Empty:
+                first = None
+            items = [first]
+            while True:
+                try:
+                    items.append(self._commands.get_nowait())
+                except queue.Empty:
+                    break
+
+            changed = False
+            flushed: list[threading.Event] = []
+            for item in items:
+                if item is SimulationWorker._STOP:
+                    for event in flushed:
+                        event.set()
+                    return
+                if isinstance(item, threading.Event):
+                    flushed.append(item)
+                elif isinstance(item, tuple):
+                    command, args = item
+                    try:
+                        command(*args)
+                    except Exception as e:
+                        print(f"Error running simulation command {command}: {e}")
+                    changed = True
+
+            if self.running and time.perf_counter() >= next_batch:
+                next_batch = time.perf_counter() + self.tick_scheduler.frame_interval()
+                self.tick_scheduler.run(self.world.update)
+                changed = True
+            if changed:
+                self.buffer.publish(WorldSnapshot.capture(self.world, self.selected))
+            # The snapshot showing the effect of the flushed commands is published before anyone waiting is woken up
+            for event in flushed:
+                event.set()
+
+    # endregion
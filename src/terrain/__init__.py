@@ -1 +1 @@
-__all__ = ["tile", "world"]
+__all__ = ["occupancy", "snapshot", "tile", "world"]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+class Occupancy:
+    """
+    Dense occupancy grids of a world.
+
+    For every cell the grids hold the organism store index of the animal and the plant occupying it, or Occupancy.EMPTY
+    if there is none. Occupancy checks and moves are single array reads and writes and whole-grid masks can be computed
+    in one vectorized expression.
+
+    Attributes:
+        EMPTY (int): The value of a cell without an organism.
+        animals (np.ndarray): The store index of the animal in every cell, indexed by (row, col).
+        plants (np.ndarray): The store index of the plant in every cell, indexed by (row, col).
+
+    Methods:
+        remap(remap): Update the stored indices after the organism store has been compacted.
+        clear(): Empty all cells.
+    """
+
+    EMPTY: int = -1
+
+    def __init__(self, rows: int, cols: int) -> None:
+        """
+        Initialize empty occupancy grids.
+
+        Parameters:
+            rows (int): The number of rows of the grids.
+            cols (int): The number of columns of the grids.
+
+        Raises:
+            ValueError: If rows or cols is smaller than 1.
+
+        Returns:
+            None
+        """
+        if rows < 1 or cols < 1:
+            raise ValueError(f"Occupancy grid of {rows}x{cols} needs at least one cell.")
+
+        self.animals: np.ndarray = np.full((rows, cols), Occupancy.EMPTY, dtype=np.int64)
+        self.plants: np.ndarray = np.full((rows, cols), Occupancy.EMPTY, dtype=np.int64)
+
+    def remap(self, remap: np.ndarray) -> None:
+        """
+        Update the stored indices after the organism store has been compacted.
+
+        Parameters:
+            remap (np.ndarray): For every old store index the new one, as returned by OrganismStore.compact().
+
+        Returns:
+            None
+        """
+        for grid in (self.animals, self.plants):
+            occupied = grid != Occupancy.EMPTY
+            grid[occupied] = remap[grid[occupied]]
+
+    def clear(self) -> None:
+        """
+        Empty all cells.
+
+        Returns:
+            None
+        """
+        self.animals.fill(Occupancy.EMPTY)
+        self.plants.fill(Occupancy.EMPTY)
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..entities.organism_store import OrganismStore
+from ..settings import simulation
+from .occupancy import Occupancy
+
+if TYPE_CHECKING:
+    import pygame
+
+    from ..entities.organism import Organism
+
+
+class OrganismStats:
+    """
+    Copy of the stats of an organism, taken on the thread updating the world so another thread can show them.
+
+    Attributes:
+        organism_id (int): The id of the organism.
+        headers (list[str]): The name of every stat.
+        values (list): The value of every stat.
+        rect (pygame.Rect): The rect of the organism, relative to the world.
+    """
+
+    __slots__ = ("organism_id", "headers", "values", "rect")
+
+    def __init__(self, organism: Organism) -> None:
+        """
+        Copy the stats of an organism. Has to be called from the thread updating the world.
+
+        Parameters:
+            organism (Organism): The organism to copy the stats of.
+
+        Returns:
+            None
+        """
+        self.organism_id: int = organism.id
+        self.headers: list[str] = organism.get_headers()
+        self.values: list = organism.get_stats()
+        self.rect: pygame.Rect = organism.rect.copy()
+
+
+class WorldSnapshot:
+    """
+    Immutable picture of everything needed to draw a world after a tick.
+
+    A snapshot copies the occupancy grids, the colors of the occupying organisms and the biomes out of the live world, so
+    it can be drawn by another thread while the world keeps updating. All its arrays are read only.
+
+    Attributes:
+        age (int): The age of the world when the snapshot was taken.
+        animal_ids (np.ndarray): The id of the animal in every cell or Occupancy.EMPTY, indexed by (row, col).
+        plant_ids (np.ndarray): The id of the plant in every cell or Occupancy.EMPTY, indexed by (row, col).
+        animal_colors (np.ndarray): The RGB color of the animal in every cell, indexed by (row, col, channel).
+        plant_colors (np.ndarray): The RGB color of the plant in every cell, indexed by (row, col, channel).
+        biomes (np.ndarray): The biome id of every cell, indexed by (row, col).
+        animals (int): The number of living animals.
+        plants (int): The number of living plants.
+        selected (OrganismStats | None): The stats of the selected organism, None if no organism is selected.
+
+    Methods:
+        capture(world, selected): Take a snapshot of a world.
+    """
+
+    def __init__(
+        self,
+        age: int,
+        animal_ids: np.ndarray,
+        plant_ids: np.ndarray,
+        animal_colors: np.ndarray,
+        plant_colors: np.ndarray,
+        biomes: np.ndarray,
+        selected: OrganismStats | None = None,
+    ) -> None:
+        """
+        Initialize a WorldSnapshot. The arrays are owned by the snapshot afterwards and made read only.
+
+        Parameters:
+            age (int): The age of the world.
+            animal_ids (np.ndarray): The id of the animal in every cell or Occupancy.EMPTY.
+            plant_ids (np.ndarray): The id of the plant in every cell or Occupancy.EMPTY.
+            animal_colors (np.ndarray): The RGB color of the animal in every cell.
+            plant_colors (np.ndarray): The RGB color of the plant in every cell.
+            biomes (np.ndarray): The biome id of every cell.
+            selected (OrganismStats | None): The stats of the selected organism. Default is None.
+
+        Raises:
+            ValueError: If the arrays do not cover the same grid.
+
+        Returns:
+            None
+        """
+        shape = biomes.shape
+        if (
+            animal_ids.shape != shape
+            or plant_ids.shape != shape
+            or animal_colors.shape != (*shape, 3)
+            or plant_colors.shape != (*shape, 3)
+        ):
+            raise ValueError(f"All snapshot arrays need to cover a grid of {shape}.")
+
+        self.age: int = age
+        self.animal_ids: np.ndarray = animal_ids
+        self.plant_ids: np.ndarray = plant_ids
+        self.animal_colors: np.ndarray = animal_colors
+        self.plant_colors: np.ndarray = plant_colors
+        self.biomes: np.ndarray = biomes
+        self.selected: OrganismStats | None = selected
+        for array in (animal_ids, plant_ids, animal_colors, plant_colors, biomes):
+            array.flags.writeable = False
+        self.animals: int = int(np.count_nonzero(animal_ids != Occupancy.EMPTY))
+        self.plants: int = int(np.count_nonzero(plant_ids != Occupancy.EMPTY))
+
+    @classmethod
+    def capture(cls, world, selected: Organism | None = None) -> WorldSnapshot:
+        """
+        Take a snapshot of a world. Has to be called from the thread updating the world.
+
+        Parameters:
+            world (World): The world to take the snapshot of.
+            selected (Organism | None): The organism whose stats are copied into the snapshot. Default is None.
+
+        Returns:
+            WorldSnapshot: The snapshot.
+        """
+        store = simulation.organism_store
+        colors = slice(OrganismStore.COLOR_R, OrganismStore.COLOR_B + 1)
+        grids = []
+        for occupancy in (world.occupancy.animals, world.occupancy.plants):
+            occupied = occupancy != Occupancy.EMPTY
+            ids = np.full(occupancy.shape, Occupancy.EMPTY, dtype=np.int64)
+            ids[occupied] = store.id[occupancy[occupied]]
+            rgb = np.zeros((*occupancy.shape, 3), dtype=np.uint8)
+            # Like pygame.Color(int(value), ...) in DNA.color the gene values are truncated
+            rgb[occupied] = np.clip(store.genes[occupancy[occupied], colors], 0, 255)
+            grids.append((ids, rgb))
+        (animal_ids, animal_colors), (plant_ids, plant_colors) = grids
+        return cls(
+            world.age,
+            animal_ids,
+            plant_ids,
+            animal_colors,
+            plant_colors,
+            world.biome_map.copy(),
+            OrganismStats(selected) if selected is not None else None,
+        )
+
+
+class SnapshotBuffer:
+    """
+    Double buffer handing snapshots from the thread updating the world to the thread drawing it.
+
+    The producer publishes into the back slot and swaps it to the front, the consumer always reads the front slot. As
+    snapshots are immutable neither side ever waits for the other to finish drawing or updating.
+
+    Attributes:
+        published (int): The number of snapshots published so far.
+
+    Methods:
+        publish(snapshot): Make a snapshot the latest one.
+        latest(): Get the latest snapshot.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty SnapshotBuffer.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self.published: int = 0
+        self._slots: list[WorldSnapshot | None] = [None, None]
+        self._front: int = 0
+        self._lock = threading.Lock()
+
+    def publish(self, snapshot: WorldSnapshot) -> None:
+        """
+        Make a snapshot the latest one.
+
+        Parameters:
+            snapshot (WorldSnapshot): The new snapshot.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            back = 1 - self._front
+            self._slots[back] = snapshot
+            self._front = back
+            self.published += 1
+
+    def latest(self) -> WorldSnapshot | None:
+        """
+        Get the latest snapshot.
+
+        Parameters:
+            None
+
+        Returns:
+            WorldSnapshot | None: The latest published snapshot, None if none has been published yet.
+        """
+        with self._lock:
+            return self._slots[self._front]
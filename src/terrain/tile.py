@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-import random
+from bisect import bisect_left, bisect_right
 
+import numpy as np
 import pygame
 
+from ..settings import simulation
 from .direction import Direction
+from .occupancy import Occupancy
 
 
 class Tile(pygame.sprite.Sprite):
@@ -42,16 +45,33 @@ class Tile(pygame.sprite.Sprite):
         FAVORABLE_GROWTH: float - Favorable growth value.
         VERY_FAVORABLE_GROWTH: float - Very favorable growth value.
         OPTIMAL_GROWTH: float - Optimal growth value.
+        WATER, BEACH, ..., SNOW: int - Ids of the biomes.
+        BIOME_COLORS: tuple[pygame.Color, ...] - Color of every biome, indexed by biome id.
+        BIOME_GROWTHS: np.ndarray - Plant growth potential of every biome, indexed by biome id.
+        BIOME_HAS_WATER: np.ndarray - Water flag of every biome, indexed by biome id.
+        HEIGHT_BANDS: tuple[float, ...] - Upper (inclusive) height bound of every row of the biome table.
+        MOISTURE_BANDS: tuple[float, ...] - Lower (inclusive) moisture bound of every column of the biome table except the first.
+        BIOME_TABLE: np.ndarray - The biome id for every (height band, moisture band).
 
     Methods:
-        __init__(self, rect: pygame.Rect, height: float = 0, moisture: float = 0, is_border: bool = False) -> None:
+        __init__(self, rect: pygame.Rect, height: float = 0, moisture: float = 0, is_border: bool = False, occupancy: Occupancy | None = None) -> None:
             Initialize a Tile object.
+        set_terrain(self, height: float, moisture: float, biome: int | None = None) -> bool:
+            Set the height and moisture level of the tile at once.
+        classify(cls, height: float, moisture: float) -> int:
+            Get the biome id for a height and moisture level.
+        classify_grid(cls, heights: np.ndarray, moistures: np.ndarray) -> np.ndarray:
+            Get the biome ids for whole grids of height and moisture levels.
         draw(self, screen: pygame.Surface) -> None:
             Draw the tile on the screen.
         add_animal(self, animal) -> None:
             Add an animal to the tile.
         add_plant(self, plant) -> None:
             Add a plant to the tile.
+        remove_animal(self, animal) -> None:
+            Remove an animal from the tile.
+        remove_plant(self, plant) -> None:
+            Remove a plant from the tile.
         has_animal(self) -> bool:
             Check if the tile has an animal.
         has_plant(self) -> bool:
@@ -126,12 +146,109 @@ class Tile(pygame.sprite.Sprite):
     # endregion
     # endregion
 
+    # region biomes
+    WATER: int = 0
+    BEACH: int = 1
+    SUBTROPICAL_DESERT: int = 2
+    GRASSLAND: int = 3
+    TROPICAL_SEASONAL_FOREST: int = 4
+    TROPICAL_RAIN_FOREST: int = 5
+    TEMPERATE_DESERT: int = 6
+    TEMPERATE_DECIDUOUS_FOREST: int = 7
+    TEMPERATE_RAIN_FOREST: int = 8
+    SHRUBLAND: int = 9
+    TAIGA: int = 10
+    SCORCHED: int = 11
+    BARE: int = 12
+    TUNDRA: int = 13
+    SNOW: int = 14
+
+    BIOME_COLORS: tuple[pygame.Color, ...] = (
+        WATER_COLOR,
+        SAND_COLOR,
+        SUBTROPICAL_DESERT_COLOR,
+        GRASSLAND_COLOR,
+        TROPICAL_SEASONAL_FOREST_COLOR,
+        TROPICAL_RAIN_FOREST_COLOR,
+        TEMPERATE_DESERT_COLOR,
+        TEMPERATE_DECIDUOUS_FOREST_COLOR,
+        TEMPERATE_RAIN_FOREST_COLOR,
+        SHRUBLAND_COLOR,
+        TAIGA_COLOR,
+        SCORCHED_COLOR,
+        BARE_COLOR,
+        TUNDRA_COLOR,
+        SNOW_COLOR,
+    )
+    BIOME_GROWTHS: np.ndarray = np.array(
+        [
+            WATER_PLANT_GROWTH,
+            BEACH_PLANT_GROWTH,
+            SUBTROPICAL_DESERT_PLANT_GROWTH,
+            GRASSLAND_PLANT_GROWTH,
+            TROPICAL_SEASON_FOREST_PLANT_GROWTH,
+            TROPICAL_RAIN_FOREST_PLANT_GROWTH,
+            TEMPERATE_DESERT_PLANT_GROWTH,
+            TEMPERATER_DECIDOUS_FOREST_PLANT_GROWTH,
+            TEMPERATE_RAIN_FOREST_PLANT_GROWTH,
+            SHRUBLAND_PLANT_GROWTH,
+            TAIGA_PLANT_GROWTH,
+            SCORCHED_PLANT_GROWTH,
+            BARE_PLANT_GROWTH,
+            TUNDRA_PLANT_GROWTH,
+            SNOW_PLANT_GROWTH,
+        ]
+    )
+    BIOME_HAS_WATER: np.ndarray = np.arange(len(BIOME_COLORS)) == WATER
+
+    # TODO add all these as settings
+    # For every height band (height <= level) the biomes by moisture (moisture < bound), the last one covers the rest
+    _BIOME_RULES: tuple[tuple[float, tuple[tuple[float, int], ...]], ...] = (
+        (WATER_HEIGHT_LEVEL, ((1, WATER),)),
+        # TODO update this so not every tile close to water is sand but it depends on moisture
+        (BEACH_HEIGHT_LEVEL, ((1, BEACH),)),
+        (
+            TROPICAL_HEIGHT_LEVEL,
+            (
+                (0.16, SUBTROPICAL_DESERT),
+                (0.33, GRASSLAND),
+                (0.66, TROPICAL_SEASONAL_FOREST),
+                (1, TROPICAL_RAIN_FOREST),
+            ),
+        ),
+        (
+            TEMPERATE_HEIGHT_LEVEL,
+            (
+                (0.16, TEMPERATE_DESERT),
+                (0.50, GRASSLAND),
+                (0.83, TEMPERATE_DECIDUOUS_FOREST),
+                (1, TEMPERATE_RAIN_FOREST),
+            ),
+        ),
+        (
+            TRANSITION_HEIGHT_LEVEL,
+            ((0.33, TEMPERATE_DESERT), (0.66, SHRUBLAND), (1, TAIGA)),
+        ),
+        (
+            MOUNTAIN_HEIGHT_LEVEL,
+            ((0.1, SCORCHED), (0.2, BARE), (0.5, TUNDRA), (1, SNOW)),
+        ),
+    )
+    HEIGHT_BANDS: tuple[float, ...] = tuple(level for level, _ in _BIOME_RULES)
+    MOISTURE_BANDS: tuple[float, ...] = tuple(
+        sorted({bound for _, rules in _BIOME_RULES for bound, _ in rules[:-1]})
+    )
+    BIOME_TABLE: np.ndarray
+    _biome_rows: list[list[int]]
+    # endregion
+
     def __init__(
         self,
         rect: pygame.Rect,
         height: float = 0,
         moisture: float = 0,
         is_border: bool = False,
+        occupancy: Occupancy | None = None,
     ) -> None:
         """
         Initialize a Tile object.
@@ -141,6 +258,7 @@ class Tile(pygame.sprite.Sprite):
         - height (float): The height level of the tile, ranging from 0 to 1. Default is 0.
         - moisture (float): The moisture level of the tile, ranging from 0 to 1. Default is 0.
         - is_border (bool): Flag indicating if the tile is a border tile. Default is False.
+        - occupancy (Occupancy | None): The occupancy grids of the world the tile belongs to. If None the tile gets its own single cell grids. Default is None.
 
         Returns:
         - None
@@ -148,18 +266,27 @@ class Tile(pygame.sprite.Sprite):
         pygame.sprite.Sprite.__init__(self)
 
         self.rect: pygame.Rect = rect
+        self.row: int = self.rect.y // self.rect.height
+        self.col: int = self.rect.x // self.rect.width
         self.image: pygame.Surface = pygame.Surface(self.rect.size)
         self.neighbors: dict[Direction, Tile] = {}
         self._height: float = height
         self._moisture: float = moisture
 
+        self.biome: int
         self.plant_growth_potential: float
-        self.color: pygame.Color
+        self.color: pygame.Color = None
         self.has_water: bool
         self._set_height_moisture_dependent_attributes()
 
-        self.animal: pygame.sprite.GroupSingle = pygame.sprite.GroupSingle()
-        self.plant: pygame.sprite.GroupSingle = pygame.sprite.GroupSingle()
+        self.occupancy: Occupancy
+        self.cell: tuple[int, int]
+        if occupancy is None:
+            self.occupancy = Occupancy(1, 1)
+            self.cell = (0, 0)
+        else:
+            self.occupancy = occupancy
+            self.cell = (self.row, self.col)
 
         self.is_border: bool = is_border
         self.is_coast: bool = False
@@ -169,6 +296,26 @@ class Tile(pygame.sprite.Sprite):
         # endregion
 
     # region properties
+    @property
+    def animal(self):
+        """
+        The animal occupying the tile or None.
+        """
+        index = self.occupancy.animals.item(self.cell)
+        if index == Occupancy.EMPTY:
+            return None
+        return simulation.organism_store.views[index]
+
+    @property
+    def plant(self):
+        """
+        The plant occupying the tile or None.
+        """
+        index = self.occupancy.plants.item(self.cell)
+        if index == Occupancy.EMPTY:
+            return None
+        return simulation.organism_store.views[index]
+
     @property
     def moisture(self) -> float:
         return self._moisture
@@ -221,103 +368,111 @@ class Tile(pygame.sprite.Sprite):
             self._height = value
         self._set_height_moisture_dependent_attributes()
 
+    def set_terrain(
+        self, height: float, moisture: float, biome: int | None = None
+    ) -> bool:
+        """
+        Set the height and moisture level of the Tile object at once.
+
+        Unlike setting height and moisture one after the other, the dependent attributes are only recalculated once.
+
+        Parameters:
+        - height (float): The height value to be set. Should be between 0 and 1.
+        - moisture (float): The moisture level to be set. Should be between 0 and 1.
+        - biome (int | None): The biome id if it has already been looked up for the whole grid (see Tile.classify_grid). Default is None.
+
+        Raises:
+        - ValueError: If the provided height or moisture value is smaller than 0 or bigger than 1.
+
+        Returns:
+        - bool: True if the color of the tile changed and it needs to be redrawn.
+        """
+        if not 0 <= height <= 1:
+            raise ValueError(f"Height value {height} is not in range [0, 1]")
+        if not 0 <= moisture <= 1:
+            raise ValueError(f"Moisture value {moisture} is not in range [0, 1]")
+        self._height = height
+        self._moisture = moisture
+        return self._set_height_moisture_dependent_attributes(biome)
+
     # endregion
 
     # region setup
-    def _set_height_moisture_dependent_attributes(self) -> None:
-        """
-        Set the color and plant growth potential attributes of a Tile object based on its height and moisture levels.
-        """
-        # TODO add all these as settings
-        self.has_water = False
-
-        if self.height <= Tile.WATER_HEIGHT_LEVEL:
-            # Waterlogged, no growth
-            self.plant_growth_potential = Tile.WATER_PLANT_GROWTH
-            self.color = Tile.WATER_COLOR
-            self.has_water = True
-        elif (
-            self.height <= Tile.BEACH_HEIGHT_LEVEL
-        ):  # TODO update this so not every tile close to water is sand but it depends on moisture
-            # Sandy areas have limited growth
-            self.plant_growth_potential = Tile.BEACH_PLANT_GROWTH
-            self.color = Tile.SAND_COLOR
-        elif self.height <= Tile.TROPICAL_HEIGHT_LEVEL:
-            if self.moisture < 0.16:
-                # Subtropical desert, low growth
-                self.plant_growth_potential = Tile.SUBTROPICAL_DESERT_PLANT_GROWTH
-                self.color = Tile.SUBTROPICAL_DESERT_COLOR
-            elif self.moisture < 0.33:
-                # Grassland, favorable
-                self.plant_growth_potential = Tile.GRASSLAND_PLANT_GROWTH
-                self.color = Tile.GRASSLAND_COLOR
-            elif self.moisture < 0.66:
-                # Tropical seasonal forest, favorable
-                self.plant_growth_potential = Tile.TROPICAL_SEASON_FOREST_PLANT_GROWTH
-                self.color = Tile.TROPICAL_SEASONAL_FOREST_COLOR
-            else:
-                # Tropical rain forest, very favorable
-                self.plant_growth_potential = Tile.TROPICAL_RAIN_FOREST_PLANT_GROWTH
-                self.color = Tile.TROPICAL_RAIN_FOREST_COLOR
-        elif self.height <= Tile.TEMPERATE_HEIGHT_LEVEL:
-            if self.moisture < 0.16:
-                # Temperate desert, low growth
-                self.plant_growth_potential = Tile.TEMPERATE_DESERT_PLANT_GROWTH
-                self.color = Tile.TEMPERATE_DESERT_COLOR
-            elif self.moisture < 0.50:
-                # Grassland, favorable
-                self.plant_growth_potential = Tile.GRASSLAND_PLANT_GROWTH
-                self.color = Tile.GRASSLAND_COLOR
-            elif self.moisture < 0.83:
-                # Temperate deciduous forest, very favorable
-                self.plant_growth_potential = (
-                    Tile.TEMPERATER_DECIDOUS_FOREST_PLANT_GROWTH
-                )
-                self.color = Tile.TEMPERATE_DECIDUOUS_FOREST_COLOR
-            else:
-                # Temperate rain forest, optimal
-                self.plant_growth_potential = Tile.TEMPERATE_RAIN_FOREST_PLANT_GROWTH
-                self.color = Tile.TEMPERATE_RAIN_FOREST_COLOR
-        elif self.height <= Tile.TRANSITION_HEIGHT_LEVEL:
-            if self.moisture < 0.33:
-                # Temperate desert, low growth
-                self.plant_growth_potential = Tile.TEMPERATE_DESERT_PLANT_GROWTH
-                self.color = Tile.TEMPERATE_DESERT_COLOR
-            elif self.moisture < 0.66:
-                # Shrubland, moderate growth
-                self.plant_growth_potential = Tile.SHRUBLAND_PLANT_GROWTH
-                self.color = Tile.SHRUBLAND_COLOR
-            else:
-                # Taiga, favorable
-                self.plant_growth_potential = Tile.TAIGA_PLANT_GROWTH
-                self.color = Tile.TAIGA_COLOR
-        elif self.height <= Tile.MOUNTAIN_HEIGHT_LEVEL:
-            if self.moisture < 0.1:
-                # Scorched, minimal growth
-                self.plant_growth_potential = Tile.SCORCHED_PLANT_GROWTH
-                self.color = Tile.SCORCHED_COLOR
-            elif self.moisture < 0.2:
-                # Bare, low growth
-                self.plant_growth_potential = Tile.BARE_PLANT_GROWTH
-                self.color = Tile.BARE_COLOR
-            elif self.moisture < 0.5:
-                # Tundra, moderate growth
-                self.plant_growth_potential = Tile.TUNDRA_PLANT_GROWTH
-                self.color = Tile.TUNDRA_COLOR
-            else:
-                # Snow, slightly favorable
-                self.plant_growth_potential = Tile.SNOW_PLANT_GROWTH
-                self.color = Tile.SNOW_COLOR
-
-        if self.color is None:
-            raise ValueError(
-                f"Color has not been set. moisture={self.moisture} height={self.height}"
-            )
-        if self.plant_growth_potential is None:
-            raise ValueError(
-                f"Plant growth has not been set. moisture={self.moisture} height={self.height}"
-            )
+    def _set_height_moisture_dependent_attributes(self, biome: int | None = None) -> bool:
+        """
+        Set the biome, color, water flag and plant growth potential attributes of a Tile object based on its height and moisture levels.
+
+        Parameters:
+        - biome (int | None): The already looked up biome id of the tile. If None it is classified from the height and moisture levels. Default is None.
+
+        Returns:
+        - bool: True if the color of the tile changed and it needs to be redrawn.
+        """
+        if biome is None:
+            biome = Tile.classify(self._height, self._moisture)
+        self.biome = biome
+        self.plant_growth_potential = Tile.BIOME_GROWTHS.item(biome)
+        self.has_water = biome == Tile.WATER
+
+        color = Tile.BIOME_COLORS[biome]
+        if color is self.color:
+            return False
+        self.color = color
         self.image.fill(self.color)
+        return True
+
+    @classmethod
+    def classify(cls, height: float, moisture: float) -> int:
+        """
+        Get the biome id for a height and moisture level.
+
+        Parameters:
+        - height (float): The height level, ranging from 0 to 1.
+        - moisture (float): The moisture level, ranging from 0 to 1.
+
+        Returns:
+        - int: The id of the biome.
+        """
+        return cls._biome_rows[bisect_left(cls.HEIGHT_BANDS, height)][
+            bisect_right(cls.MOISTURE_BANDS, moisture)
+        ]
+
+    @classmethod
+    def classify_grid(cls, heights: np.ndarray, moistures: np.ndarray) -> np.ndarray:
+        """
+        Get the biome ids for whole grids of height and moisture levels in one table lookup.
+
+        Parameters:
+        - heights (np.ndarray): The height levels, ranging from 0 to 1.
+        - moistures (np.ndarray): The moisture levels, ranging from 0 to 1, same shape as heights.
+
+        Returns:
+        - np.ndarray: The id of the biome for every cell.
+        """
+        height_bands = np.searchsorted(cls.HEIGHT_BANDS, heights, side="left")
+        moisture_bands = np.searchsorted(cls.MOISTURE_BANDS, moistures, side="right")
+        return cls.BIOME_TABLE[height_bands, moisture_bands]
+
+    @classmethod
+    def _build_biome_table(cls) -> None:
+        """
+        Build the biome table from the biome rules.
+
+        A moisture band covers all moisture levels between two consecutive MOISTURE_BANDS bounds, so every band lies
+        completely below or above each bound of the rules.
+        """
+        band_tops = list(cls.MOISTURE_BANDS) + [float("inf")]
+        cls._biome_rows = [
+            [
+                next(
+                    (biome for bound, biome in rules[:-1] if top <= bound),
+                    rules[-1][1],
+                )
+                for top in band_tops
+            ]
+            for _, rules in cls._BIOME_RULES
+        ]
+        cls.BIOME_TABLE = np.array(cls._biome_rows, dtype=np.int8)
 
     # endregion
 
@@ -346,7 +501,7 @@ class Tile(pygame.sprite.Sprite):
         if self.has_animal():
             raise ValueError("Trying to add an animal despite tile already holding one")
 
-        self.animal.add(animal)
+        self.occupancy.animals[self.cell] = animal.store_index
         self.times_visted += 1
 
         if animal.tile != self:
@@ -372,18 +527,48 @@ class Tile(pygame.sprite.Sprite):
         if self.has_plant():
             raise ValueError("Trying to add an plant despite tile already holding one")
 
-        self.plant.add(plant)
+        self.occupancy.plants[self.cell] = plant.store_index
 
         if plant.tile != self:
             raise ValueError(
                 "Plant's tile reference not matching with tile's plant reference"
             )
 
+    def remove_animal(self, animal) -> None:
+        """
+        Remove an animal from the Tile object.
+
+        Nothing happens if the tile is not held by the given animal.
+
+        Parameters:
+        - animal: The animal object to be removed from the tile.
+
+        Returns:
+        - None
+        """
+        if self.occupancy.animals.item(self.cell) == animal.store_index:
+            self.occupancy.animals[self.cell] = Occupancy.EMPTY
+
+    def remove_plant(self, plant) -> None:
+        """
+        Remove a plant from the Tile object.
+
+        Nothing happens if the tile is not held by the given plant.
+
+        Parameters:
+        - plant: The plant object to be removed from the tile.
+
+        Returns:
+        - None
+        """
+        if self.occupancy.plants.item(self.cell) == plant.store_index:
+            self.occupancy.plants[self.cell] = Occupancy.EMPTY
+
     def has_animal(self) -> bool:
-        return self.animal
+        return self.occupancy.animals.item(self.cell) != Occupancy.EMPTY
 
     def has_plant(self) -> bool:
-        return self.plant
+        return self.occupancy.plants.item(self.cell) != Occupancy.EMPTY
 
     # endregion
 
@@ -491,7 +676,7 @@ class Tile(pygame.sprite.Sprite):
             options.append(tile)
 
         try:
-            return random.choice(options)
+            return simulation.rng.choice(options)
         except IndexError:  # If no choices
             return None
 
@@ -508,3 +693,6 @@ class Tile(pygame.sprite.Sprite):
         return tile in self.neighbors.values()
 
     # endregion
+
+
+Tile._build_biome_table()
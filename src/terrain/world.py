@@ -2,15 +2,20 @@ from __future__ import annotations
 
 import random
 
+import numpy as np
 import pygame
 import pygame_menu
 
 from ..entities.animal import Animal
+from ..entities.organism import Organism
 from ..entities.plant import Plant
 from ..helper.noise_function import NoiseFunction
+from ..helper.reload_scheduler import ReloadScheduler
 from ..helper.setting import BoundedSetting
 from ..settings import simulation
 from .direction import Direction
+from .occupancy import Occupancy
+from .snapshot import WorldSnapshot
 from .tile import Tile
 
 
@@ -22,9 +27,9 @@ class World(pygame.sprite.Sprite):
         loading_screen_theme: The theme for the loading screen.
         age: The age of the world.
         rect: The rectangle representing the world.
-        image: The surface for the world.
-        organism_surface: The surface for organisms.
+        image: The surface for the world, holding the last drawn ground and organisms.
         ground_surface: The surface for the ground.
+        headless: Flag indicating if the world runs without any surfaces, menus or display access.
         generating: Flag indicating if the world is generating.
         progress: The progress of the world generation.
         progress_bar: The progress bar for the generation.
@@ -32,15 +37,28 @@ class World(pygame.sprite.Sprite):
         cols: The number of columns in the world.
         rows: The number of rows in the world.
         tiles: The group of tiles in the world.
+        reload_scheduler: Coalesces the reloads requested by the terrain settings into at most one per frame.
+        tile_grid: The tiles indexed by [row][col].
+        occupancy: The animal and plant occupancy grids of the world.
+        water_map: Whether every tile has water, indexed by (row, col).
+        biome_map: The biome id of every tile, indexed by (row, col).
+        height_map: The height of every tile, indexed by (row, col).
+        moisture_map: The moisture of every tile, indexed by (row, col).
+        growth_map: The plant growth potential of every tile, indexed by (row, col).
+        grid_rendering: Flag indicating if the organisms are drawn as one scaled color grid instead of cell by cell.
 
     Methods:
+        activate(): Make the random streams of the world the current ones.
         update(): Update the world state.
-        draw(screen): Draw the world on the screen.
+        draw(screen, snapshot): Draw the changed parts of the world on the screen and return the dirty rects.
+        invalidate(rect): Mark a part of the screen covered by the world to be redrawn.
+        set_grid_rendering(enabled): Switch between drawing the organisms cell by cell and as one color grid.
         reload(): Reload height and moisture values for tiles.
         spawn_animals(amount): Spawn animals on unoccupied tiles.
         spawn_plants(amount): Spawn plants on unoccupied tiles.
         spawn_animal(tile): Spawn an animal on a tile.
         spawn_plant(tile): Spawn a plant on a tile.
+        free_land_mask(for_animals): Get a mask of all land tiles without an animal or plant.
         create_tile(row, col): Create a new tile.
         add_neighbors(tiles): Add neighbors to tiles.
         is_border_tile(row, col): Check if a tile is a border tile.
@@ -49,6 +67,8 @@ class World(pygame.sprite.Sprite):
         _setup_noise_functions(): Set up noise functions.
         generate_height_values(x, y): Generate height values.
         generate_moisture_values(x, y): Generate moisture values.
+        generate_height_map(): Generate the height values of all tiles at once.
+        generate_moisture_map(): Generate the moisture values of all tiles at once.
         randomise_freqs(): Randomize frequency values.
         _setup_progress_bar(): Set up the progress bar.
         copy(): Create a copy of the world.
@@ -64,24 +84,53 @@ class World(pygame.sprite.Sprite):
     loading_screen_theme = pygame_menu.pygame_menu.themes.THEME_GREEN.copy()
     loading_screen_theme.title = False  # Loading screen does not need a title
 
-    def __init__(self, rect: pygame.Rect, tile_size: int) -> None:
+    def __init__(
+        self,
+        rect: pygame.Rect,
+        tile_size: int,
+        headless: bool = False,
+        seed: int | None = None,
+        height_map: np.ndarray | None = None,
+        moisture_map: np.ndarray | None = None,
+    ) -> None:
         """
         Initialize the World object with the given rectangle and tile size.
 
         Parameters:
             rect (pygame.Rect): The rectangle representing the world.
             tile_size (int): The size of the tiles in the world.
+            headless (bool): If True no world surfaces, loading menu or display calls are made. Default is False.
+            seed (int | None): The seed of the random streams of the world, used for the terrain and all organisms. Two
+                worlds created with the same seed and settings run identically. If None a random seed is used. Default
+                is None.
+            height_map (np.ndarray | None): The height of every tile, indexed by (row, col). If the height and moisture
+                maps are given the terrain is taken from them instead of being generated and the noise functions are
+                not randomised, e.g. when restoring a checkpoint. Default is None.
+            moisture_map (np.ndarray | None): The moisture of every tile, see height_map. Default is None.
+
+        Raises:
+            ValueError: If only one of height_map and moisture_map is given or their shape does not match the tile grid.
 
         Returns:
             None
         """
         pygame.sprite.Sprite.__init__(self)
         self.age: int = 0
+        self.seed: int = seed if seed is not None else simulation.random_seed()
+        # The world owns its random streams, see activate
+        self.rng: random.Random = random.Random(self.seed)
+        self.np_rng: np.random.Generator = np.random.Generator(
+            np.random.PCG64(self.seed)
+        )
+        self.activate()
 
         self.rect: pygame.Rect = rect
-        self.image: pygame.Surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        self.organism_surface: pygame.Surface = self.image.copy()
-        self.ground_surface: pygame.Surface = self.image.copy()
+        self.headless: bool = headless
+        self.image: pygame.Surface | None = None
+        self.ground_surface: pygame.Surface | None = None
+        if not self.headless:
+            self.image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            self.ground_surface = self.image.copy()
         self.generating = False
         self.progress = 0
         self.progress_bar = None
@@ -90,73 +139,367 @@ class World(pygame.sprite.Sprite):
         self.cols = self.rect.width // tile_size
         self.rows = self.rect.height // tile_size
 
+        self.occupancy: Occupancy = Occupancy(self.rows, self.cols)
+
+        # region rendering
+        # What every cell showed when it was last drawn, compared against the current state to find the dirty cells
+        self._drawn_animals: np.ndarray = np.full((self.rows, self.cols), -1)
+        self._drawn_plants: np.ndarray = np.full((self.rows, self.cols), -1)
+        # The biome every cell of the ground surface shows
+        self._ground_biomes: np.ndarray = np.full((self.rows, self.cols), -1)
+        # The rect of every tile by flat cell index row * cols + col
+        self._cell_rects: list[pygame.Rect] = []
+        self.grid_rendering: bool = False
+        # One pixel per cell and its scaled up copy, created when grid rendering is first used
+        self._grid_layer: pygame.Surface | None = None
+        self._grid_scaled: pygame.Surface | None = None
+        self._invalid_cells: np.ndarray = np.zeros((self.rows, self.cols), dtype=bool)
+        self._invalid_rects: list[pygame.Rect] = []
+        self._redraw_all: bool = True
+        # endregion
+
+        self.reload_scheduler: ReloadScheduler = ReloadScheduler(self.reload)
         self._setup_noise_functions()
-        self._setup_progress_bar()
+        restored = height_map is not None or moisture_map is not None
+        if restored:
+            if height_map is None or moisture_map is None:
+                raise ValueError("Both the height and the moisture map are needed.")
+            shape = (self.rows, self.cols)
+            if height_map.shape != shape or moisture_map.shape != shape:
+                raise ValueError(f"The terrain maps need to be of shape {shape}.")
+        self.height_map: np.ndarray = (
+            height_map if restored else self.generate_height_map()
+        )
+        self.moisture_map: np.ndarray = (
+            moisture_map if restored else self.generate_moisture_map()
+        )
+        self.biome_map: np.ndarray
+        self.growth_map: np.ndarray
+        self.water_map: np.ndarray
+        self._update_biome_maps()
+        if not self.headless:
+            self._setup_progress_bar()
 
         # region tiles
         self.tiles = pygame.sprite.Group()
-        tiles_grid = [
+        self.tile_grid: list[list[Tile]] = [
             [None for _ in range(self.cols)] for _ in range(self.rows)
-        ]  # Only used for add_neighbors
+        ]
         for row in range(self.rows):
             for col in range(self.cols):
                 tile = self.create_tile(row, col)
-                tiles_grid[row][col] = tile
+                self.tile_grid[row][col] = tile
                 self.tiles.add(tile)
-        self.add_neighbors(tiles_grid)
-        self.tiles.draw(self.ground_surface)
+        self.add_neighbors(self.tile_grid)
+        if not self.headless:
+            self.tiles.draw(self.ground_surface)
+            self._ground_biomes = self.biome_map.copy()
+            self._cell_rects = [tile.rect for row in self.tile_grid for tile in row]
         # endregion
 
-        self.randomise_freqs()
+        if not restored:
+            self.randomise_freqs()
 
     # region main methods
+    def activate(self) -> None:
+        """
+        Make the random streams and the noise seed of this world the current ones of the simulation.
+
+        Organisms and noise functions draw from simulation.rng and simulation.np_rng, so every entry point that
+        advances this world calls this first and the run of this world is independent of other worlds.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        simulation.use_streams(self.rng, self.np_rng, self.seed)
+
     def update(self) -> None:
         """
         Update the world state by incrementing the age and updating the organisms in the simulation.
 
+        The organisms are iterated through the organism store in the order they were born, organisms that die during
+        this tick are skipped. The offspring queued by reproducing organisms are created together after all updates (see
+        BirthQueue) and are not updated until the next tick.
+        Afterwards all plants that were alive at the start of the tick and survived it photosynthesise in one batch.
+        If the phase profiler is enabled the tick is counted by it.
+
         Parameters:
             None
 
         Returns:
             None
         """
+        self.activate()
         self.age += 1
-        simulation.organisms.update()
 
-    def draw(self, screen: pygame.Surface) -> None:
+        store = simulation.organism_store
+        if store.needs_compaction():
+            self.occupancy.remap(store.compact())
+
+        plants = store.alive_indices(Plant.KIND)
+        for index in store.alive_indices().tolist():
+            # Columns are reallocated when births grow the store, so they are looked up on every iteration
+            if store.alive[index]:
+                store.views[index].update()
+        Organism.births.commit()
+
+        plants = plants[store.alive[plants]]
+        Plant.photosynthesise_all(
+            plants, self.height_map, self.moisture_map, self.growth_map
+        )
+        if simulation.profiler.enabled:
+            simulation.profiler.tick(self.age)
+
+    def draw(
+        self, screen: pygame.Surface, snapshot: WorldSnapshot | None = None
+    ) -> list[pygame.Rect]:
         """
-        Draw the world on the screen surface.
+        Draw the changed parts of the world on the screen surface.
 
         If the world is currently generating, it will display the loading screen with the progress bar.
-        Otherwise, it will draw the ground surface (tiles) and then draw the organisms on top of it.
+        Otherwise, only the tiles whose color, animal or plant changed since the last call are redrawn, together with the
+        parts of the screen that have been invalidated (see invalidate). The frame cost therefore scales with the activity
+        in the world rather than with its area. The returned rects can be passed to pygame.display.update.
+        The world is drawn from a snapshot, so it can be drawn by another thread than the one updating it (see
+        SimulationWorker). Only the surfaces of the world are touched, never the live organisms or tiles.
 
         Parameters:
             screen (pygame.Surface): The surface on which to draw the world.
+            snapshot (WorldSnapshot | None): The state to draw. If None a snapshot of the current state is taken, which
+                is only safe on the thread updating the world. Default is None.
+
+        Raises:
+            ValueError: If the world is headless and therefore has no surfaces to draw.
 
         Returns:
-            None
+            list[pygame.Rect]: The parts of the screen that have been drawn to.
         """
+        if self.headless:
+            raise ValueError("A headless world cannot be drawn.")
+
         if self.generating:
             if self.progress_bar:
                 self.menu.draw(self.image)
-        else:
-            # Draw the ground / tiles
-            self.image.blit(self.ground_surface, self.rect)
+            screen.blit(self.image, self.rect)
+            self.invalidate()
+            return [self.rect.copy()]
+
+        if snapshot is None:
+            snapshot = WorldSnapshot.capture(self)
+
+        # Terrain reloads only change the biomes, the ground surface is repainted here on the drawing thread
+        recolored = snapshot.biomes != self._ground_biomes
+        for cell in np.flatnonzero(recolored).tolist():
+            row, col = divmod(cell, self.cols)
+            self.ground_surface.fill(
+                Tile.BIOME_COLORS[snapshot.biomes[row, col]],
+                self.tile_grid[row][col].rect,
+            )
+        self._ground_biomes = snapshot.biomes
+
+        dirty = (
+            (snapshot.animal_ids != self._drawn_animals)
+            | (snapshot.plant_ids != self._drawn_plants)
+            | recolored
+        )
+        self._drawn_animals = snapshot.animal_ids
+        self._drawn_plants = snapshot.plant_ids
+
+        redraw_all = self._redraw_all or dirty.sum() * 4 > dirty.size
+        if self.grid_rendering:
+            # The grid costs the same for any number of changed cells
+            redraw_all = redraw_all or dirty.any()
+        if redraw_all:
+            self._draw_all(snapshot)
+            screen.blit(self.image, self.rect)
+            self._invalidate_nothing()
+            return [self.rect.copy()]
+
+        dirty_rects: list[pygame.Rect] = []
+        for cell in np.flatnonzero(dirty).tolist():
+            tile = self.tile_grid[cell // self.cols][cell % self.cols]
+            self._draw_tile(tile, snapshot)
+            dirty_rects.append(tile.rect.move(self.rect.topleft))
+
+        # Invalidated cells did not change, they only need to be copied to the screen again
+        for cell in np.flatnonzero(self._invalid_cells & ~dirty).tolist():
+            tile = self.tile_grid[cell // self.cols][cell % self.cols]
+            dirty_rects.append(tile.rect.move(self.rect.topleft))
+        dirty_rects.extend(self._invalid_rects)
+
+        for rect in dirty_rects:
+            screen.blit(self.image, rect, area=rect.move(-self.rect.x, -self.rect.y))
+        self._invalidate_nothing()
+        return dirty_rects
+
+    def set_grid_rendering(self, enabled: bool) -> None:
+        """
+        Switch between drawing the organisms cell by cell and as one color grid.
+
+        The grid renderer writes the color of every cell into a surface with one pixel per cell, scales it up to the
+        tile size and blits it once, so its cost depends on the size of the world but not on the number of organisms.
+        While it is enabled every frame with a change redraws the whole world.
 
-            # Draw the organisms
-            self.organism_surface.fill(
-                (0, 0, 0, 0)
-            )  # Clear previous drawings on the organism surface
-            simulation.organisms.draw(self.organism_surface)
-            self.image.blit(self.organism_surface, self.rect)
+        Parameters:
+            enabled (bool): If True the grid renderer is used.
+
+        Returns:
+            None
+        """
+        self.grid_rendering = enabled
+        self.invalidate()
+
+    def invalidate(self, rect: pygame.Rect | None = None) -> None:
+        """
+        Mark a part of the screen covered by the world to be redrawn by the next draw call.
+
+        This is needed whenever something else has been drawn over the world, e.g. the cursor or a stat panel.
+
+        Parameters:
+            rect (pygame.Rect | None): The part of the screen to redraw. If None the whole world is redrawn. Default is None.
+
+        Returns:
+            None
+        """
+        if rect is None:
+            self._redraw_all = True
+            return
+
+        clipped = rect.clip(self.rect)
+        if not clipped.width or not clipped.height:
+            return
+        local = clipped.move(-self.rect.x, -self.rect.y)
+        self._invalid_cells[
+            local.top // self.tile_size : (local.bottom - 1) // self.tile_size + 1,
+            local.left // self.tile_size : (local.right - 1) // self.tile_size + 1,
+        ] = True
+        # Parts of the world rect that are not covered by any tile
+        if (
+            local.right > self.cols * self.tile_size
+            or local.bottom > self.rows * self.tile_size
+        ):
+            self._invalid_rects.append(clipped)
+
+    def _invalidate_nothing(self) -> None:
+        self._invalid_cells.fill(False)
+        self._invalid_rects = []
+        self._redraw_all = False
+
+    def _draw_all(self, snapshot: WorldSnapshot) -> None:
+        self.image.fill((0, 0, 0, 0))
+        self.image.blit(self.ground_surface, (0, 0))
+        if self.grid_rendering:
+            self._draw_grid(snapshot)
+            return
+
+        rects = self._cell_rects
+        # Plants are blitted from the shared images of their quantized colors in one call, animals on top of them
+        cells = np.flatnonzero(snapshot.plant_ids != Occupancy.EMPTY)
+        if cells.size:
+            cache = simulation.image_cache
+            step = cache.quantization
+            colors = snapshot.plant_colors.reshape(-1, 3)[cells].astype(np.int32)
+            colors = colors // step * step
+            packed, inverse = np.unique(
+                (colors[:, 0] << 16) | (colors[:, 1] << 8) | colors[:, 2],
+                return_inverse=True,
+            )
+            size = (self.tile_size, self.tile_size)
+            images = [
+                cache.get(
+                    (value >> 16, (value >> 8) & 0xFF, value & 0xFF),
+                    Plant._MAX_ALPHA,
+                    size,
+                )
+                for value in packed.tolist()
+            ]
+            self.image.blits(
+                [
+                    (images[image], rects[cell])
+                    for cell, image in zip(cells.tolist(), inverse.tolist())
+                ],
+                doreturn=False,
+            )
+        fill = self.image.fill
+        cells = np.flatnonzero(snapshot.animal_ids != Occupancy.EMPTY)
+        colors = snapshot.animal_colors.reshape(-1, 3)[cells].tolist()
+        for cell, color in zip(cells.tolist(), colors):
+            fill(color, rects[cell])
+
+    def _draw_grid(self, snapshot: WorldSnapshot) -> None:
+        if self._grid_layer is None:
+            # Same pixel format as the world image, so the scaled layer is blitted with the fast blitter
+            self._grid_layer = pygame.Surface((self.cols, self.rows), pygame.SRCALPHA)
+            self._grid_scaled = pygame.transform.scale(
+                self._grid_layer,
+                (self.cols * self.tile_size, self.rows * self.tile_size),
+            )
 
-        screen.blit(self.image, self.rect)
+        animals = snapshot.animal_ids != Occupancy.EMPTY
+        plants = snapshot.plant_ids != Occupancy.EMPTY
+        # Animals cover plants, plants are translucent and empty cells transparent. The pixel arrays of the layer are
+        # indexed by (x, y), so the grids are transposed.
+        colors = np.where(
+            animals[..., np.newaxis], snapshot.animal_colors, snapshot.plant_colors
+        )
+        alphas = np.where(animals, 255, np.where(plants, Plant._MAX_ALPHA, 0))
+        pygame.surfarray.pixels3d(self._grid_layer)[...] = colors.transpose(1, 0, 2)
+        pygame.surfarray.pixels_alpha(self._grid_layer)[...] = alphas.T
+
+        pygame.transform.scale(
+            self._grid_layer, self._grid_scaled.get_size(), self._grid_scaled
+        )
+        self.image.blit(self._grid_scaled, (0, 0))
+
+    def _draw_tile(self, tile: Tile, snapshot: WorldSnapshot) -> None:
+        self.image.blit(self.ground_surface, tile.rect, area=tile.rect)
+        row, col = tile.row, tile.col
+        if snapshot.plant_ids[row, col] != Occupancy.EMPTY:
+            self._draw_plant(tile.rect, snapshot.plant_colors[row, col].tolist())
+        if snapshot.animal_ids[row, col] != Occupancy.EMPTY:
+            self.image.fill(snapshot.animal_colors[row, col].tolist(), tile.rect)
+
+    def _draw_plant(self, rect: pygame.Rect, color: list[int]) -> None:
+        # Plants are translucent, so they are blended over the ground instead of filled in
+        self.image.blit(
+            simulation.image_cache.get(color, Plant._MAX_ALPHA, rect.size), rect
+        )
 
     def reload(self) -> None:
         """
         Reload the height and moisture values for all tiles in the world.
 
-        This method iterates over all tiles in the world, updates their height and moisture values based on the current noise functions and settings, and redraws the tiles on the ground surface.
+        This method evaluates the current noise functions and settings over the whole tile grid at once and classifies the biomes of all tiles in one table lookup.
+        It then updates the height and moisture values of all tiles. The tiles whose biome changed are repainted on the ground surface by the next draw call.
+        The terrain settings do not call this directly but request a reload through the reload scheduler. Any reload
+        still pending there is covered by this one and is discarded.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self.activate()
+        self.reload_scheduler.discard()
+        self.height_map = self.generate_height_map()
+        self.moisture_map = self.generate_moisture_map()
+        self._update_biome_maps()
+        heights = self.height_map.tolist()
+        moistures = self.moisture_map.tolist()
+        biomes = self.biome_map.tolist()
+
+        tile: Tile
+        for tile in self.tiles:
+            row, col = tile.row, tile.col
+            tile.set_terrain(heights[row][col], moistures[row][col], biomes[row][col])
+
+    def _update_biome_maps(self) -> None:
+        """
+        Classify the biome of every tile from the height and moisture maps and look up their plant growth potential and water.
 
         Parameters:
             None
@@ -164,12 +507,9 @@ class World(pygame.sprite.Sprite):
         Returns:
             None
         """
-        # TODO rethink if noise method should be transfered to tiles
-        tiles: list[Tile] = self.tiles.sprites()
-        for tile in tiles:
-            tile.height = self.generate_height_values(tile.rect.x, tile.rect.y)
-            tile.moisture = self.generate_moisture_values(tile.rect.x, tile.rect.y)
-            tile.draw(self.ground_surface)
+        self.biome_map = Tile.classify_grid(self.height_map, self.moisture_map)
+        self.growth_map = Tile.BIOME_GROWTHS[self.biome_map]
+        self.water_map = Tile.BIOME_HAS_WATER[self.biome_map]
 
     # endregion
 
@@ -178,8 +518,8 @@ class World(pygame.sprite.Sprite):
         """
         Spawn a specified amount of animals on unoccupied tiles in the world.
 
-        This method randomly selects 'amount' number of tiles from the world's tiles group and attempts to spawn an animal on each selected tile.
-        Animals will only be spawned on tiles that are not already occupied by another animal.
+        This method randomly selects 'amount' number of distinct land tiles without an animal and spawns an animal on each selected tile.
+        If there are fewer free tiles, every free tile gets an animal.
 
         Parameters:
             amount (float, optional): The number of animals to spawn. Defaults to 1.
@@ -187,16 +527,16 @@ class World(pygame.sprite.Sprite):
         Returns:
             None
         """
-        # TODO this should ignore tiles that are occupied and only try to spawn on unoccupied tiles
-        for tile in random.choices(self.tiles.sprites(), k=amount):
+        self.activate()
+        for tile in self._sample_tiles(self.free_land_mask(for_animals=True), amount):
             self.spawn_animal(tile)
 
     def spawn_plants(self, amount: float = 1) -> None:
         """
         Spawn a specified amount of plants on unoccupied tiles in the world.
 
-        This method randomly selects 'amount' number of tiles from the world's tiles group and attempts to spawn a plant on each selected tile.
-        Plants will only be spawned on tiles that are not already occupied by another plant or animal.
+        This method randomly selects 'amount' number of distinct land tiles without a plant and spawns a plant on each selected tile.
+        If there are fewer free tiles, every free tile gets a plant.
 
         Parameters:
             amount (float, optional): The number of plants to spawn. Defaults to 1.
@@ -204,8 +544,8 @@ class World(pygame.sprite.Sprite):
         Returns:
             None
         """
-        # TODO this should ignore tiles that are occupied and only try to spawn on unoccupied tiles
-        for tile in random.choices(self.tiles.sprites(), k=amount):
+        self.activate()
+        for tile in self._sample_tiles(self.free_land_mask(for_animals=False), amount):
             self.spawn_plant(tile)
 
     def spawn_animal(self, tile: Tile) -> None:
@@ -238,6 +578,24 @@ class World(pygame.sprite.Sprite):
             simulation.organisms.add(plant)
             simulation.plants.add(plant)
 
+    def free_land_mask(self, for_animals: bool) -> np.ndarray:
+        """
+        Get a mask of all land tiles that are free for a new animal or plant.
+
+        Parameters:
+            for_animals (bool): If True tiles holding an animal are excluded, otherwise tiles holding a plant.
+
+        Returns:
+            np.ndarray: A boolean mask indexed by (row, col).
+        """
+        grid = self.occupancy.animals if for_animals else self.occupancy.plants
+        return ~self.water_map & (grid == Occupancy.EMPTY)
+
+    def _sample_tiles(self, mask: np.ndarray, amount: float) -> list[Tile]:
+        cells = np.flatnonzero(mask).tolist()
+        chosen = simulation.rng.sample(cells, min(int(amount), len(cells)))
+        return [self.tile_grid[cell // self.cols][cell % self.cols] for cell in chosen]
+
     # endregion
 
     # region tiles
@@ -257,9 +615,10 @@ class World(pygame.sprite.Sprite):
 
         return Tile(
             pygame.Rect(x, y, self.tile_size, self.tile_size),
-            height=self.generate_height_values(x, y),
-            moisture=self.generate_moisture_values(x, y),
+            height=self.height_map.item(row, col),
+            moisture=self.moisture_map.item(row, col),
             is_border=self.is_border_tile(row=row, col=col),
+            occupancy=self.occupancy,
         )
 
     def add_neighbors(self, tiles) -> None:
@@ -347,6 +706,7 @@ class World(pygame.sprite.Sprite):
         Set up the noise functions for generating height and moisture values.
 
         This method initializes the settings for moisture, height, and scale using BoundedSetting objects.
+        All settings request their reload through the reload scheduler, so changing many values at once only reloads once.
         It creates lists to store NoiseFunction objects for height and moisture calculations, along with their corresponding weights.
         The NoiseFunction objects are configured with specific parameters for generating noise values based on factors, offsets, and weights.
 
@@ -358,13 +718,23 @@ class World(pygame.sprite.Sprite):
         """
         # TODO allow to manually add functions
         self.moisture_setting: BoundedSetting = BoundedSetting(
-            self.reload, value=1, name="Moisture", min=0, max=2, type="onchange"
+            self.reload_scheduler.request,
+            value=1,
+            name="Moisture",
+            min=0,
+            max=2,
+            type="onchange",
         )
         self.height_setting: BoundedSetting = BoundedSetting(
-            self.reload, value=1, name="Height", min=0, max=2, type="onchange"
+            self.reload_scheduler.request,
+            value=1,
+            name="Height",
+            min=0,
+            max=2,
+            type="onchange",
         )
         self.scale_setting: BoundedSetting = BoundedSetting(
-            self.reload,
+            self.reload_scheduler.request,
             value=0.001,
             name="Scale",
             min=0,
@@ -377,7 +747,7 @@ class World(pygame.sprite.Sprite):
         self.height_functions_weights: list[float] = []
         self.height_functions.append(
             NoiseFunction(
-                self.reload,
+                self.reload_scheduler.request,
                 factor_x=1,
                 factor_y=1,
                 offset_x=0,
@@ -387,13 +757,21 @@ class World(pygame.sprite.Sprite):
         self.height_functions_weights.append(1)
         self.height_functions.append(
             NoiseFunction(
-                self.reload, factor_x=2, factor_y=2, offset_x=4.7, offset_y=2.3
+                self.reload_scheduler.request,
+                factor_x=2,
+                factor_y=2,
+                offset_x=4.7,
+                offset_y=2.3,
             )
         )
         self.height_functions_weights.append(0.2)
         self.height_functions.append(
             NoiseFunction(
-                self.reload, factor_x=4, factor_y=4, offset_x=19.1, offset_y=16.2
+                self.reload_scheduler.request,
+                factor_x=4,
+                factor_y=4,
+                offset_x=19.1,
+                offset_y=16.2,
             )
         )
         self.height_functions_weights.append(0.1)
@@ -401,7 +779,13 @@ class World(pygame.sprite.Sprite):
         self.moisture_functions: list[NoiseFunction] = []
         self.moisture_functions_weights: list[float] = []
         self.moisture_functions.append(
-            NoiseFunction(self.reload, factor_x=1, factor_y=1, offset_x=0, offset_y=0)
+            NoiseFunction(
+                self.reload_scheduler.request,
+                factor_x=1,
+                factor_y=1,
+                offset_x=0,
+                offset_y=0,
+            )
         )
         self.moisture_functions_weights.append(1)
 
@@ -450,23 +834,73 @@ class World(pygame.sprite.Sprite):
         moisture = pygame.math.clamp(moisture, 0, 1)
         return moisture
 
-    def randomise_freqs(self) -> None:
+    def generate_height_map(self) -> np.ndarray:
+        """
+        Generate the height values of all tiles at once.
+
+        This is the grid version of generate_height_values. Every noise function is evaluated over the whole coordinate
+        grid with array operations.
+
+        Parameters:
+            None
+
+        Returns:
+            np.ndarray: The height value of every tile, indexed by (row, col) and clamped between 0 and 1.
+        """
+        x, y = self._tile_coordinates()
+        height = NoiseFunction.weigh_array(
+            x, y, self.height_functions, self.height_functions_weights
+        )
+        height += self.height_setting._value - self.height_setting._mid
+        return np.clip(height, 0, 1)
+
+    def generate_moisture_map(self) -> np.ndarray:
+        """
+        Generate the moisture values of all tiles at once.
+
+        This is the grid version of generate_moisture_values. Every noise function is evaluated over the whole coordinate
+        grid with array operations.
+
+        Parameters:
+            None
+
+        Returns:
+            np.ndarray: The moisture value of every tile, indexed by (row, col) and clamped between 0 and 1.
+        """
+        x, y = self._tile_coordinates()
+        moisture = NoiseFunction.weigh_array(
+            x, y, self.moisture_functions, self.moisture_functions_weights
+        )
+        moisture += self.moisture_setting._value - self.moisture_setting._mid
+        return np.clip(moisture, 0, 1)
+
+    def _tile_coordinates(self) -> tuple[np.ndarray, np.ndarray]:
+        scale = self.scale_setting._value
+        x = np.arange(self.cols) * self.tile_size * scale
+        y = np.arange(self.rows) * self.tile_size * scale
+        return x, y
+
+    def randomise_freqs(self, draw_progress: bool = True) -> None:
         """
         Randomize the frequency values for height and moisture noise functions.
 
         This method initiates the randomization process by setting the generating flag to True and resetting the progress to 0. It then combines the height and moisture noise functions into a single list for iteration.
         For each noise function, it calls the randomize method to generate new frequency values, updates the progress bar based on the number of functions, and refreshes the display to show the progress.
         After randomizing all functions, it triggers a reload to update the height and moisture values for all tiles, sets generating back to False, resets the progress to 0, and updates the progress bar accordingly.
+        A headless world skips the progress bar and display updates entirely.
+        When called on the SimulationWorker thread the display must not be touched, pass draw_progress=False there and
+        World.draw shows the progress bar on the drawing thread while generating is set.
 
         Parameters:
-            None
+            draw_progress (bool): Whether to draw the progress to the display directly. Default is True.
 
         Returns:
             None
         """
-        if self.progress_bar is None:
+        if self.progress_bar is None and not self.headless:
             raise ValueError("Progress Bar has not been initiated.")
 
+        self.activate()
         self.generating = True
         self.progress = 0
 
@@ -477,14 +911,19 @@ class World(pygame.sprite.Sprite):
         for function in functions:
             function.randomise()
             self.progress += 100 / len(functions)
-            self.progress_bar.set_value(self.progress)
-            self.menu.draw(pygame.display.get_surface())
-            pygame.display.flip()
+            if not self.headless:
+                self.progress_bar.set_value(self.progress)
+                if draw_progress:
+                    self.menu.draw(pygame.display.get_surface())
+                    pygame.display.flip()
 
         self.reload()
         self.generating = False
         self.progress = 0
-        self.progress_bar.set_value(self.progress)
+        if not self.headless:
+            # The loading screen has been drawn over the world
+            self.invalidate()
+            self.progress_bar.set_value(self.progress)
 
     # endregion
 
@@ -520,16 +959,20 @@ class World(pygame.sprite.Sprite):
         """
         Create a copy of the World instance.
 
-        Note:
-            This does not create an exact copy right now as the noise values have random values that are defined in the initialisation.
+        The copy is created with the same seed, so its terrain matches the one this world had when it was created. The
+        copy gets its own random streams, the streams of this world are current again afterwards and continue unchanged.
 
+        Note:
             This should only be used to create a copy world of the same dimension and tile size
 
         Returns:
-            World: A new World instance with the same dimensions and tile size as the original.
+            World: A new World instance with the same dimensions, tile size and seed as the original.
         """
-        # TODO not working properly yet as _setup_noise_settings initiates with random variables so not exact copy
-        return World(self.rect.copy(), self.tile_size)
+        world = World(
+            self.rect.copy(), self.tile_size, headless=self.headless, seed=self.seed
+        )
+        self.activate()
+        return world
 
     # region static methods
     @staticmethod
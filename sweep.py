@@ -0,0 +1,434 @@
+"""
+Parameter sweep runner.
+
+Runs one headless World per configuration of class settings on a process pool sized to the number of cores and collects
+a summary of every run (population over time, extinction ticks and mean genes) into one results table.
+
+Settings are addressed as <Class>.<attribute>, e.g. Animal._BASE_ENERGY_MAINTENANCE or DNA.attack_power_mutation_range.
+Values are parsed as JSON, lists become tuples so ranges can be swept as well.
+
+Usage:
+    python sweep.py --grid Animal._BASE_ENERGY_MAINTENANCE=5,10,20 --grid Plant._PHOTOSYNTHESIS_ENERGY_MULTIPLIER=2,4
+    python sweep.py --configs configs.json --replicates 3 --seed 1 --output sweep.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import time
+
+# Never open a window in any of the workers.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np  # noqa: E402
+
+import headless  # noqa: E402
+from src.entities.animal import Animal  # noqa: E402
+from src.entities.organism import Organism  # noqa: E402
+from src.entities.organism_store import OrganismStore  # noqa: E402
+from src.entities.plant import Plant  # noqa: E402
+from src.entities.properties.dna import DNA  # noqa: E402
+from src.entities.properties.gene import Gene  # noqa: E402
+from src.settings import screen, simulation  # noqa: E402
+
+# The classes whose attributes can be swept
+SETTING_CLASSES: dict[str, type] = {
+    "Animal": Animal,
+    "DNA": DNA,
+    "Gene": Gene,
+    "Organism": Organism,
+    "Plant": Plant,
+}
+
+
+# region configurations
+def parse_value(text: str):
+    """
+    Parse a setting value given on the command line.
+
+    Parameters:
+        text (str): The value as JSON, anything that is no valid JSON is used as string.
+
+    Returns:
+        The parsed value, lists are turned into tuples.
+    """
+    try:
+        value = json.loads(text)
+    except json.JSONDecodeError:
+        return text
+    return tuple(value) if isinstance(value, list) else value
+
+
+def parse_grid(entries: list[str]) -> dict[str, list]:
+    """
+    Parse --grid entries of the form <Class>.<attribute>=<value>,<value>,...
+
+    Values containing commas themselves (e.g. ranges) can be separated by ";" instead.
+
+    Parameters:
+        entries (list[str]): The entries.
+
+    Raises:
+        ValueError: If an entry has no "=".
+
+    Returns:
+        dict[str, list]: The values of every setting.
+    """
+    grid = {}
+    for entry in entries:
+        name, separator, values = entry.partition("=")
+        if not separator:
+            raise ValueError(
+                f"Grid entry {entry} needs to look like Class.attribute=1,2,3."
+            )
+        delimiter = ";" if ";" in values else ","
+        grid[name.strip()] = [parse_value(value) for value in values.split(delimiter)]
+    return grid
+
+
+def expand_grid(grid: dict[str, list]) -> list[dict]:
+    """
+    Return every combination of the values of a grid.
+
+    Parameters:
+        grid (dict[str, list]): The values of every setting.
+
+    Returns:
+        list[dict]: One configuration per combination, an empty grid gives one empty configuration.
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def apply_settings(config: dict) -> None:
+    """
+    Apply a configuration to the setting classes.
+
+    Parameters:
+        config (dict): The value of every setting, by <Class>.<attribute>.
+
+    Raises:
+        ValueError: If a class is not in SETTING_CLASSES or has no such attribute.
+
+    Returns:
+        None
+    """
+    for name, value in config.items():
+        cls, attribute = resolve_setting(name)
+        setattr(cls, attribute, tuple(value) if isinstance(value, list) else value)
+
+
+def resolve_setting(name: str) -> tuple[type, str]:
+    """
+    Return the class and attribute a setting name refers to.
+
+    Parameters:
+        name (str): The setting as <Class>.<attribute>.
+
+    Raises:
+        ValueError: If the class is not in SETTING_CLASSES or has no such attribute.
+
+    Returns:
+        tuple[type, str]: The class and the attribute name.
+    """
+    class_name, _, attribute = name.partition(".")
+    cls = SETTING_CLASSES.get(class_name)
+    if cls is None or not attribute or not hasattr(cls, attribute):
+        raise ValueError(f"{name} is not a known setting.")
+    return cls, attribute
+
+
+# endregion
+
+
+# region runs
+def run_configuration(job: dict) -> dict:
+    """
+    Run one headless world with a configuration. Called in the worker processes.
+
+    Parameters:
+        job (dict): The configuration ("config"), its index ("index"), the seed ("seed") and the run options
+            ("ticks", "animals", "plants", "width", "height", "tile_size", "sample_interval").
+
+    Returns:
+        dict: The configuration, seed and summary metrics of the run: the population sampled over time, its peak
+            and mean, the ticks at which the animals and all organisms died out and the mean genes of the survivors.
+    """
+    apply_settings(job["config"])
+    world = headless.create_world(
+        job["width"], job["height"], job["tile_size"], seed=job["seed"]
+    )
+    world.spawn_animals(job["animals"])
+    world.spawn_plants(job["plants"])
+
+    samples = [(world.age, len(simulation.animals), len(simulation.plants))]
+    animal_extinction_tick = None
+    extinction_tick = None
+    start = time.perf_counter()
+    for _ in range(job["ticks"]):
+        world.update()
+        num_animals, num_plants = len(simulation.animals), len(simulation.plants)
+        if world.age % job["sample_interval"] == 0:
+            samples.append((world.age, num_animals, num_plants))
+        if animal_extinction_tick is None and not num_animals:
+            animal_extinction_tick = world.age
+        if not num_animals and not num_plants:
+            extinction_tick = world.age
+            break
+    seconds = time.perf_counter() - start
+
+    animals = [sample[1] for sample in samples]
+    result = {
+        "index": job["index"],
+        "seed": world.seed,
+        "config": job["config"],
+        "ticks": world.age,
+        "seconds": seconds,
+        "final_animals": len(simulation.animals),
+        "final_plants": len(simulation.plants),
+        "peak_animals": max(animals),
+        "mean_animals": float(np.mean(animals)),
+        "animal_extinction_tick": animal_extinction_tick,
+        "extinction_tick": extinction_tick,
+        "population": samples,
+    }
+    result.update(mean_genes(Animal.KIND, "animal"))
+    result.update(mean_genes(Plant.KIND, "plant"))
+    return result
+
+
+def mean_genes(kind: int, prefix: str) -> dict[str, float | None]:
+    """
+    Return the mean value of every gene of the living organisms of a kind.
+
+    Parameters:
+        kind (int): The kind of the organisms.
+        prefix (str): The prefix of the returned keys.
+
+    Returns:
+        dict[str, float | None]: The mean of every gene by "<prefix>_mean_<gene>", None if no organism is alive.
+    """
+    store = simulation.organism_store
+    indices = store.alive_indices(kind)
+    means = store.genes[indices].mean(axis=0) if indices.size else None
+    return {
+        f"{prefix}_mean_{name}": None if means is None else means.item(column)
+        for column, name in enumerate(OrganismStore.GENE_NAMES)
+    }
+
+
+def sweep(
+    configs: list[dict],
+    replicates: int = 1,
+    seed: int | None = None,
+    processes: int | None = None,
+    ticks: int = 1000,
+    animals: int = 100,
+    plants: int = 400,
+    width: int = int(screen.SCREEN_WIDTH * 0.6),
+    height: int = screen.SCREEN_HEIGHT,
+    tile_size: int = screen.TILE_SIZE,
+    sample_interval: int = 10,
+    log=print,
+) -> list[dict]:
+    """
+    Run every configuration in its own headless world on a process pool.
+
+    Every run gets a fresh worker process, so the settings of one run never leak into another.
+
+    Parameters:
+        configs (list[dict]): The configurations to run, see apply_settings.
+        replicates (int): The number of runs per configuration, each with a different seed. Default is 1.
+        seed (int | None): The seed of the first run, the following runs use the next seeds. If None every run gets a
+            random seed. Default is None.
+        processes (int | None): The number of worker processes. If None one per core. Default is None.
+        ticks (int): The maximum number of ticks per run. Default is 1000.
+        animals (int): The number of animals spawned per run. Default is 100.
+        plants (int): The number of plants spawned per run. Default is 400.
+        width (int): The world width in pixels.
+        height (int): The world height in pixels.
+        tile_size (int): The tile size in pixels.
+        sample_interval (int): Record the population every sample_interval ticks. Default is 10.
+        log (Callable[[str], None] | None): Called with a line for every finished run. Default is print.
+
+    Raises:
+        ValueError: If a configuration contains an unknown setting.
+
+    Returns:
+        list[dict]: The results of all runs, ordered by configuration and replicate.
+    """
+    for config in configs:
+        # Fail before starting any worker
+        for name in config:
+            resolve_setting(name)
+
+    jobs = []
+    for config in configs:
+        for _ in range(replicates):
+            run_seed = seed + len(jobs) if seed is not None else None
+            jobs.append(
+                {
+                    "index": len(jobs),
+                    "config": config,
+                    "seed": run_seed,
+                    "ticks": ticks,
+                    "animals": animals,
+                    "plants": plants,
+                    "width": width,
+                    "height": height,
+                    "tile_size": tile_size,
+                    "sample_interval": sample_interval,
+                }
+            )
+
+    processes = min(processes or os.cpu_count() or 1, len(jobs)) or 1
+    results = []
+    with multiprocessing.Pool(processes, maxtasksperchild=1) as pool:
+        for result in pool.imap_unordered(run_configuration, jobs):
+            results.append(result)
+            if log:
+                log(
+                    f"[{len(results)}/{len(jobs)}] {result['config']} "
+                    f"seed {result['seed']}: {result['final_animals']} animals, "
+                    f"{result['final_plants']} plants after {result['ticks']} ticks"
+                )
+    return sorted(results, key=lambda result: result["index"])
+
+
+# endregion
+
+
+# region output
+def write_table(results: list[dict], path: str) -> None:
+    """
+    Write the results as csv table, one row per run and one column per setting and metric.
+
+    The population samples are written as JSON list of [tick, animals, plants].
+
+    Parameters:
+        results (list[dict]): The results as returned by sweep.
+        path (str): The path of the csv file.
+
+    Returns:
+        None
+    """
+    settings = list(
+        dict.fromkeys(name for result in results for name in result["config"])
+    )
+    metrics = [
+        key for key in (results[0] if results else {}) if key not in ("config", "population")
+    ]
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(settings + metrics + ["population"])
+        for result in results:
+            writer.writerow(
+                [json.dumps(result["config"].get(name)) for name in settings]
+                + [result[key] for key in metrics]
+                + [json.dumps(result["population"])]
+            )
+
+
+# endregion
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run headless worlds for many settings in parallel."
+    )
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        help="Class.attribute=value,value,... swept as cartesian product, "
+        "can be given multiple times.",
+    )
+    parser.add_argument(
+        "--configs",
+        help="JSON file with a list of configurations "
+        '({"Class.attribute": value}) to run as well.',
+    )
+    parser.add_argument(
+        "--replicates", type=int, default=1, help="Runs per configuration."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Seed of the first run."
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="Number of worker processes, one per core by default.",
+    )
+    parser.add_argument(
+        "--ticks", type=int, default=1000, help="Maximum number of ticks per run."
+    )
+    parser.add_argument(
+        "--animals", type=int, default=100, help="Number of animals to spawn."
+    )
+    parser.add_argument(
+        "--plants", type=int, default=400, help="Number of plants to spawn."
+    )
+    parser.add_argument(
+        "--width",
+        type=int,
+        default=int(screen.SCREEN_WIDTH * 0.6),
+        help="World width in pixels.",
+    )
+    parser.add_argument(
+        "--height", type=int, default=screen.SCREEN_HEIGHT, help="World height in pixels."
+    )
+    parser.add_argument(
+        "--tile-size", type=int, default=screen.TILE_SIZE, help="Tile size in pixels."
+    )
+    parser.add_argument(
+        "--sample-interval",
+        type=int,
+        default=10,
+        help="Record the population every N ticks.",
+    )
+    parser.add_argument(
+        "--output", default="sweep_results.csv", help="Where to write the results table."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> list[dict]:
+    args = _parse_args(argv)
+
+    configs = expand_grid(parse_grid(args.grid)) if args.grid else []
+    if args.configs:
+        with open(args.configs, encoding="utf-8") as file:
+            configs += json.load(file)
+    if not configs:
+        configs = [{}]
+
+    start = time.perf_counter()
+    results = sweep(
+        configs,
+        replicates=args.replicates,
+        seed=args.seed,
+        processes=args.processes,
+        ticks=args.ticks,
+        animals=args.animals,
+        plants=args.plants,
+        width=args.width,
+        height=args.height,
+        tile_size=args.tile_size,
+        sample_interval=args.sample_interval,
+    )
+    write_table(results, args.output)
+    print(
+        f"{len(results)} runs finished in {time.perf_counter() - start:.1f}s, "
+        f"results written to {args.output}."
+    )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import unittest
+
+from benchmarks.runner import Benchmark, compare
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_setup_runs_once_per_repeat(self):
+        calls = {"setup": 0, "operation": 0}
+
+        def operation():
+            calls["operation"] += 1
+
+        def setup():
+            calls["setup"] += 1
+            return operation
+
+        result = Benchmark("count", setup, number=4, repeat=3).measure()
+
+        self.assertEqual(calls, {"setup": 3, "operation": 12})
+        self.assertEqual(result["number"], 4)
+        self.assertEqual(result["repeat"], 3)
+        self.assertLessEqual(result["min"], result["median"])
+
+    def test_invalid_number_expect_value_error(self):
+        self.assertRaises(ValueError, Benchmark, "invalid", lambda: None, number=0)
+
+
+class TestCompare(unittest.TestCase):
+    def results(self, **medians) -> dict:
+        return {"results": {name: {"median": median} for name, median in medians.items()}}
+
+    def test_compare_status(self):
+        baseline = self.results(same=1.0, slow=1.0, fast=1.0)
+        results = self.results(same=1.1, slow=1.5, fast=0.5, added=1.0)
+
+        comparison = compare(results, baseline, tolerance=0.2)
+
+        self.assertEqual(comparison["same"]["status"], "unchanged")
+        self.assertEqual(comparison["slow"]["status"], "slower")
+        self.assertEqual(comparison["fast"]["status"], "faster")
+        self.assertEqual(comparison["added"]["status"], "new")
+        self.assertAlmostEqual(comparison["slow"]["ratio"], 1.5)
+
+    def test_negative_tolerance_expect_value_error(self):
+        self.assertRaises(ValueError, compare, self.results(), self.results(), -0.1)
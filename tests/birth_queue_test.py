@@ -0,0 +1,151 @@
+import os
+import unittest
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from src.entities.animal import Animal  # noqa: E402
+from src.entities.organism import Organism  # noqa: E402
+from src.entities.plant import Plant  # noqa: E402
+from src.settings import simulation  # noqa: E402
+from src.terrain.world import World  # noqa: E402
+
+
+class TestBirthQueue(unittest.TestCase):
+    def setUp(self) -> None:
+        simulation.reset_organisms()
+        self.world = World(pygame.Rect(0, 0, 160, 160), 8, headless=True, seed=3)
+        self.queue = Organism.births
+        self.target, self.first_tile, self.second_tile = self.find_tiles()
+
+    def tearDown(self) -> None:
+        self.queue.clear()
+        simulation.reset_organisms()
+
+    def find_tiles(self) -> tuple:
+        for row in self.world.tile_grid:
+            for tile in row:
+                land = [n for n in tile.neighbors.values() if not n.has_water]
+                if not tile.has_water and len(land) >= 3:
+                    return tile, land[0], land[1]
+        self.fail("No land tile found")
+
+    def add_plant(self, tile) -> Plant:
+        plant = Plant(tile)
+        simulation.organisms.add(plant)
+        simulation.plants.add(plant)
+        return plant
+
+    def test_commit_creates_offspring(self):
+        parent = self.add_plant(self.first_tile)
+        self.queue.request(parent, self.target, health=5, energy=10)
+
+        offspring = self.queue.commit()
+
+        self.assertEqual(len(offspring), 1)
+        child = offspring[0]
+        self.assertIs(child.tile, self.target)
+        self.assertEqual(child.parent_id, parent.id)
+        self.assertEqual((child.health, child.energy), (5, 10))
+        self.assertIn(child, simulation.plants)
+        self.assertIn(child, simulation.organisms)
+        self.assertEqual(parent.num_offspring, 1)
+        self.assertEqual(len(self.queue), 0)
+
+    def test_commit_writes_offspring_rows(self):
+        plant_parent = self.add_plant(self.first_tile)
+        animal_parent = Animal(self.second_tile)
+        simulation.organisms.add(animal_parent)
+        simulation.animals.add(animal_parent)
+        max_energy = Animal.constants.max_energy
+        self.queue.request(plant_parent, self.target, health=5, energy=10)
+        self.queue.request(animal_parent, self.target, health=5, energy=max_energy + 3)
+        next_id = Organism.next_organism_id
+        birthed = (
+            Organism.organisms_birthed,
+            Animal.animals_birthed,
+            Plant.plants_birthed,
+        )
+
+        plant, animal = self.queue.commit()
+
+        store = simulation.organism_store
+        self.assertIs(self.target.plant, plant)
+        self.assertIs(self.target.animal, animal)
+        self.assertIsInstance(animal, Animal)
+        self.assertEqual([plant.id, animal.id], [next_id, next_id + 1])
+        self.assertEqual(
+            [plant.parent_id, animal.parent_id], [plant_parent.id, animal_parent.id]
+        )
+        self.assertEqual(store.row[animal.store_index], self.target.row)
+        self.assertEqual(store.col[animal.store_index], self.target.col)
+        self.assertEqual((plant.health, plant.energy), (5, 10))
+        self.assertEqual((animal.health, animal.energy), (8, max_energy))
+        np.testing.assert_array_equal(
+            store.genes[animal.store_index], animal.dna.values
+        )
+        self.assertEqual(animal.tiles_visited, 1)
+        self.assertEqual(animal_parent.num_offspring, 1)
+        self.assertEqual(
+            (Organism.organisms_birthed, Animal.animals_birthed, Plant.plants_birthed),
+            (birthed[0] + 2, birthed[1] + 1, birthed[2] + 1),
+        )
+        self.assertIn(animal, simulation.animals)
+        self.assertNotIn(animal, simulation.plants)
+
+    def test_conflicting_intents(self):
+        first = self.add_plant(self.first_tile)
+        second = self.add_plant(self.second_tile)
+        self.queue.request(first, self.target, health=5, energy=10)
+        self.queue.request(second, self.target, health=5, energy=10)
+
+        offspring = self.queue.commit()
+
+        self.assertIs(offspring[0].tile, self.target)
+        tiles = [child.tile for child in offspring]
+        self.assertEqual(len(set(tiles)), len(tiles))
+
+    def test_dropped_intent_gives_energy_back(self):
+        parent = self.add_plant(self.first_tile)
+        self.add_plant(self.target)
+        parent.energy = 20
+        self.queue.request(parent, self.target, health=5, energy=10)
+        self.queue.origins[0] = SimpleNamespace(neighbors={})
+
+        self.assertEqual(parent.energy, 5)
+
+        offspring = self.queue.commit()
+
+        self.assertEqual(offspring, [])
+        self.assertEqual(parent.energy, 20)
+        self.assertEqual(len(simulation.plants), 2)
+
+    def test_dropped_intent_gives_health_back(self):
+        parent = self.add_plant(self.first_tile)
+        self.add_plant(self.target)
+        parent.energy = 10
+        health = parent.health
+        self.queue.request(parent, self.target, health=5, energy=10)
+        self.queue.origins[0] = SimpleNamespace(neighbors={})
+        self.assertEqual(parent.energy, parent.constants.min_energy)
+        self.assertLess(parent.health, health)
+
+        self.queue.commit()
+
+        self.assertEqual((parent.health, parent.energy), (health, 10))
+
+    def test_world_update_commits(self):
+        parent = self.add_plant(self.first_tile)
+        self.queue.request(parent, self.target, health=5, energy=10)
+
+        self.world.update()
+
+        self.assertEqual(len(self.queue), 0)
+        self.assertTrue(self.target.has_plant())
+
+
+if __name__ == "__main__":
+    unittest.main()
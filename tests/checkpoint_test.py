@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from src import checkpoint  # noqa: E402
+from src.entities.organism import Organism  # noqa: E402
+from src.settings import simulation  # noqa: E402
+from src.terrain.world import World  # noqa: E402
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self) -> None:
+        simulation.reset_organisms()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "world.ckpt")
+
+    def tearDown(self) -> None:
+        simulation.reset_organisms()
+        self.directory.cleanup()
+
+    def create_world(self) -> World:
+        world = World(pygame.Rect(0, 0, 160, 120), 8, headless=True, seed=99)
+        world.spawn_animals(15)
+        world.spawn_plants(40)
+        return world
+
+    def state(self, world: World) -> tuple:
+        store = simulation.organism_store
+        alive = store.alive_indices()
+        return (
+            world.age,
+            Organism.next_organism_id,
+            store.id[alive].tolist(),
+            store.row[alive].tolist(),
+            store.col[alive].tolist(),
+            store.energy[alive].tolist(),
+            store.health[alive].tolist(),
+            store.genes[alive].tolist(),
+        )
+
+    def test_restored_world_continues_identically(self):
+        world = self.create_world()
+        for _ in range(10):
+            world.update()
+        checkpoint.save(world, self.path)
+        for _ in range(10):
+            world.update()
+        expected = self.state(world)
+
+        restored = checkpoint.load(self.path, headless=True)
+        for _ in range(10):
+            restored.update()
+
+        self.assertEqual(self.state(restored), expected)
+
+    def test_restores_terrain_and_organisms(self):
+        world = self.create_world()
+        world.update()
+        saved = self.state(world)
+        height_map = world.height_map.copy()
+        checkpoint.save(world, self.path)
+
+        restored = checkpoint.load(self.path, headless=True)
+
+        self.assertEqual(self.state(restored), saved)
+        np.testing.assert_array_equal(restored.height_map, height_map)
+        self.assertIsInstance(restored.height_map, np.memmap)
+        self.assertEqual(len(simulation.organisms), len(saved[2]))
+
+    def test_restored_organisms_are_placed_with_stats(self):
+        world = self.create_world()
+        for _ in range(5):
+            world.update()
+        tiles_visited = sorted(
+            organism.tiles_visited for organism in simulation.organisms
+        )
+        checkpoint.save(world, self.path)
+
+        restored = checkpoint.load(self.path, headless=True)
+
+        for organism in simulation.animals:
+            self.assertIs(organism.tile.animal, organism)
+        for organism in simulation.plants:
+            self.assertIs(organism.tile.plant, organism)
+        self.assertEqual(
+            sorted(organism.tiles_visited for organism in simulation.organisms),
+            tiles_visited,
+        )
+        self.assertEqual(len(simulation.organisms), len(simulation.organism_store))
+        restored.update()
+
+    def test_save_over_loaded_checkpoint(self):
+        world = self.create_world()
+        world.update()
+        checkpoint.save(world, self.path)
+        restored = checkpoint.load(self.path, headless=True)
+        restored.update()
+        expected = self.state(restored)
+        height_map = np.array(restored.height_map)
+
+        checkpoint.save(restored, self.path)
+        reloaded = checkpoint.load(self.path, headless=True)
+
+        self.assertEqual(self.state(reloaded), expected)
+        np.testing.assert_array_equal(reloaded.height_map, height_map)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a checkpoint")
+
+        with self.assertRaises(ValueError):
+            checkpoint.load(self.path, headless=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.helper.database_sinks import (
+    ColumnarSink,
+    SqliteSink,
+    ancestors,
+    column_key,
+    connect_sqlite,
+    descendants,
+    load_columnar,
+    load_manifest,
+)
+
+
+class TestColumnarSink(unittest.TestCase):
+    HEADERS = ["Type", "ID", "Parent Id", "Health"]
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "database")
+        self.sink = ColumnarSink(self.path)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_segments_are_loaded_as_columns(self):
+        self.sink.write(self.HEADERS, [["Animal", 0, None, 1.5], ["Plant", 1, 0, None]])
+        self.sink.write(self.HEADERS, [["Plant", 2, 1, 3.0]])
+
+        data = load_columnar(self.path)
+
+        self.assertEqual(data["Type"].tolist(), ["Animal", "Plant", "Plant"])
+        self.assertEqual(data["ID"].dtype, np.int64)
+        self.assertEqual(data["Parent Id"].tolist(), [-1, 0, 1])
+        self.assertEqual(data["Health"][0], 1.5)
+        self.assertTrue(math.isnan(data["Health"][1]))
+
+        manifest = load_manifest(self.path)
+        self.assertEqual(manifest["rows"], 3)
+        self.assertEqual(manifest["segments"], [2, 1])
+
+    def test_integer_column_with_fractions_becomes_float(self):
+        self.sink.write(self.HEADERS, [["Animal", 0, None, 1]])
+        self.sink.write(self.HEADERS, [["Animal", 1, 0, 2.5]])
+
+        data = load_columnar(self.path, ["Health"])
+
+        self.assertEqual(data["Health"].tolist(), [1.0, 2.5])
+
+    def test_load_selected_columns_by_name_or_key(self):
+        self.sink.write(self.HEADERS, [["Animal", 0, None, 1.5]])
+
+        data = load_columnar(self.path, ["ID", "parent_id"], decode=False)
+
+        self.assertEqual(list(data), ["ID", "Parent Id"])
+
+    def test_unknown_column_expect_value_error(self):
+        self.sink.write(self.HEADERS, [["Animal", 0, None, 1.5]])
+
+        self.assertRaises(ValueError, load_columnar, self.path, ["Wings"])
+
+    def test_changed_columns_expect_value_error(self):
+        self.sink.write(self.HEADERS, [["Animal", 0, None, 1.5]])
+
+        self.assertRaises(ValueError, self.sink.write, ["Type"], [["Animal"]])
+
+    def test_column_key(self):
+        self.assertEqual(column_key("Birth time (milsec)"), "birth_time_milsec")
+
+
+class TestSqliteSink(unittest.TestCase):
+    HEADERS = ["Type", "ID", "Parent Id", "Health"]
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "database.db")
+        self.sink = SqliteSink(self.path)
+
+    def tearDown(self) -> None:
+        self.sink.close()
+        self.directory.cleanup()
+
+    def test_batches_are_inserted_with_indexes(self):
+        self.sink.write(self.HEADERS, [["Animal", 0, None, 1.5], ["Plant", 1, 0, 2.0]])
+        self.sink.write(self.HEADERS, [["Plant", 2, 1, 3.0]])
+
+        connection = connect_sqlite(self.path)
+        rows = connection.execute(
+            "SELECT type, id, parent_id, health FROM organisms ORDER BY id"
+        ).fetchall()
+        indexes = {
+            row[0]
+            for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        connection.close()
+
+        self.assertEqual(
+            rows, [("Animal", 0, None, 1.5), ("Plant", 1, 0, 2.0), ("Plant", 2, 1, 3.0)]
+        )
+        self.assertEqual(
+            indexes, {"organisms_id", "organisms_parent_id", "organisms_type"}
+        )
+
+    def test_lineage_queries(self):
+        self.sink.write(
+            self.HEADERS,
+            [
+                ["Animal", 0, None, 1.0],
+                ["Animal", 1, 0, 1.0],
+                ["Animal", 2, 0, 1.0],
+                ["Animal", 3, 1, 1.0],
+            ],
+        )
+
+        connection = connect_sqlite(self.path)
+        self.assertEqual(ancestors(connection, 3), [1, 0])
+        self.assertEqual(descendants(connection, 0), [1, 2, 3])
+        connection.close()
@@ -0,0 +1,57 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from src.helper.database_sinks import CsvSink
+from src.helper.database_writer import DatabaseWriter
+
+
+class TestDatabaseWriter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "database.csv")
+        self.sink = CsvSink(self.filename)
+        self.writer = DatabaseWriter(batch_size=3, flush_interval=60)
+
+    def tearDown(self) -> None:
+        self.writer.close()
+        self.directory.cleanup()
+
+    def read(self) -> list[list[str]]:
+        with open(self.filename, newline="") as file:
+            return list(csv.reader(file))
+
+    def test_flush_writes_header_once_and_all_rows(self):
+        for i in range(5):
+            self.writer.submit(self.sink, ["id", "age"], [i, i * 10])
+
+        self.assertTrue(self.writer.flush(timeout=5))
+
+        self.assertEqual(
+            self.read(),
+            [["id", "age"]] + [[str(i), str(i * 10)] for i in range(5)],
+        )
+        self.assertEqual(self.writer.records_written, 5)
+
+    def test_close_writes_pending_rows(self):
+        self.writer.submit(self.sink, ["id"], [1])
+
+        self.writer.close(timeout=5)
+
+        self.assertEqual(self.read(), [["id"], ["1"]])
+
+    def test_existing_file_gets_no_second_header(self):
+        with open(self.filename, "w", newline="") as file:
+            csv.writer(file).writerow(["id"])
+
+        self.writer.submit(self.sink, ["id"], [1])
+        self.writer.flush(timeout=5)
+
+        self.assertEqual(self.read(), [["id"], ["1"]])
+
+    def test_flush_without_records(self):
+        self.assertTrue(self.writer.flush(timeout=0))
+
+    def test_invalid_batch_size_expect_value_error(self):
+        self.assertRaises(ValueError, DatabaseWriter, batch_size=0)
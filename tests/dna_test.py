@@ -1,9 +1,13 @@
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch
 
+import numpy as np
 import pygame
 
+from src.entities.organism_store import OrganismStore
 from src.entities.properties.dna import DNA
+from src.settings import simulation
 
 
 class TestDNA(unittest.TestCase):
@@ -123,8 +127,33 @@ class TestColor(TestDNA):
             "Blue component of color property is incorrect",
         )
 
+    def test_color_follows_gene_changes(self):
+        """
+        Changing a color gene updates the color, which is otherwise reused
+        """
+        color = self.dna_instance.color
+        self.assertIs(self.dna_instance.color, color)
+
+        self.dna_instance.color_g_gene.value = 100
+
+        self.assertEqual(self.dna_instance.color, pygame.Color(255, 100, 1))
+
 
 class TestMutate(TestDNA):
+    def patch_mutation_draws(self, draws: list[float]):
+        """
+        Replace the draws deciding which genes mutate, the mutations themselves are still drawn by simulation.np_rng
+        """
+        np_rng = simulation.np_rng
+        return patch.object(
+            simulation,
+            "np_rng",
+            SimpleNamespace(
+                random=lambda size: np.resize(np.array(draws, dtype=float), size),
+                standard_normal=np_rng.standard_normal,
+            ),
+        )
+
     def test_mutate_dna_no_mutation(self):
         """
         Mutate DNA where no genes are mutated
@@ -132,8 +161,8 @@ class TestMutate(TestDNA):
         self.dna_instance.mutation_chance_gene.value = 0.8
         dna_copy = self.dna_instance.copy()
 
-        # Mock the random.random() function to always return a value greater than mutation chance
-        with patch("random.random", return_value=0.9):
+        # Draw a value greater than the mutation chance for every gene
+        with self.patch_mutation_draws([0.9]):
             dna_copy.mutate()
 
         # Check that most genes have mutated
@@ -155,8 +184,8 @@ class TestMutate(TestDNA):
         self.dna_instance.mutation_chance_gene.value = 0.8
         dna_copy = self.dna_instance.copy()
 
-        # Mock the random.random() function to always return a value greater than mutation chance
-        with patch("random.random", return_value=0.6):
+        # Draw a value smaller than the mutation chance for every gene
+        with self.patch_mutation_draws([0.6]):
             dna_copy.mutate()
 
         # Check that most genes have mutated
@@ -202,6 +231,75 @@ class TestMutate(TestDNA):
                 f"Gene value {gene.value} changed after mutation with zero mutation range.",
             )
 
+    def test_mutate_dna_clips_to_bounds(self):
+        """
+        Mutate DNA with large mutation ranges and verify that gene values stay within their bounds
+        """
+        self.addCleanup(
+            DNA.set_attack_power_mutation_range, DNA.attack_power_mutation_range
+        )
+        DNA.set_attack_power_mutation_range(1000)
+        DNA.set_color_mutation_range(1000)
+        DNA.set_prefered_moisture_mutation_range(10)
+        self.init_DNA()
+        self.dna_instance.mutation_chance_gene.value = 1
+
+        for _ in range(20):
+            self.dna_instance.mutate()
+
+        values = self.dna_instance.values
+        self.assertTrue((values >= self.dna_instance.min_values).all())
+        self.assertTrue((values <= self.dna_instance.max_values).all())
+
+    def test_mutate_dna_changes_only_drawn_genes(self):
+        """
+        Mutate DNA where only the genes with a draw below the mutation chance mutate
+        """
+        self.dna_instance.mutation_chance_gene.value = 0.5
+        initial_values = self.dna_instance.values.copy()
+        draws = [0.9] * 12
+        draws[3] = 0.1
+
+        with self.patch_mutation_draws(draws):
+            self.dna_instance.mutate()
+
+        changed = np.flatnonzero(self.dna_instance.values != initial_values)
+        self.assertEqual(changed.tolist(), [3])
+
+    def test_mutate_draws_from_np_rng(self):
+        """
+        Mutate DNA with a seeded simulation.np_rng and verify the mutation is reproducible and leaves simulation.rng alone
+        """
+        self.dna_instance.mutation_chance_gene.value = 0.5
+        first = self.dna_instance.copy()
+        second = self.dna_instance.copy()
+        rng_state = simulation.rng.getstate()
+
+        simulation.np_rng.bit_generator.state = np.random.PCG64(5).state
+        first.mutate()
+        simulation.np_rng.bit_generator.state = np.random.PCG64(5).state
+        second.mutate()
+
+        np.testing.assert_array_equal(first.values, second.values)
+        self.assertEqual(simulation.rng.getstate(), rng_state)
+
+    def test_mutate_many(self):
+        """
+        Mutate many gene rows at once, only rows with a mutation chance mutate and all values stay within their bounds
+        """
+        DNA.set_color_mutation_range(1000)
+        values = np.array([self.dna_instance.values] * 50)
+        values[:25, OrganismStore.MUTATION_CHANCE] = 0
+        values[25:, OrganismStore.MUTATION_CHANCE] = 1
+        initial_values = values.copy()
+
+        DNA.mutate_many(values)
+
+        np.testing.assert_array_equal(values[:25], initial_values[:25])
+        self.assertFalse((values[25:] == initial_values[25:]).all())
+        self.assertTrue((values >= self.dna_instance.min_values).all())
+        self.assertTrue((values <= self.dna_instance.max_values).all())
+
 
 class TestSetters(TestDNA):
     def test_mutation_range_update(self):
@@ -258,6 +356,23 @@ class TestSetters(TestDNA):
             copy_dna.energy_to_offspring_ratio_gene._mutation_range, 0.06
         )
 
+    def test_schema_is_rebuilt_only_after_a_setting_changes(self):
+        """
+        Verify that the schema is shared until a gene setting is set, by a setter or by assigning the class attribute
+        """
+        schema = DNA.schema()
+        self.assertIs(DNA.schema(), schema)
+        self.assertIs(self.dna_instance.copy().min_values, schema[0])
+
+        DNA.set_color_mutation_range(15)
+        changed = DNA.schema()
+        self.assertIsNot(changed, schema)
+        self.assertEqual(changed[2][OrganismStore.COLOR_R], 15)
+
+        self.addCleanup(setattr, DNA, "attack_power_max", DNA.attack_power_max)
+        DNA.attack_power_max = 40
+        self.assertEqual(DNA.schema()[1][OrganismStore.ATTACK_POWER], 40)
+
 
 class TestCopy(TestDNA):
     def test_copy_dna_instance_and_verify_gene_values(self):
@@ -281,3 +396,67 @@ class TestCopy(TestDNA):
                 copied_dna.genes[i],
                 "Copied genes are identical references.",
             )
+
+    def test_copy_has_own_values(self):
+        """
+        Changing a copy does not change the original
+        """
+        copied_dna = self.dna_instance.copy()
+        copied_dna.attack_power_gene.value = 1
+
+        self.assertEqual(self.dna_instance.attack_power_gene.value, self.attack_power)
+
+
+class TestFromValues(TestDNA):
+    def test_from_values(self):
+        """
+        Create DNA from gene values and mutation ranges
+        """
+        mutation_ranges = self.dna_instance.mutation_ranges * 2
+        dna = DNA.from_values(self.dna_instance.values, mutation_ranges)
+
+        np.testing.assert_array_equal(dna.values, self.dna_instance.values)
+        self.assertEqual(
+            dna.attack_power_gene._mutation_range,
+            self.dna_instance.attack_power_gene._mutation_range * 2,
+        )
+        self.assertIs(dna.min_values, self.dna_instance.min_values)
+
+    def test_from_values_clips_and_validates(self):
+        """
+        Gene values outside of the bounds are clipped and invalid arrays raise a ValueError
+        """
+        values = self.dna_instance.values.copy()
+        values[3] = 1000
+
+        self.assertEqual(
+            DNA.from_values(values).attack_power_gene.value, DNA.attack_power_max
+        )
+        with self.assertRaises(ValueError):
+            DNA.from_values(values[:5])
+        with self.assertRaises(ValueError):
+            DNA.from_values(values, -self.dna_instance.mutation_ranges - 1)
+
+    def test_from_values_many(self):
+        """
+        Create many DNA at once, only rows with different mutation ranges get their own
+        """
+        values = np.array([self.dna_instance.values, self.dna_instance.values])
+        values[1, 3] = 1000
+        mutation_ranges = np.array(
+            [self.dna_instance.mutation_ranges, self.dna_instance.mutation_ranges * 2]
+        )
+
+        first, second = DNA.from_values_many(values, mutation_ranges)
+
+        np.testing.assert_array_equal(first.values, self.dna_instance.values)
+        self.assertEqual(second.attack_power_gene.value, DNA.attack_power_max)
+        self.assertIs(first.mutation_ranges, self.dna_instance.mutation_ranges)
+        np.testing.assert_array_equal(
+            second.mutation_ranges, self.dna_instance.mutation_ranges * 2
+        )
+        self.assertEqual(DNA.from_values_many(np.empty((0, values.shape[1]))), [])
+        with self.assertRaises(ValueError):
+            DNA.from_values_many(values[:, :5])
+        with self.assertRaises(ValueError):
+            DNA.from_values_many(values, -mutation_ranges)
@@ -1,7 +1,7 @@
 import threading
 import unittest
 
-from src.entities.properties.gene import Gene
+from src.entities.properties.gene import Gene, GeneSpec, PercentageGene
 
 
 class TestGene(unittest.TestCase):
@@ -208,3 +208,29 @@ class TestCopy(TestGene):
         self.assertEqual(copied_gene._min_value, gene._min_value)
         self.assertEqual(copied_gene.value, gene.value)
         self.assertEqual(copied_gene._mutation_range, gene._mutation_range)
+
+
+class TestGeneSpec(TestGene):
+    def test_genes_share_spec(self):
+        """
+        Genes with the same bounds and mutation range share one immutable spec and only store their value
+        """
+        first = Gene(max_value=10, min_value=0, value=5, mutation_range=1)
+        second = Gene(max_value=10, min_value=0, value=7, mutation_range=1)
+
+        self.assertIs(first.spec, second.spec)
+        self.assertIs(first.copy().spec, first.spec)
+        self.assertFalse(hasattr(first, "__dict__"))
+        with self.assertRaises(AttributeError):
+            first.spec.max_value = 20
+
+    def test_from_spec(self):
+        """
+        Create a gene from a spec, the value is clamped to the bounds of the spec
+        """
+        spec = GeneSpec.get(max_value=1, min_value=0, mutation_range=0.1)
+        gene = PercentageGene.from_spec(spec, 2)
+
+        self.assertIsInstance(gene, PercentageGene)
+        self.assertEqual(gene.value, 1)
+        self.assertEqual(gene._mutation_range, 0.1)
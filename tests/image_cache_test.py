@@ -0,0 +1,49 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from src.helper.image_cache import ImageCache  # noqa: E402
+
+
+class TestImageCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = ImageCache(capacity=2, quantization=4)
+
+    def test_similar_colors_share_image(self):
+        image = self.cache.get((100, 50, 200), 100, (8, 8))
+
+        self.assertIs(self.cache.get(pygame.Color(101, 51, 203), 100, (8, 8)), image)
+        self.assertEqual(image.get_at((0, 0))[:3], (100, 48, 200))
+        self.assertEqual(image.get_alpha(), 100)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_key_contains_alpha_and_size(self):
+        image = self.cache.get((100, 50, 200), 100, (8, 8))
+
+        self.assertIsNot(self.cache.get((100, 50, 200), None, (8, 8)), image)
+        self.assertIsNot(self.cache.get((100, 50, 200), 100, (4, 4)), image)
+        self.assertIsNone(self.cache.get((100, 50, 200), None, (8, 8)).get_alpha())
+
+    def test_least_recently_used_is_evicted(self):
+        first = self.cache.get((0, 0, 0), None, (1, 1))
+        second = self.cache.get((8, 8, 8), None, (1, 1))
+        self.cache.get((0, 0, 0), None, (1, 1))
+
+        self.cache.get((16, 16, 16), None, (1, 1))
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIs(self.cache.get((0, 0, 0), None, (1, 1)), first)
+        self.assertIsNot(self.cache.get((8, 8, 8), None, (1, 1)), second)
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            ImageCache(capacity=0)
+        with self.assertRaises(ValueError):
+            ImageCache(quantization=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
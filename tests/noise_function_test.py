@@ -1,5 +1,9 @@
 import unittest
 
+import numpy as np
+import opensimplex
+
+from src.helper import simplex_noise
 from src.helper.noise_function import NoiseFunction
 
 
@@ -159,3 +163,65 @@ class TestWeigh(unittest.TestCase):
             NoiseFunction.weigh(x, y, [])
         except ValueError:
             pass
+
+
+class TestWeighArray(unittest.TestCase):
+    def test_weigh_array_matches_weigh(self):
+        """
+        Tests if NoiseFunction.weigh_array returns the same values as NoiseFunction.weigh for every grid point
+        """
+        function1 = NoiseFunction(
+            factor_x=2,
+            factor_y=3,
+            offset_x=1,
+            offset_y=2,
+            pow_x=1,
+            pow_y=2,
+            pow=1.5,
+            fudge=1.2,
+        )
+        function2 = NoiseFunction(
+            factor_x=1.5,
+            factor_y=2.5,
+            offset_x=-1,
+            offset_y=-2,
+            pow_x=2,
+            pow_y=1,
+            pow=1.2,
+            fudge=1.5,
+        )
+        xs = np.linspace(0, 3, 7)
+        ys = np.linspace(0, 2, 5)
+
+        result = NoiseFunction.weigh_array(xs, ys, [function1, function2], [1, 2])
+
+        self.assertEqual(result.shape, (ys.size, xs.size))
+        for row, y in enumerate(ys):
+            for col, x in enumerate(xs):
+                self.assertAlmostEqual(
+                    result[row, col],
+                    NoiseFunction.weigh(x, y, [function1, function2], [1, 2]),
+                )
+
+    def test_weigh_array_without_functions(self):
+        """
+        Tests if NoiseFunction.weigh_array raises an error correctly if list of functions given is empty
+        """
+        self.assertRaises(
+            ValueError, NoiseFunction.weigh_array, np.zeros(2), np.zeros(2), []
+        )
+
+
+class TestSimplexNoise(unittest.TestCase):
+    def test_noise2array_matches_opensimplex(self):
+        """
+        Tests if the NumPy noise matches opensimplex.noise2 at every grid point
+        """
+        xs = np.linspace(-20, 20, 23)
+        ys = np.linspace(-15, 25, 19)
+
+        result = simplex_noise.noise2array(xs, ys)
+
+        for row, y in enumerate(ys):
+            for col, x in enumerate(xs):
+                self.assertAlmostEqual(result[row, col], opensimplex.noise2(x, y))
@@ -0,0 +1,40 @@
+import unittest
+
+import numpy as np
+
+from src.terrain.occupancy import Occupancy
+
+
+class TestOccupancy(unittest.TestCase):
+    def setUp(self) -> None:
+        self.occupancy = Occupancy(2, 3)
+
+    def tearDown(self) -> None:
+        pass
+
+    def test_init_empty(self):
+        self.assertEqual(self.occupancy.animals.shape, (2, 3))
+        self.assertTrue((self.occupancy.animals == Occupancy.EMPTY).all())
+        self.assertTrue((self.occupancy.plants == Occupancy.EMPTY).all())
+
+    def test_init_without_cells_expect_value_error(self):
+        self.assertRaises(ValueError, Occupancy, 0, 3)
+
+    def test_remap(self):
+        self.occupancy.animals[0, 1] = 3
+        self.occupancy.plants[1, 2] = 1
+
+        self.occupancy.remap(np.array([-1, 0, -1, 1]))
+
+        self.assertEqual(self.occupancy.animals[0, 1], 1)
+        self.assertEqual(self.occupancy.plants[1, 2], 0)
+        self.assertEqual((self.occupancy.animals != Occupancy.EMPTY).sum(), 1)
+
+    def test_clear(self):
+        self.occupancy.animals[1, 1] = 5
+        self.occupancy.plants[0, 0] = 2
+
+        self.occupancy.clear()
+
+        self.assertTrue((self.occupancy.animals == Occupancy.EMPTY).all())
+        self.assertTrue((self.occupancy.plants == Occupancy.EMPTY).all())
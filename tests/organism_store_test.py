@@ -0,0 +1,162 @@
+import unittest
+
+import numpy as np
+
+from src.entities.organism_store import OrganismStore
+
+
+class View:
+    def __init__(self) -> None:
+        self.store_index = None
+
+
+class TestOrganismStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.store = OrganismStore(capacity=2)
+
+    def tearDown(self) -> None:
+        pass
+
+    def add(self, kind=OrganismStore.ANIMAL, organism_id=0, parent_id=-1) -> View:
+        view = View()
+        view.store_index = self.store.add(view, kind, organism_id, parent_id)
+        return view
+
+
+class TestAdd(TestOrganismStore):
+    def test_add_initialises_row(self):
+        view = self.add(OrganismStore.PLANT, organism_id=7, parent_id=3)
+        index = view.store_index
+
+        self.assertEqual(self.store.id[index], 7)
+        self.assertEqual(self.store.parent_id[index], 3)
+        self.assertEqual(self.store.kind[index], OrganismStore.PLANT)
+        self.assertTrue(self.store.alive[index])
+        self.assertIs(self.store.views[index], view)
+        self.assertEqual(len(self.store), 1)
+
+    def test_add_grows_capacity(self):
+        views = [self.add(organism_id=i) for i in range(5)]
+
+        self.assertGreaterEqual(self.store.capacity, 5)
+        self.assertEqual(len(self.store), 5)
+        for i, view in enumerate(views):
+            self.assertEqual(self.store.id[view.store_index], i)
+
+    def test_reserve_grows_once(self):
+        self.add(organism_id=7)
+        self.store.reserve(9)
+        genes = self.store.genes
+
+        for i in range(9):
+            self.add(organism_id=i)
+
+        self.assertIs(self.store.genes, genes)
+        self.assertEqual(self.store.id[0], 7)
+
+
+    def test_extend_appends_rows(self):
+        self.add(organism_id=7)
+        views = [View() for _ in range(3)]
+        genes = np.arange(3 * len(OrganismStore.GENE_NAMES), dtype=np.float64)
+
+        self.store.extend(
+            views,
+            {"id": np.array([1, 2, 3]), "kind": np.array([1, 0, 1])},
+            genes.reshape(3, -1),
+        )
+
+        self.assertEqual(self.store.size, 4)
+        self.assertEqual(len(self.store), 4)
+        self.assertEqual(self.store.id[:4].tolist(), [7, 1, 2, 3])
+        self.assertEqual(self.store.alive_indices(OrganismStore.PLANT).tolist(), [1, 3])
+        self.assertEqual(self.store.views[1:], views)
+        self.assertEqual(self.store.genes[3, 0], 2 * len(OrganismStore.GENE_NAMES))
+        with self.assertRaises(ValueError):
+            self.store.extend(views, {"id": np.array([1])}, genes.reshape(3, -1))
+
+
+class TestRelease(TestOrganismStore):
+    def test_release_returns_detached_snapshot(self):
+        view = self.add(organism_id=4)
+        self.store.health[view.store_index] = 12.5
+        self.store.genes[view.store_index, OrganismStore.ATTACK_POWER] = 9
+
+        snapshot = self.store.release(view.store_index)
+
+        self.assertFalse(self.store.alive[view.store_index])
+        self.assertIsNone(self.store.views[view.store_index])
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(snapshot.id[0], 4)
+        self.assertEqual(snapshot.health[0], 12.5)
+        self.assertEqual(snapshot.genes[0, OrganismStore.ATTACK_POWER], 9)
+
+    def test_release_twice_expect_value_error(self):
+        view = self.add()
+        self.store.release(view.store_index)
+
+        self.assertRaises(ValueError, self.store.release, view.store_index)
+
+
+class TestAliveIndices(TestOrganismStore):
+    def test_alive_indices_filtered_by_kind(self):
+        animal = self.add(OrganismStore.ANIMAL)
+        plant = self.add(OrganismStore.PLANT)
+        dead_plant = self.add(OrganismStore.PLANT)
+        self.store.release(dead_plant.store_index)
+
+        self.assertEqual(
+            self.store.alive_indices().tolist(),
+            [animal.store_index, plant.store_index],
+        )
+        self.assertEqual(
+            self.store.alive_indices(OrganismStore.PLANT).tolist(),
+            [plant.store_index],
+        )
+
+
+class TestCompact(TestOrganismStore):
+    def test_compact_moves_living_rows_and_updates_views(self):
+        views = [self.add(organism_id=i) for i in range(4)]
+        for i, view in enumerate(views):
+            self.store.energy[view.store_index] = i * 10
+        self.store.release(views[0].store_index)
+        self.store.release(views[2].store_index)
+
+        remap = self.store.compact()
+
+        self.assertEqual(remap.tolist(), [-1, 0, -1, 1])
+        self.assertEqual(self.store.size, 2)
+        self.assertEqual(views[1].store_index, 0)
+        self.assertEqual(views[3].store_index, 1)
+        self.assertEqual(self.store.id[views[3].store_index], 3)
+        self.assertEqual(self.store.energy[views[3].store_index], 30)
+        self.assertEqual(self.store.alive_indices().tolist(), [0, 1])
+
+
+class TestAddEnergy(TestOrganismStore):
+    def test_add_energy_overflows_into_health(self):
+        views = [self.add(organism_id=i) for i in range(3)]
+        indices = np.array([view.store_index for view in views])
+        self.store.energy[indices] = [5, 8, 2]
+        self.store.health[indices] = [10, 10, 10]
+
+        self.store.add_energy(indices, np.array([2, 5, -4]), 0, 10, 12)
+
+        # in range, overflow of 3 capped at max health, deficit of 2 taken from health
+        self.assertEqual(self.store.energy[indices].tolist(), [7, 10, 0])
+        self.assertEqual(self.store.health[indices].tolist(), [10, 12, 8])
+
+
+class TestGeneIndex(TestOrganismStore):
+    def test_gene_index_matches_constants(self):
+        self.assertEqual(
+            OrganismStore.gene_index("attack_power"), OrganismStore.ATTACK_POWER
+        )
+        self.assertEqual(
+            OrganismStore.gene_index("energy_to_offspring_ratio"),
+            OrganismStore.ENERGY_TO_OFFSPRING_RATIO,
+        )
+
+    def test_unknown_gene_expect_value_error(self):
+        self.assertRaises(ValueError, OrganismStore.gene_index, "wings")
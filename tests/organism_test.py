@@ -1,7 +1,17 @@
+import os
 import unittest
 from unittest.mock import patch
 
-from src.entities.organism import Organism
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from src.entities.animal import Animal  # noqa: E402
+from src.entities.organism import Organism  # noqa: E402
+from src.entities.plant import Plant  # noqa: E402
+from src.entities.species_constants import SpeciesConstants  # noqa: E402
+from src.settings import simulation  # noqa: E402
+from src.terrain.world import World  # noqa: E402
 
 
 class TestOrganism(unittest.TestCase):
@@ -35,7 +45,33 @@ class TestTileInteraction(TestOrganism):
 
 
 class TestEnergyHealthInteraction(TestOrganism):
-    pass
+    def setUp(self) -> None:
+        simulation.reset_organisms()
+        self.world = World(pygame.Rect(0, 0, 80, 80), 8, headless=True, seed=3)
+        self.world.spawn_animals(1)
+        self.animal = simulation.animals.sprites()[0]
+
+    def tearDown(self) -> None:
+        simulation.reset_organisms()
+
+    def test_energy_overflow_goes_to_capped_health(self):
+        self.animal.health = Animal._MAX_HEALTH - 5
+        self.animal.energy = Animal._MAX_ENERGY + 3
+
+        self.assertEqual(self.animal.energy, Animal._MAX_ENERGY)
+        self.assertEqual(self.animal.health, Animal._MAX_HEALTH - 2)
+
+        self.animal.energy = Animal._MAX_ENERGY + 10
+
+        self.assertEqual(self.animal.health, Animal._MAX_HEALTH)
+        self.assertEqual(self.animal.health_ratio(), 1)
+
+    def test_energy_deficit_is_taken_from_health(self):
+        self.animal.health = 20
+        self.animal.energy = -5
+
+        self.assertEqual(self.animal.energy, Animal._MIN_ENERGY)
+        self.assertEqual(self.animal.health, 15)
 
 
 class TestCombat(TestOrganism):
@@ -52,3 +88,92 @@ class TestCopy(TestOrganism):
 
 class TestDatabaseInteraction(TestOrganism):
     pass
+
+
+class TestLayout(TestOrganism):
+    def setUp(self) -> None:
+        simulation.reset_organisms()
+        self.world = World(pygame.Rect(0, 0, 80, 80), 8, headless=True, seed=3)
+        self.world.spawn_animals(1)
+        self.world.spawn_plants(1)
+
+    def tearDown(self) -> None:
+        simulation.reset_organisms()
+
+    def test_organisms_are_slotted_and_share_images(self):
+        for organism in simulation.organisms:
+            self.assertFalse(hasattr(organism, "__dict__"))
+            self.assertIs(organism.rect, organism.tile.rect)
+            self.assertIsNone(organism.stat_panel)
+            self.assertIs(organism.image, organism.image)
+            self.assertEqual(organism.image.get_size(), organism.rect.size)
+
+    def test_kill_removes_from_groups(self):
+        animal = simulation.animals.sprites()[0]
+        self.assertIsInstance(animal, Animal)
+        self.assertEqual(len(animal.groups()), 2)
+
+        animal.kill()
+
+        self.assertNotIn(animal, simulation.organisms)
+        self.assertNotIn(animal, simulation.animals)
+        self.assertEqual(animal.groups(), [])
+        self.assertEqual(len(simulation.organisms), 1)
+        self.assertIsInstance(simulation.organisms.sprites()[0], Plant)
+
+    def test_explicit_rect_follows_tile(self):
+        tile = next(
+            tile for row in self.world.tile_grid for tile in row if not tile.has_plant()
+        )
+        rect = pygame.Rect(0, 0, 8, 8)
+
+        plant = Plant(tile, rect=rect)
+
+        self.assertIs(plant.rect, rect)
+        self.assertEqual(rect.topleft, tile.rect.topleft)
+
+
+class TestSpeciesConstants(TestOrganism):
+    def setUp(self) -> None:
+        simulation.reset_organisms()
+        self.max_health = Animal._MAX_HEALTH
+        self.maintenance = Animal._BASE_ENERGY_MAINTENANCE
+
+    def tearDown(self) -> None:
+        Animal.set_max_health(self.max_health)
+        Animal._BASE_ENERGY_MAINTENANCE = self.maintenance
+        simulation.reset_organisms()
+
+    def test_constants_are_compiled_per_species(self):
+        self.assertFalse(hasattr(Organism, "constants"))
+        self.assertEqual(Animal.constants.max_health, Animal._MAX_HEALTH)
+        self.assertEqual(Plant.constants.max_alpha, Plant._MAX_ALPHA)
+        self.assertEqual(Plant.constants.min_energy, Organism._MIN_ENERGY)
+        with self.assertRaises(AttributeError):
+            Animal.constants.max_health = 1
+
+    def test_setters_and_assignments_refresh_constants(self):
+        plant_constants = Plant.constants
+
+        Animal.set_max_health(80)
+        Animal._BASE_ENERGY_MAINTENANCE = 3
+
+        self.assertEqual(Animal.constants.max_health, 80)
+        self.assertEqual(Animal.constants.energy_maintenance, 3)
+        self.assertIs(Plant.constants, plant_constants)
+        self.assertIsInstance(Animal.constants, SpeciesConstants)
+
+    def test_lowering_the_maximum_clamps_living_organisms(self):
+        world = World(pygame.Rect(0, 0, 80, 80), 8, headless=True, seed=3)
+        world.spawn_animals(2)
+        world.spawn_plants(2)
+        animal = simulation.animals.sprites()[0]
+        plant = simulation.plants.sprites()[0]
+        animal.health = self.max_health
+        plant_health = plant.health
+
+        Animal.set_max_health(self.max_health / 2)
+
+        self.assertEqual(animal.health, self.max_health / 2)
+        self.assertEqual(animal.health_ratio(), 1)
+        self.assertEqual(plant.health, plant_health)
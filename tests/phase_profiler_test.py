@@ -0,0 +1,94 @@
+import os
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from src.helper.phase_profiler import PhaseProfiler  # noqa: E402
+from src.settings import simulation  # noqa: E402
+from src.terrain.world import World  # noqa: E402
+
+
+class FakeOrganism:
+    KIND = 0
+
+    def __init__(self) -> None:
+        self.phases: list[str] = []
+
+    def __getattr__(self, name):
+        if name in PhaseProfiler.PHASES:
+            return lambda: self.phases.append(name)
+        raise AttributeError(name)
+
+
+class TestPhaseProfiler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.profiler = PhaseProfiler(enabled=True, interval=2)
+
+    def tearDown(self) -> None:
+        simulation.profiler.set_enabled(False)
+        simulation.profiler.interval = PhaseProfiler.DEFAULT_INTERVAL
+        simulation.reset_organisms()
+
+    def test_profile_runs_phases_in_order(self):
+        organism = FakeOrganism()
+        self.profiler.profile(organism)
+
+        self.assertEqual(organism.phases, list(PhaseProfiler.PHASES))
+        self.assertEqual(self.profiler.calls, [1, 0])
+        self.assertTrue(all(seconds >= 0 for seconds in self.profiler.seconds[0]))
+
+    def test_window_closes_after_interval(self):
+        self.profiler.profile(FakeOrganism())
+        self.profiler.tick(1)
+        self.assertIsNone(self.profiler.last_window)
+
+        self.profiler.tick(2)
+
+        report = self.profiler.last_window
+        self.assertEqual(report["ticks"], 2)
+        self.assertEqual(report["age"], 2)
+        self.assertEqual(report["Animal"]["updates"], 0.5)
+        self.assertEqual(report["Plant"]["updates"], 0)
+        self.assertEqual(self.profiler.ticks, 0)
+
+    def test_format_report_skips_kinds_without_updates(self):
+        self.profiler.profile(FakeOrganism())
+        line = PhaseProfiler.format_report(self.profiler.report())
+
+        self.assertIn("Animal", line)
+        self.assertNotIn("Plant", line)
+
+    def test_log(self):
+        self.profiler.log = True
+        with patch("builtins.print") as mock_print:
+            self.profiler.tick(1)
+            self.profiler.tick(2)
+
+        mock_print.assert_called_once()
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            PhaseProfiler(interval=0)
+
+    def test_world_updates_are_profiled(self):
+        simulation.reset_organisms()
+        world = World(pygame.Rect(0, 0, 80, 80), 8, headless=True, seed=5)
+        world.spawn_animals(3)
+        world.spawn_plants(10)
+        simulation.profiler.interval = 3
+        simulation.profiler.set_enabled(True)
+
+        for _ in range(3):
+            world.update()
+
+        report = simulation.profiler.last_window
+        self.assertEqual(report["age"], 3)
+        self.assertGreater(report["Plant"]["updates"], 0)
+        self.assertGreater(report["Plant"]["total"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from src.helper.reload_scheduler import ReloadScheduler
+from src.helper.setting import BoundedSetting
+
+
+class TestReloadScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.reloads = 0
+        self.scheduler = ReloadScheduler(self.reload)
+
+    def tearDown(self) -> None:
+        pass
+
+    def reload(self) -> None:
+        self.reloads += 1
+
+    def test_requests_are_coalesced(self):
+        for _ in range(10):
+            self.scheduler.request()
+
+        self.assertEqual(self.reloads, 0)
+        self.assertTrue(self.scheduler.flush())
+        self.assertEqual(self.reloads, 1)
+        self.assertFalse(self.scheduler.pending())
+
+    def test_flush_without_request(self):
+        self.assertFalse(self.scheduler.flush())
+        self.assertEqual(self.reloads, 0)
+
+    def test_discard(self):
+        self.scheduler.request()
+        self.scheduler.discard()
+
+        self.assertFalse(self.scheduler.flush())
+        self.assertEqual(self.reloads, 0)
+
+    def test_request_during_reload_stays_pending(self):
+        def reload():
+            self.reloads += 1
+            self.scheduler.request()
+
+        self.scheduler.reload = reload
+        self.scheduler.request()
+        self.scheduler.flush()
+
+        self.assertTrue(self.scheduler.pending())
+
+    def test_setting_changes_request_reload(self):
+        setting = BoundedSetting(
+            self.scheduler.request, value=1, min=0, max=2, type="onchange"
+        )
+        for value in (0.2, 0.4, 0.6):
+            setting.set_value(value)
+
+        self.scheduler.flush()
+        self.assertEqual(self.reloads, 1)
+
+    def test_init_with_uncallable_expect_value_error(self):
+        self.assertRaises(ValueError, ReloadScheduler, 5)
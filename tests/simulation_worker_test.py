@@ -0,0 +1,153 @@
+import os
+import time
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from src.helper.tick_scheduler import TickScheduler  # noqa: E402
+from src.settings import simulation  # noqa: E402
+from src.simulation_worker import SimulationWorker  # noqa: E402
+from src.terrain.occupancy import Occupancy  # noqa: E402
+from src.terrain.snapshot import SnapshotBuffer, WorldSnapshot  # noqa: E402
+from src.terrain.world import World  # noqa: E402
+
+
+class TestWorldSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        simulation.reset_organisms()
+        self.world = World(pygame.Rect(0, 0, 80, 80), 8, headless=True, seed=3)
+
+    def tearDown(self) -> None:
+        simulation.reset_organisms()
+
+    def test_capture(self):
+        self.world.spawn_animals(5)
+        self.world.spawn_plants(10)
+        animal = simulation.animals.sprites()[0]
+
+        snapshot = WorldSnapshot.capture(self.world)
+
+        row, col = animal.tile.row, animal.tile.col
+        self.assertEqual(snapshot.animal_ids[row, col], animal.id)
+        self.assertEqual(
+            tuple(snapshot.animal_colors[row, col]),
+            tuple(animal.dna.color)[:3],
+        )
+        self.assertEqual(snapshot.animals, len(simulation.animals))
+        self.assertEqual(snapshot.plants, len(simulation.plants))
+        self.assertEqual(
+            np.count_nonzero(snapshot.plant_ids != Occupancy.EMPTY), snapshot.plants
+        )
+
+    def test_snapshot_is_immutable(self):
+        self.world.spawn_plants(10)
+        snapshot = WorldSnapshot.capture(self.world)
+        plants = snapshot.plant_ids.copy()
+
+        with self.assertRaises(ValueError):
+            snapshot.plant_ids[0, 0] = 1
+        simulation.reset_organisms()
+        np.testing.assert_array_equal(snapshot.plant_ids, plants)
+
+    def test_capture_copies_selected_stats(self):
+        self.world.spawn_plants(1)
+        plant = simulation.plants.sprites()[0]
+
+        snapshot = WorldSnapshot.capture(self.world, plant)
+        plant.health = 0
+
+        self.assertIsNone(WorldSnapshot.capture(self.world).selected)
+        self.assertEqual(snapshot.selected.organism_id, plant.id)
+        self.assertEqual(snapshot.selected.headers, plant.get_headers())
+        self.assertNotEqual(snapshot.selected.values, plant.get_stats())
+        self.assertEqual(snapshot.selected.rect, plant.rect)
+
+    def test_buffer_returns_latest(self):
+        buffer = SnapshotBuffer()
+        self.assertIsNone(buffer.latest())
+
+        first = WorldSnapshot.capture(self.world)
+        second = WorldSnapshot.capture(self.world)
+        buffer.publish(first)
+        buffer.publish(second)
+
+        self.assertIs(buffer.latest(), second)
+        self.assertEqual(buffer.published, 2)
+
+
+class TestSimulationWorker(unittest.TestCase):
+    def setUp(self) -> None:
+        simulation.reset_organisms()
+        self.world = World(pygame.Rect(0, 0, 80, 80), 8, headless=True, seed=3)
+        self.worker = SimulationWorker(self.world)
+
+    def tearDown(self) -> None:
+        self.worker.stop(timeout=5)
+        simulation.reset_organisms()
+
+    def test_commands_run_on_worker(self):
+        self.worker.start()
+        self.worker.submit(self.world.spawn_plants, 10)
+
+        self.assertTrue(self.worker.flush(timeout=5))
+        self.assertEqual(len(simulation.plants), 10)
+        self.assertEqual(self.worker.buffer.latest().plants, 10)
+        self.assertEqual(self.world.age, 0)
+
+    def test_running_updates_world(self):
+        self.worker.start()
+        self.worker.submit(self.world.spawn_plants, 10)
+        self.worker.set_running(True)
+        while self.worker.buffer.latest().age < 3:
+            pass
+        self.worker.set_running(False)
+        self.worker.flush(timeout=5)
+
+        age = self.world.age
+        self.assertGreaterEqual(age, 3)
+        self.worker.flush(timeout=5)
+        self.assertEqual(self.world.age, age)
+
+    def test_batches_are_paced_to_frame_rate(self):
+        scheduler = TickScheduler(ticks_per_frame=2, frame_rate=10)
+        self.worker = SimulationWorker(self.world, scheduler)
+        self.worker.start()
+        self.worker.set_running(True)
+        time.sleep(0.35)
+        self.worker.set_running(False)
+        self.worker.flush(timeout=5)
+
+        # At most one batch of two ticks per 0.1 seconds, the first one right away
+        self.assertGreaterEqual(self.world.age, 2)
+        self.assertLessEqual(self.world.age, 8)
+
+    def test_selected_stats_are_published(self):
+        self.world.spawn_animals(1)
+        animal = simulation.animals.sprites()[0]
+        self.worker.start()
+        self.worker.submit(self.worker.select, animal)
+        self.worker.flush(timeout=5)
+
+        self.assertEqual(self.worker.buffer.latest().selected.organism_id, animal.id)
+
+        self.worker.submit(self.worker.select, None)
+        self.worker.flush(timeout=5)
+        self.assertIsNone(self.worker.buffer.latest().selected)
+
+    def test_submit_without_thread_runs_immediately(self):
+        self.worker.submit(self.world.spawn_plants, 3)
+
+        self.assertEqual(len(simulation.plants), 3)
+
+    def test_stop(self):
+        self.worker.start()
+        self.worker.stop(timeout=5)
+
+        self.assertFalse(self.worker.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
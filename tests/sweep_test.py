@@ -0,0 +1,38 @@
+import unittest
+
+import sweep
+from src.entities.animal import Animal
+
+
+class TestGrid(unittest.TestCase):
+    def test_parse_and_expand_grid(self):
+        grid = sweep.parse_grid(
+            [
+                "Animal._BASE_ENERGY_MAINTENANCE=5,10",
+                "DNA.attack_power_mutation_range=[1,2];[3,4]",
+            ]
+        )
+
+        self.assertEqual(grid["Animal._BASE_ENERGY_MAINTENANCE"], [5, 10])
+        self.assertEqual(grid["DNA.attack_power_mutation_range"], [(1, 2), (3, 4)])
+        self.assertEqual(len(sweep.expand_grid(grid)), 4)
+
+    def test_entry_without_values_expect_value_error(self):
+        self.assertRaises(ValueError, sweep.parse_grid, ["Animal._MAX_HEALTH"])
+
+
+class TestSettings(unittest.TestCase):
+    def setUp(self) -> None:
+        self.maintenance = Animal._BASE_ENERGY_MAINTENANCE
+
+    def tearDown(self) -> None:
+        Animal._BASE_ENERGY_MAINTENANCE = self.maintenance
+
+    def test_apply_settings(self):
+        sweep.apply_settings({"Animal._BASE_ENERGY_MAINTENANCE": 3})
+
+        self.assertEqual(Animal._BASE_ENERGY_MAINTENANCE, 3)
+
+    def test_unknown_setting_expect_value_error(self):
+        self.assertRaises(ValueError, sweep.apply_settings, {"Animal._WINGS": 2})
+        self.assertRaises(ValueError, sweep.resolve_setting, "World.age")
@@ -0,0 +1,77 @@
+import unittest
+
+from src.helper.tick_scheduler import TickScheduler
+
+
+class TestTickScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ticks = 0
+        self.now = 0.0
+
+    def tearDown(self) -> None:
+        pass
+
+    def tick(self) -> None:
+        self.ticks += 1
+        self.now += 0.004
+
+    def clock(self) -> float:
+        return self.now
+
+    def test_one_tick_per_frame_by_default(self):
+        scheduler = TickScheduler()
+
+        self.assertEqual(scheduler.run(self.tick), 1)
+        self.assertEqual(self.ticks, 1)
+
+    def test_fixed_ticks_per_frame(self):
+        scheduler = TickScheduler(ticks_per_frame=5)
+
+        self.assertEqual(scheduler.run(self.tick), 5)
+        self.assertEqual(scheduler.ticks_last_frame, 5)
+
+    def test_fast_forward_fills_time_budget(self):
+        scheduler = TickScheduler(
+            fast_forward=True, time_budget=0.014, clock=self.clock
+        )
+
+        self.assertEqual(scheduler.run(self.tick), 4)
+
+    def test_fast_forward_runs_at_least_one_tick(self):
+        def slow_tick():
+            self.ticks += 1
+            self.now += 1
+
+        scheduler = TickScheduler(
+            fast_forward=True, time_budget=0.014, clock=self.clock
+        )
+
+        self.assertEqual(scheduler.run(slow_tick), 1)
+
+    def test_slider_values_are_rounded(self):
+        scheduler = TickScheduler()
+        scheduler.set_ticks_per_frame(3.6)
+
+        self.assertEqual(scheduler.ticks_per_frame, 4)
+
+    def test_frame_interval(self):
+        scheduler = TickScheduler(frame_rate=50)
+        self.assertEqual(scheduler.frame_interval(), 0.02)
+
+        scheduler.set_fast_forward(True)
+        self.assertEqual(scheduler.frame_interval(), 0)
+        self.assertEqual(TickScheduler().frame_interval(), 0)
+
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            TickScheduler(ticks_per_frame=0)
+        with self.assertRaises(ValueError):
+            TickScheduler(ticks_per_frame=TickScheduler.MAX_TICKS_PER_FRAME + 1)
+        with self.assertRaises(ValueError):
+            TickScheduler(time_budget=0)
+        with self.assertRaises(ValueError):
+            TickScheduler(frame_rate=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+import pygame
+
+from src.terrain.tile import Tile
+
+
+class TestClassify(unittest.TestCase):
+    def test_classify_thresholds(self):
+        self.assertEqual(Tile.classify(0.1, 0.9), Tile.WATER)
+        self.assertEqual(Tile.classify(0.11, 0.5), Tile.BEACH)
+        self.assertEqual(Tile.classify(0.3, 0.15), Tile.SUBTROPICAL_DESERT)
+        self.assertEqual(Tile.classify(0.3, 0.16), Tile.GRASSLAND)
+        self.assertEqual(Tile.classify(0.6, 0.83), Tile.TEMPERATE_RAIN_FOREST)
+        self.assertEqual(Tile.classify(0.8, 0.33), Tile.SHRUBLAND)
+        self.assertEqual(Tile.classify(1, 0), Tile.SCORCHED)
+        self.assertEqual(Tile.classify(1, 1), Tile.SNOW)
+
+    def test_classify_grid_matches_classify(self):
+        values = np.linspace(0, 1, 101)
+        heights, moistures = np.meshgrid(values, values)
+
+        biomes = Tile.classify_grid(heights, moistures)
+
+        for height, moisture, biome in zip(
+            heights.ravel(), moistures.ravel(), biomes.ravel()
+        ):
+            self.assertEqual(Tile.classify(height, moisture), biome)
+
+
+class TestSetTerrain(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tile = Tile(pygame.Rect(0, 0, 4, 4), height=0.5, moisture=0.4)
+
+    def tearDown(self) -> None:
+        pass
+
+    def test_set_terrain_updates_dependent_attributes(self):
+        recolored = self.tile.set_terrain(0.05, 0.4)
+
+        self.assertTrue(recolored)
+        self.assertTrue(self.tile.has_water)
+        self.assertEqual(self.tile.color, Tile.WATER_COLOR)
+        self.assertEqual(self.tile.plant_growth_potential, Tile.WATER_PLANT_GROWTH)
+
+    def test_set_terrain_in_same_biome_does_not_recolor(self):
+        self.assertFalse(self.tile.set_terrain(0.55, 0.45))
+
+    def test_set_terrain_out_of_range_expect_value_error(self):
+        self.assertRaises(ValueError, self.tile.set_terrain, 1.1, 0.5)
+        self.assertRaises(ValueError, self.tile.set_terrain, 0.5, -0.1)
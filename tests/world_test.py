@@ -0,0 +1,132 @@
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from src.settings import simulation  # noqa: E402
+from src.terrain.world import World  # noqa: E402
+
+
+class TestWorldSeed(unittest.TestCase):
+    def setUp(self) -> None:
+        simulation.reset_organisms()
+
+    def tearDown(self) -> None:
+        simulation.reset_organisms()
+
+    def run_world(
+        self, seed: int, ticks: int = 20, other_seed: int | None = None
+    ) -> tuple:
+        simulation.reset_organisms()
+        world = World(pygame.Rect(0, 0, 160, 120), 8, headless=True, seed=seed)
+        world.spawn_animals(15)
+        world.spawn_plants(40)
+        for tick in range(ticks):
+            if other_seed is not None and tick == ticks // 2:
+                # Another world is created half way and draws from its own streams
+                World(pygame.Rect(0, 0, 40, 40), 8, headless=True, seed=other_seed)
+                simulation.rng.random()
+                simulation.np_rng.random(10)
+            world.update()
+
+        store = simulation.organism_store
+        alive = store.alive_indices()
+        return (
+            world.height_map.copy(),
+            store.row[alive].tolist(),
+            store.col[alive].tolist(),
+            store.energy[alive].tolist(),
+            store.genes[alive].tolist(),
+        )
+
+    def test_same_seed_same_run(self):
+        first = self.run_world(seed=1234)
+        second = self.run_world(seed=1234)
+
+        np.testing.assert_array_equal(first[0], second[0])
+        self.assertEqual(first[1:], second[1:])
+
+    def test_other_world_keeps_run(self):
+        first = self.run_world(seed=1234)
+        second = self.run_world(seed=1234, other_seed=5)
+
+        np.testing.assert_array_equal(first[0], second[0])
+        self.assertEqual(first[1:], second[1:])
+
+    def test_different_seed_different_terrain(self):
+        first = self.run_world(seed=1, ticks=0)
+        second = self.run_world(seed=2, ticks=0)
+
+        self.assertFalse(np.array_equal(first[0], second[0]))
+
+    def test_copy_keeps_random_streams(self):
+        world = World(pygame.Rect(0, 0, 40, 40), 8, headless=True, seed=7)
+        simulation.rng.random()
+        simulation.np_rng.random()
+        rng_state = simulation.rng.getstate()
+        np_rng_state = simulation.np_rng.bit_generator.state
+
+        copy = world.copy()
+
+        self.assertEqual(copy.seed, 7)
+        np.testing.assert_array_equal(copy.height_map, world.height_map)
+        self.assertIs(simulation.rng, world.rng)
+        self.assertIs(simulation.np_rng, world.np_rng)
+        self.assertIsNot(copy.rng, world.rng)
+        self.assertEqual(simulation.rng.getstate(), rng_state)
+        self.assertEqual(simulation.np_rng.bit_generator.state, np_rng_state)
+
+    def test_world_stores_drawn_seed(self):
+        world = World(pygame.Rect(0, 0, 40, 40), 8, headless=True)
+
+        self.assertEqual(world.seed, simulation.seed_value)
+
+
+class TestGridRendering(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The loading menu of a drawable world needs a display, with the dummy driver none is shown
+        pygame.init()
+        pygame.display.set_mode((160, 120))
+
+    def setUp(self) -> None:
+        simulation.reset_organisms()
+        self.world = World(pygame.Rect(0, 0, 160, 120), 8, seed=3)
+        self.world.spawn_animals(15)
+        self.world.spawn_plants(60)
+
+    def tearDown(self) -> None:
+        simulation.reset_organisms()
+
+    def draw(self, grid: bool) -> np.ndarray:
+        self.world.set_grid_rendering(grid)
+        screen = pygame.Surface(self.world.rect.size)
+        self.world.draw(screen)
+        return pygame.surfarray.array3d(screen).astype(int)
+
+    def test_grid_matches_cells(self):
+        cells = self.draw(grid=False)
+        grid = self.draw(grid=True)
+
+        self.assertLessEqual(np.abs(cells - grid).max(), 2)
+
+    def test_grid_follows_updates(self):
+        self.draw(grid=True)
+        self.world.update()
+        grid = self.draw(grid=True)
+        cells = self.draw(grid=False)
+
+        self.assertLessEqual(np.abs(cells - grid).max(), 2)
+
+    def test_randomise_without_drawing_progress(self):
+        heights = self.world.height_map.copy()
+        with mock.patch.object(pygame.display, "flip") as flip:
+            self.world.randomise_freqs(draw_progress=False)
+
+        flip.assert_not_called()
+        self.assertFalse(self.world.generating)
+        self.assertFalse(np.array_equal(heights, self.world.height_map))